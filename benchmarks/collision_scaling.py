@@ -0,0 +1,104 @@
+"""
+Бенчмарк: стоимость коллизий игрока с платформами в зависимости от их числа.
+
+Строит поле из N тайлов-платформ (пол и редкие парящие платформы по всей
+карте), ставит игрока на пол и гоняет handle_keys + update как в игровом
+цикле. Сравнивает SpatialGroup уровня (запрос по ячейкам 128px) с обычным
+списком (полный перебор).
+
+Запуск:
+    python benchmarks/collision_scaling.py
+"""
+
+import os
+import sys
+import time
+from collections import defaultdict
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.collision_map import SOLID
+from game.player import Player
+from game.spatial_hash import SpatialGroup
+
+TILE = 128
+PLATFORM_COUNTS = (600, 6000, 60000)
+FRAMES = 300
+# Полный перебор на 60 000 платформ слишком медленный — ограничиваем его
+LINEAR_MAX_PLATFORMS = 6000
+
+
+class BenchPlatform(pygame.sprite.Sprite):
+    """Платформа только для коллизий (без картинки), чтобы 60 000 штук влезли в память."""
+
+    def __init__(self, x, y):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, TILE, TILE)
+        self.collision_rect = self.rect
+        self.platform_type = "grass1"
+        self.collision_kind = SOLID
+        self.has_collision = True
+
+    def check_collision(self, other_rect):
+        return self.collision_rect.colliderect(other_rect)
+
+
+def build_platforms(count, container):
+    """Пол шириной count/2 тайлов плюс столько же парящих платформ над ним."""
+    floor_tiles = count // 2
+    for i in range(floor_tiles):
+        container.add(BenchPlatform(i * TILE, 10 * TILE))
+    for i in range(count - floor_tiles):
+        container.add(BenchPlatform(i * TILE, (4 + i % 3) * TILE))
+    return container
+
+
+class ListContainer(list):
+    def add(self, item):
+        self.append(item)
+
+
+def run_frames(player, platforms, frames):
+    keys = defaultdict(int)
+    keys[pygame.K_RIGHT] = 1
+    start = time.perf_counter()
+    for _ in range(frames):
+        player.handle_keys(keys, platforms)
+        player.update(platforms, [], 0)
+    return (time.perf_counter() - start) / frames
+
+
+def bench(count, use_index):
+    platforms = build_platforms(
+        count, SpatialGroup(cell_size=TILE) if use_index else ListContainer()
+    )
+    player = Player(TILE, 10 * TILE - 100)
+    # Короткий прогрев: игрок встаёт на пол
+    run_frames(player, platforms, 10)
+    return run_frames(player, platforms, FRAMES)
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    print(f"{'platforms':>10} | {'spatial hash, ms/frame':>22} | {'linear scan, ms/frame':>22}")
+    print("-" * 62)
+    for count in PLATFORM_COUNTS:
+        indexed = bench(count, use_index=True) * 1000
+        if count <= LINEAR_MAX_PLATFORMS:
+            linear = f"{bench(count, use_index=False) * 1000:22.3f}"
+        else:
+            linear = f"{'(skipped)':>22}"
+        print(f"{count:>10} | {indexed:22.3f} | {linear}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
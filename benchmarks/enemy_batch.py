@@ -0,0 +1,95 @@
+"""
+Бенчмарк: тик уровня с тысячами патрулирующих врагов.
+
+Генерирует синтетический уровень с COUNTS врагов (поровну слаймов,
+улиток и мух) и замеряет среднее время Level.tick при пакетной
+симуляции (EnemyBatch, нужен numpy) и при обновлении врагов по одному.
+Отдельно показано время одного векторного шага EnemyBatch.step.
+
+Запуск:
+    python benchmarks/enemy_batch.py
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.enemies.batch import NUMPY_AVAILABLE
+from game.levels.level1 import Level
+from game.levels.synthetic import write_synthetic_level
+from game.player import Player
+
+COUNTS = (500, 5000)
+WARMUP_TICKS = 10
+TICKS = 60
+DT = 1 / 60
+
+
+def make_level(path, batch):
+    # Враги и уровень много печатают при создании — прячем это из отчёта
+    with contextlib.redirect_stdout(io.StringIO()):
+        level = Level("patrol", tmx_path=path, cache_dir=None, streaming=False,
+                      batch_enemies=batch)
+        level.set_player(Player(0, 0))
+    return level
+
+
+def time_ticks(level):
+    keys = defaultdict(bool)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(WARMUP_TICKS):
+            level.tick(keys, DT)
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            level.tick(keys, DT)
+    return (time.perf_counter() - start) / TICKS * 1000
+
+
+def time_steps(level):
+    batch = level.enemies.batch
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        batch.step(DT, level)
+    return (time.perf_counter() - start) / TICKS * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        print(f"{'врагов':>8} {'по одному, мс':>15} {'пакетом, мс':>13} {'шаг пакета, мс':>16}")
+        for count in COUNTS:
+            path = write_synthetic_level(
+                os.path.join(tmp_dir, f"patrol_{count}.tmx"),
+                width=max(200, count // 5), height=40, seed=1,
+                slimes=count // 3, snails=count // 3, flies=count - 2 * (count // 3),
+                saws=0, coins=0,
+            )
+            single = time_ticks(make_level(path, batch=False))
+            if NUMPY_AVAILABLE:
+                level = make_level(path, batch=True)
+                batched = f"{time_ticks(level):13.3f}"
+                step = f"{time_steps(level):16.3f}"
+            else:
+                batched = f"{'нет numpy':>13}"
+                step = f"{'-':>16}"
+            print(f"{count:>8} {single:15.3f} {batched} {step}")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
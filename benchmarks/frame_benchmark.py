@@ -0,0 +1,385 @@
+"""
+Бенчмарк кадра по сценариям с бюджетами против регрессий.
+
+Каждый сценарий — заранее записанный ввод (ScriptedInput) на level1 или на
+синтетическом уровне. Один кадр = один тик симуляции (Level.tick) + полная
+отрисовка в поверхность экрана. Время кадра делится на фазы:
+
+    update    — тик симуляции без коллизий (ввод, враги, ловушки, предметы)
+    collision — коллизии игрока и врагов с платформами
+    draw      — Level.draw + Player.draw + HUD.draw
+
+По каждому сценарию считаются p50/p95/p99 времени кадра и фаз (мс).
+Результат можно сохранить в JSON и сравнить с сохранённым базовым
+прогоном: если метрика хуже базовой больше чем на --tolerance (или
+превышает явный бюджет из "budgets"), скрипт завершается с кодом 1.
+
+Запуск:
+    python benchmarks/frame_benchmark.py
+    python benchmarks/frame_benchmark.py --scenario run --frames 1200 --output result.json
+    python benchmarks/frame_benchmark.py --baseline benchmarks/baseline.json
+    python benchmarks/frame_benchmark.py --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.headless import ScriptedInput
+from game.levels.synthetic import write_synthetic_level
+
+SCREEN_SIZE = (1400, 800)
+DEFAULT_FRAMES = 600
+# Первые кадры (загрузка картинок в кэш, первые чанки) в статистику не идут
+WARMUP_FRAMES = 30
+PERCENTILES = (50, 95, 99)
+PHASES = ("update", "collision", "draw")
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_REPEAT = 3
+# Абсолютный запас (мс): доли миллисекунды у быстрых фаз — это шум
+NOISE_FLOOR_MS = 0.05
+DT = 1 / 60
+
+RUN_SCRIPT = "right:45,right+jump:1,right:30,idle:4"
+COMBAT_SCRIPT = "right:50,right+jump:1,right:20,left:40,left+jump:1,left:20"
+
+
+def percentile(samples, p):
+    """Перцентиль по ближайшему рангу (samples уже отсортированы)."""
+    if not samples:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(samples)))
+    return samples[rank - 1]
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    summary = {f"p{p}": percentile(ordered, p) * 1000 for p in PERCENTILES}
+    summary["mean"] = sum(ordered) / len(ordered) * 1000 if ordered else 0.0
+    return summary
+
+
+class PhaseClock:
+    """Копит время фаз внутри кадра; обёртки методов добавляют в collision."""
+
+    def __init__(self):
+        self.collision = 0.0
+
+    def wrap(self, obj, name):
+        method = getattr(obj, name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.collision += time.perf_counter() - start
+
+        setattr(obj, name, timed)
+
+
+def large_synthetic_level(tmp_dir):
+    """1000x200 тайлов и тысячи сущностей — масштаб «боевого» уровня."""
+    return write_synthetic_level(
+        os.path.join(tmp_dir, "synthetic.tmx"),
+        width=1000,
+        height=200,
+        seed=1,
+        slimes=300,
+        snails=300,
+        flies=300,
+        saws=50,
+        spikes=200,
+        coins=1000,
+    )
+
+
+class GameScenario:
+    """Сценарий на уровне: тик симуляции + отрисовка на каждом кадре."""
+
+    def __init__(self, name, script, level_name="level1", tmx_factory=None,
+                 extra_enemies=0, description=""):
+        self.name = name
+        self.script = script
+        self.level_name = level_name
+        self.tmx_factory = tmx_factory
+        self.extra_enemies = extra_enemies
+        self.description = description
+
+    def setup(self, screen, tmp_dir):
+        from game.camera import Camera
+        from game.levels.level1 import Level
+        from game.player import Player
+        from ui.hud import HUD
+
+        tmx_path = self.tmx_factory(tmp_dir) if self.tmx_factory else None
+        self.level = Level(self.level_name, tmx_path=tmx_path, cache_dir=None)
+        self.player = Player(0, 0)
+        self.level.set_player(self.player)
+        self.spawn_enemies(self.extra_enemies)
+        self.camera = Camera(self.player, SCREEN_SIZE)
+        self.hud = HUD(self.player)
+        self.input = ScriptedInput.parse(self.script, loop=True)
+        self.jump_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+
+        self.clock = PhaseClock()
+        self.clock.wrap(self.player, "handle_horizontal_collisions")
+        self.clock.wrap(self.player, "handle_vertical_collisions")
+        self.clock.wrap(self.level, "check_enemy_collisions")
+
+    def spawn_enemies(self, count):
+        """Толпа врагов вдоль первых экранов уровня (для сценария боя)."""
+        kinds = ("slime", "snail", "fly")
+        spawn_x, spawn_y = self.level.player_spawn_point
+        for i in range(count):
+            kind = kinds[i % len(kinds)]
+            x = spawn_x + 300 + (i * 97) % 2400
+            y = spawn_y - (250 if kind == "fly" else 60)
+            self.level.create_enemy(kind, x, y)
+
+    def frame(self, tick, screen):
+        self.clock.collision = 0.0
+        start = time.perf_counter()
+        if "jump" in self.input.pressed_at(tick):
+            self.player.handle_event(self.jump_event)
+        self.level.tick(self.input.keys_at(tick), DT, tick * DT)
+        self.camera.update(DT)
+        simulated = time.perf_counter()
+
+        self.level.draw(screen, self.camera)
+        self.player.draw(screen, self.camera)
+        self.hud.draw(screen)
+        end = time.perf_counter()
+
+        collision = self.clock.collision
+        return {
+            "frame": end - start,
+            "update": simulated - start - collision,
+            "collision": collision,
+            "draw": end - simulated,
+        }
+
+
+class MenuScenario:
+    """Главное меню: отрисовка фона и кнопок, иногда переход по пунктам."""
+
+    name = "menu"
+    description = "главное меню, стрелка вниз каждые 20 кадров"
+
+    def setup(self, screen, tmp_dir):
+        from types import SimpleNamespace
+        from ui.menu import MainMenu
+
+        app = SimpleNamespace(screen=screen, has_active_game=False, running=True)
+        self.menu = MainMenu(app)
+        self.down = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN)
+
+    def frame(self, tick, screen):
+        start = time.perf_counter()
+        if tick % 20 == 0:
+            self.menu.handle_event(self.down)
+        self.menu.update(DT)
+        handled = time.perf_counter()
+        self.menu.draw(screen)
+        end = time.perf_counter()
+        return {
+            "frame": end - start,
+            "update": handled - start,
+            "collision": 0.0,
+            "draw": end - handled,
+        }
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        GameScenario("idle", "idle:1", description="level1, игрок стоит на спавне"),
+        GameScenario("run", RUN_SCRIPT, description="level1, бег вправо с прыжками"),
+        GameScenario(
+            "combat",
+            COMBAT_SCRIPT,
+            extra_enemies=60,
+            description="level1 + 60 врагов, бег туда-обратно сквозь толпу",
+        ),
+        GameScenario(
+            "run_large",
+            RUN_SCRIPT,
+            level_name="synthetic",
+            tmx_factory=large_synthetic_level,
+            description="синтетический уровень 1000x200, 2250 сущностей, бег вправо",
+        ),
+        MenuScenario(),
+    )
+}
+
+
+def run_scenario(scenario, frames, screen, verbose=False, repeat=DEFAULT_REPEAT):
+    """
+    Прогоняет сценарий repeat раз и возвращает сводку перцентилей по кадру
+    и фазам. Каждая метрика — медиана по прогонам: одиночный всплеск
+    планировщика ОС не должен ронять сравнение с базой.
+    """
+    runs = [_run_once(scenario, frames, screen, verbose) for _ in range(repeat)]
+    merged = {
+        key: {stat: statistics.median(run[key][stat] for run in runs) for stat in runs[0][key]}
+        for key in ("frame", *PHASES)
+    }
+    return {
+        "description": scenario.description,
+        "frames": frames,
+        "repeat": repeat,
+        "frame": merged["frame"],
+        "phases": {phase: merged[phase] for phase in PHASES},
+    }
+
+
+def _run_once(scenario, frames, screen, verbose):
+    samples = {"frame": [], **{phase: [] for phase in PHASES}}
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with tempfile.TemporaryDirectory() as tmp, output:
+        scenario.setup(screen, tmp)
+        for tick in range(WARMUP_FRAMES + frames):
+            timings = scenario.frame(tick, screen)
+            if tick < WARMUP_FRAMES:
+                continue
+            for key, value in timings.items():
+                samples[key].append(value)
+
+    return {key: summarize(values) for key, values in samples.items()}
+
+
+def compare(results, baseline, tolerance):
+    """
+    Сравнивает результаты с базовым прогоном. Возвращает список строк
+    с превышениями (пустой — всё в пределах бюджета).
+    """
+    failures = []
+    base_scenarios = baseline.get("scenarios", {})
+    for name, result in results["scenarios"].items():
+        base = base_scenarios.get(name)
+        if base:
+            # p99 слишком шумный для сравнения с базой — для него есть явные бюджеты
+            metrics = [("frame", p, result["frame"][p], base["frame"][p]) for p in ("p50", "p95")]
+            metrics += [
+                (phase, "p95", result["phases"][phase]["p95"], base["phases"][phase]["p95"])
+                for phase in PHASES
+            ]
+            for label, stat, value, reference in metrics:
+                limit = reference * (1 + tolerance) + NOISE_FLOOR_MS
+                if value > limit:
+                    failures.append(
+                        f"{name}: {label} {stat} {value:.2f} мс > {limit:.2f} мс "
+                        f"(база {reference:.2f} мс + {tolerance:.0%})"
+                    )
+
+        # Явные бюджеты: {"budgets": {"run": {"frame_p95_ms": 8.0, "draw_p99_ms": 5.0}}}
+        for key, budget in baseline.get("budgets", {}).get(name, {}).items():
+            label, stat, _ = key.rsplit("_", 2)
+            section = result["frame"] if label == "frame" else result["phases"][label]
+            value = section[stat]
+            if value > budget:
+                failures.append(f"{name}: {label} {stat} {value:.2f} мс > бюджет {budget:.2f} мс")
+    return failures
+
+
+def print_table(results):
+    header = (
+        f"{'scenario':>10} | {'p50, ms':>8} | {'p95, ms':>8} | {'p99, ms':>8} | "
+        f"{'update p95':>10} | {'collision p95':>13} | {'draw p95':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, result in results["scenarios"].items():
+        frame, phases = result["frame"], result["phases"]
+        print(
+            f"{name:>10} | {frame['p50']:8.2f} | {frame['p95']:8.2f} | {frame['p99']:8.2f} | "
+            f"{phases['update']['p95']:10.2f} | {phases['collision']['p95']:13.2f} | "
+            f"{phases['draw']['p95']:8.2f}"
+        )
+
+
+def write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    print(f"💾 Результаты записаны в {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк кадра по сценариям")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="сценарий (можно несколько); по умолчанию все")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--output", help="записать результаты в JSON")
+    parser.add_argument("--baseline", help="сравнить с базовым JSON и упасть при регрессии")
+    parser.add_argument("--save-baseline", help="сохранить результаты как базовые")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="прогонов на сценарий (берётся медиана метрик)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="допустимое ухудшение относительно базы (0.25 = +25%%)")
+    parser.add_argument("--verbose", action="store_true", help="не глушить вывод игры")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "frames": args.frames,
+            "warmup_frames": WARMUP_FRAMES,
+            "repeat": args.repeat,
+        },
+        "scenarios": {},
+    }
+    for name in args.scenario or SCENARIOS:
+        results["scenarios"][name] = run_scenario(
+            SCENARIOS[name], args.frames, screen, args.verbose, args.repeat
+        )
+    pygame.quit()
+
+    print_table(results)
+
+    if args.output:
+        write_json(args.output, results)
+    if args.save_baseline:
+        # Прогнанные сценарии заменяют свои записи в базе; остальные
+        # сценарии и явные бюджеты остаются как были
+        baseline = {}
+        if os.path.exists(args.save_baseline):
+            with open(args.save_baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        scenarios = dict(baseline.get("scenarios", {}), **results["scenarios"])
+        write_json(args.save_baseline, dict(baseline, meta=results["meta"], scenarios=scenarios))
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        failures = compare(results, baseline, args.tolerance)
+        if failures:
+            print("\n❌ Превышены бюджеты:")
+            for line in failures:
+                print(f"  - {line}")
+            return 1
+        print("\n✅ Все сценарии в пределах бюджета")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Бенчмарк: время разбора TMX в зависимости от размера карты.
+
+Берёт слои level1.tmx и размножает их по сетке до карт в 1x, 10x и 100x
+больше по числу тайлов, сохраняет во временные файлы (base64+zlib и csv)
+и замеряет load_tmx. Время должно расти примерно линейно. Для сравнения
+замеряется открытие того же уровня из скомпилированного кэша (.lvlc).
+
+Запуск:
+    python benchmarks/tmx_load_scaling.py
+"""
+
+import base64
+import os
+import sys
+import tempfile
+import time
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.collision_map import TileCollisionMap
+from game.level_cache import load_compiled, write_compiled
+from game.tmx_loader import load_tmx
+
+LEVEL1_TMX = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "game", "assets", "levels", "level1.tmx",
+)
+# Во сколько раз по каждой оси увеличивается карта: 1x, ~10x и 100x тайлов
+SCALES = (1, 3, 10)
+REPEATS = 3
+
+
+def tile_layer(gids, width, height, scale):
+    """Повторяет слой width x height сеткой scale x scale."""
+    out = []
+    for _ in range(scale):
+        for row in range(height):
+            line = gids[row * width:(row + 1) * width]
+            out.extend(line * scale)
+    return out
+
+
+def layer_xml(name, gids, width, height, encoding):
+    if encoding == "csv":
+        data = ",".join(map(str, gids))
+        return f' <layer name="{name}" width="{width}" height="{height}">\n' \
+               f'  <data encoding="csv">{data}</data>\n </layer>\n'
+    raw = b"".join(gid.to_bytes(4, "little") for gid in gids)
+    data = base64.b64encode(zlib.compress(raw)).decode()
+    return f' <layer name="{name}" width="{width}" height="{height}">\n' \
+           f'  <data encoding="base64" compression="zlib">{data}</data>\n </layer>\n'
+
+
+def write_scaled_map(source, scale, encoding, path):
+    width, height = source.width * scale, source.height * scale
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        f'<map version="1.10" orientation="orthogonal" width="{width}" height="{height}" '
+        f'tilewidth="{source.tilewidth}" tileheight="{source.tileheight}" infinite="0">\n',
+    ]
+    for layer in source.layers:
+        # Разреженные слои (SparseTileLayer) хранят только непустые тайлы
+        dense = [0] * (layer.width * layer.height)
+        for col, row, gid in layer.tiles():
+            dense[row * layer.width + col] = gid
+        gids = tile_layer(dense, layer.width, layer.height, scale)
+        parts.append(layer_xml(layer.name, gids, width, height, encoding))
+    parts.append("</map>\n")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
+    return width * height
+
+
+def main():
+    source = load_tmx(LEVEL1_TMX)
+    print(f"{'tiles':>10} | {'encoding':>8} | {'load_tmx, ms':>12} | {'us/tile':>8} | {'.lvlc, ms':>9}")
+    print("-" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        for encoding in ("base64", "csv"):
+            for scale in SCALES:
+                path = os.path.join(tmp, f"map_{encoding}_{scale}.tmx")
+                tiles = write_scaled_map(source, scale, encoding, path)
+                best = min(_timed(load_tmx, path) for _ in range(REPEATS))
+
+                tile_map = load_tmx(path)
+                cache_dir = os.path.join(tmp, "cache")
+                collision_map = TileCollisionMap(tile_map.width, tile_map.height)
+                write_compiled(path, tile_map, collision_map, cache_dir)
+                cached = min(_timed(load_compiled, path, cache_dir) for _ in range(REPEATS))
+
+                print(f"{tiles:>10} | {encoding:>8} | {best * 1000:12.2f} | "
+                      f"{best * 1e6 / tiles:8.3f} | {cached * 1000:9.2f}")
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,94 @@
 # game/asset_loader.py
+import bisect
 import os
+import weakref
+from collections import OrderedDict
 
 import pygame
 
+from game.log import get_logger
 from game.path_utils import resource_path
 
+log = get_logger("assets")
+
+# Бюджет кэша изображений по умолчанию (байты пикселей)
+DEFAULT_IMAGE_CACHE_BUDGET = 64 * 1024 * 1024
+
+
+def surface_bytes(surface):
+    """Сколько байт пикселей занимает поверхность."""
+    return surface.get_pitch() * surface.get_height()
+
+
+# Исходная поверхность -> {(flip_x, flip_y): отражённая копия}.
+# Слабые ключи: вариант живёт ровно столько, сколько исходный спрайт.
+_flipped_variants = weakref.WeakKeyDictionary()
+
+
+def get_flipped(surface, flip_x=True, flip_y=False):
+    """
+    Отражённый вариант спрайта из общего кэша.
+
+    pygame.transform.flip создаёт новую поверхность на каждый вызов;
+    здесь копия строится один раз на исходную поверхность и затем
+    переиспользуется всеми сущностями, которые её рисуют. Это единственный
+    кэш отражений: у load_image отражений нет, а вариант живёт, пока жива
+    исходная поверхность (из кэша загрузчика или у спрайтов).
+    """
+    if not (flip_x or flip_y):
+        return surface
+    variants = _flipped_variants.get(surface)
+    if variants is None:
+        variants = _flipped_variants[surface] = {}
+    flipped = variants.get((flip_x, flip_y))
+    if flipped is None:
+        flipped = variants[(flip_x, flip_y)] = pygame.transform.flip(
+            surface, flip_x, flip_y
+        )
+    return flipped
+
 
 class AssetLoader:
-    def __init__(self):
-        self.assets = {}
+    def __init__(self, cache_budget=DEFAULT_IMAGE_CACHE_BUDGET):
+        # (name, scale) -> Surface; порядок = порядок использования (LRU)
+        self.assets = OrderedDict()
+        self._asset_bytes = {}
+        self.cache_budget = cache_budget
+        self.cache_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
         self.tilesets = {}  # храним tilesets
+        # Отсортированные firstgid и соответствующие им tilesets (для bisect)
+        self._firstgids = []
+        self._tilesets_by_gid = []
+        # GID -> общий subsurface-вид на лист тайлсета (без копирования пикселей)
+        self._tile_cache = {}
+        self._missing_tile = None
         # PyInstaller-совместимый базовый путь к ресурсам
         self.base_path = resource_path("game", "assets")
-        print(f"🔄 AssetLoader base path: {self.base_path}")
+        log.debug("🔄 AssetLoader base path: %s", self.base_path)
 
     def load_image(self, name, scale=1):
-        if name in self.assets:
-            return self.assets[name]
+        """
+        Загружает изображение с кэшированием по (name, scale).
+
+        Одна и та же картинка в разных масштабах — разные записи; отражённые
+        варианты даёт get_flipped. Кэш ограничен cache_budget байт; при
+        переполнении выбрасываются давно не использованные записи (LRU).
+        Уже выданные поверхности остаются валидными — кэш просто перестаёт
+        их хранить.
+        """
+        key = (name, scale)
+        image = self.assets.get(key)
+        if image is not None:
+            self.assets.move_to_end(key)
+            self.cache_hits += 1
+            return image
+        self.cache_misses += 1
 
         path = os.path.join(self.base_path, name)
-        print(f"🔄 Loading image: {path}")
+        log.debug("🔄 Loading image: %s", path)
 
         try:
             image = pygame.image.load(path).convert_alpha()
@@ -29,27 +98,79 @@ class AssetLoader:
                     int(image.get_height() * scale),
                 )
                 image = pygame.transform.scale(image, new_size)
-            self.assets[name] = image
-            print(f"✅ Successfully loaded: {name}")
+            self._store(key, image)
+            log.debug("✅ Successfully loaded: %s", name)
             return image
         except pygame.error as e:
-            print(f"❌ Failed to load image: {path}")
-            print(f"❌ Error: {e}")
+            log.error("❌ Failed to load image: %s (%s)", path, e)
             stub_surface = pygame.Surface((50, 50), pygame.SRCALPHA)
             pygame.draw.rect(stub_surface, (255, 0, 255), (0, 0, 50, 50))
             return stub_surface
 
+    def _store(self, key, image):
+        """Кладёт поверхность в кэш и выбрасывает старые записи сверх бюджета."""
+        size = surface_bytes(image)
+        self.assets[key] = image
+        self._asset_bytes[key] = size
+        self.cache_bytes += size
+        self._evict(keep=key)
+
+    def _evict(self, keep=None):
+        while self.cache_bytes > self.cache_budget and self.assets:
+            oldest = next(iter(self.assets))
+            if oldest == keep:
+                # Единственная запись больше бюджета — оставляем её
+                if len(self.assets) == 1:
+                    break
+                self.assets.move_to_end(oldest)
+                continue
+            del self.assets[oldest]
+            self.cache_bytes -= self._asset_bytes.pop(oldest)
+            self.cache_evictions += 1
+
+    def set_cache_budget(self, budget_bytes):
+        """Меняет бюджет кэша изображений и сразу ужимает кэш под него."""
+        self.cache_budget = budget_bytes
+        self._evict()
+
+    def clear_cache(self):
+        """Очищает кэш изображений и обнуляет счётчики cache_stats."""
+        self.assets.clear()
+        self._asset_bytes.clear()
+        self.cache_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+
+    def cache_stats(self):
+        """Сводка по кэшу изображений: попадания, промахи, вытеснения и объём."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "evictions": self.cache_evictions,
+            "entries": len(self.assets),
+            "resident_bytes": self.cache_bytes,
+            "budget_bytes": self.cache_budget,
+        }
+
+    def resident_assets(self):
+        """Байты в кэше по каждому файлу (все масштабы вместе), по убыванию."""
+        per_asset = {}
+        for (name, _scale), size in self._asset_bytes.items():
+            per_asset[name] = per_asset.get(name, 0) + size
+        return sorted(per_asset.items(), key=lambda item: item[1], reverse=True)
+
     def load_tileset(self, name, firstgid, tilewidth, tileheight):
         """Загрузка tileset и создание mapping для GID."""
         if name in self.tilesets:
             return self.tilesets[name]
 
         path = os.path.join(self.base_path, name)
-        print(f"🔄 Loading tileset: {path}")
+        log.debug("🔄 Loading tileset: %s", path)
 
         try:
             tileset_image = pygame.image.load(path).convert_alpha()
-            self.tilesets[name] = {
+            tileset_data = {
                 "image": tileset_image,
                 "firstgid": firstgid,
                 "tilewidth": tilewidth,
@@ -57,43 +178,54 @@ class AssetLoader:
                 "columns": tileset_image.get_width() // tilewidth,
                 "rows": tileset_image.get_height() // tileheight,
             }
-            print(f"✅ Tileset loaded: {name} (firstgid: {firstgid})")
+            self.tilesets[name] = tileset_data
+
+            index = bisect.bisect_left(self._firstgids, firstgid)
+            self._firstgids.insert(index, firstgid)
+            self._tilesets_by_gid.insert(index, tileset_data)
+            log.info("✅ Tileset loaded: %s (firstgid: %s)", name, firstgid)
             return self.tilesets[name]
         except pygame.error as e:
-            print(f"❌ Failed to load tileset: {path}")
-            print(f"❌ Error: {e}")
+            log.error("❌ Failed to load tileset: %s (%s)", path, e)
             return None
 
     def get_tile_image(self, gid):
-        """Получение тайла по GID."""
-        for tileset_name, tileset_data in self.tilesets.items():
-            firstgid = tileset_data["firstgid"]
-            tilewidth = tileset_data["tilewidth"]
-            tileheight = tileset_data["tileheight"]
+        """
+        Получение тайла по GID.
+
+        Tileset выбирается бинарным поиском по отсортированным firstgid, а тайл
+        возвращается как subsurface листа — общий для всех вызовов, без
+        выделения новой поверхности. Возвращаемую поверхность нельзя изменять:
+        это окно в общий лист тайлсета.
+        """
+        tile = self._tile_cache.get(gid)
+        if tile is not None:
+            return tile
+
+        index = bisect.bisect_right(self._firstgids, gid) - 1
+        if index >= 0:
+            tileset_data = self._tilesets_by_gid[index]
             columns = tileset_data["columns"]
-            rows = tileset_data["rows"]
+            local_id = gid - tileset_data["firstgid"]
 
-            if firstgid <= gid < firstgid + (columns * rows):
+            if local_id < columns * tileset_data["rows"]:
                 # Вычисляем позицию тайла в tileset
-                local_id = gid - firstgid
+                tilewidth = tileset_data["tilewidth"]
+                tileheight = tileset_data["tileheight"]
                 x = (local_id % columns) * tilewidth
                 y = (local_id // columns) * tileheight
 
-                # Вырезаем тайл
-                tile_surface = pygame.Surface((tilewidth, tileheight), pygame.SRCALPHA)
-                tile_surface.blit(
-                    tileset_data["image"],
-                    (0, 0),
-                    (x, y, tilewidth, tileheight),
-                )
-                return tile_surface
-
-        print(f"⚠️ Tile with GID {gid} not found in any tileset")
-        # Заглушка фиксированного размера, чтобы избежать обращения к несуществующему tilewidth
-        stub_size = 128
-        stub_surface = pygame.Surface((stub_size, stub_size), pygame.SRCALPHA)
-        stub_surface.fill((255, 0, 255))  # Фиолетовый цвет для отладки
-        return stub_surface
+                tile = tileset_data["image"].subsurface((x, y, tilewidth, tileheight))
+                self._tile_cache[gid] = tile
+                return tile
+
+        log.warning("⚠️ Tile with GID %s not found in any tileset", gid)
+        # Одна общая заглушка фиксированного размера на все ненайденные GID
+        if self._missing_tile is None:
+            stub_size = 128
+            self._missing_tile = pygame.Surface((stub_size, stub_size), pygame.SRCALPHA)
+            self._missing_tile.fill((255, 0, 255))  # Фиолетовый цвет для отладки
+        return self._missing_tile
 
 
 asset_loader = AssetLoader()
@@ -4,6 +4,9 @@ import pygame
 from .music_manager import MusicManager
 from .sfx_manager import SFXManager
 from .settings import AudioSettings
+from ...log import get_logger
+
+log = get_logger("audio")
 
 
 class AudioManager:
@@ -73,7 +76,7 @@ class AudioManager:
                 pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
             self.mixer_initialized = True
         except Exception as e:
-            print(f"[Audio] WARNING: Failed to initialize mixer: {e}")
+            log.warning("[Audio] Failed to initialize mixer: %s", e)
             self.mixer_initialized = False
 
     def _register_default_assets(self):
@@ -177,13 +180,15 @@ class AudioManager:
         effective_music = self.settings.get_effective_music_volume()
         effective_sfx = self.settings.get_effective_sfx_volume()
 
-        print(
-            "[Audio] apply_volumes: "
-            f"master={self.settings.master_volume:.2f} "
-            f"music={self.settings.music_volume:.2f} "
-            f"sfx={self.settings.sfx_volume:.2f} "
-            f"muted={self.settings.muted} -> "
-            f"eff_music={effective_music:.2f} eff_sfx={effective_sfx:.2f}"
+        log.debug(
+            "[Audio] apply_volumes: master=%.2f music=%.2f sfx=%.2f muted=%s -> "
+            "eff_music=%.2f eff_sfx=%.2f",
+            self.settings.master_volume,
+            self.settings.music_volume,
+            self.settings.sfx_volume,
+            self.settings.muted,
+            effective_music,
+            effective_sfx,
         )
 
         # Music volume (pygame.mixer.music is global)
@@ -251,7 +256,7 @@ class AudioManager:
             self.sfx.stop_all()
             pygame.mixer.quit()
         except Exception as e:
-            print(f"[Audio] WARNING: error during shutdown: {e}")
+            log.warning("[Audio] error during shutdown: %s", e)
 
 
 __all__ = ["AudioManager"]
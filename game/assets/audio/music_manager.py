@@ -2,6 +2,10 @@ import os
 import pygame
 from typing import Dict, Optional
 
+from ...log import get_logger
+
+log = get_logger("audio")
+
 
 class MusicManager:
     """
@@ -32,7 +36,7 @@ class MusicManager:
         loop: -1 for infinite, 0 for once, etc.
         """
         if key not in self.tracks:
-            print(f"[Music] WARNING: Track '{key}' is not registered.")
+            log.warning("[Music] Track '%s' is not registered.", key)
             return
 
         if not pygame.mixer.get_init():
@@ -40,7 +44,7 @@ class MusicManager:
 
         path = self.tracks[key]
         if not os.path.exists(path):
-            print(f"[Music] WARNING: File not found for '{key}': {path}")
+            log.warning("[Music] File not found for '%s': %s", key, path)
             return
 
         try:
@@ -55,7 +59,7 @@ class MusicManager:
             # Re-apply volume after load
             pygame.mixer.music.set_volume(self._last_set_volume)
         except Exception as e:
-            print(f"[Music] ERROR: Failed to play '{key}' ({path}): {e}")
+            log.error("[Music] Failed to play '%s' (%s): %s", key, path, e)
 
     def stop(self):
         if not pygame.mixer.get_init():
@@ -64,7 +68,7 @@ class MusicManager:
             pygame.mixer.music.stop()
             self.current_key = None
         except Exception as e:
-            print(f"[Music] WARNING: Failed to stop music: {e}")
+            log.warning("[Music] Failed to stop music: %s", e)
 
     def pause(self):
         if not pygame.mixer.get_init():
@@ -72,7 +76,7 @@ class MusicManager:
         try:
             pygame.mixer.music.pause()
         except Exception as e:
-            print(f"[Music] WARNING: Failed to pause music: {e}")
+            log.warning("[Music] Failed to pause music: %s", e)
 
     def resume(self):
         if not pygame.mixer.get_init():
@@ -80,7 +84,7 @@ class MusicManager:
         try:
             pygame.mixer.music.unpause()
         except Exception as e:
-            print(f"[Music] WARNING: Failed to resume music: {e}")
+            log.warning("[Music] Failed to resume music: %s", e)
 
     # ---------- Volume / Crossfade ----------
 
@@ -94,7 +98,7 @@ class MusicManager:
         try:
             pygame.mixer.music.set_volume(self._last_set_volume)
         except Exception as e:
-            print(f"[Music] WARNING: Failed to set volume: {e}")
+            log.warning("[Music] Failed to set volume: %s", e)
 
     def fade_to_volume(self, target_volume: float, duration_ms: int):
         """
@@ -3,6 +3,10 @@ import os
 import sys
 from dataclasses import dataclass, asdict
 
+from ...log import get_logger
+
+log = get_logger("audio")
+
 
 DEFAULT_SETTINGS = {
     "master_volume": 0.8,
@@ -68,7 +72,7 @@ class AudioSettings:
             with open(path, "w", encoding="utf-8") as f:
                 json.dump(asdict(self), f, indent=2)
         except Exception as e:
-            print(f"[Audio] WARNING: Failed to save audio settings: {e}")
+            log.warning("[Audio] Failed to save audio settings: %s", e)
 
     @classmethod
     def load(cls) -> "AudioSettings":
@@ -91,9 +95,7 @@ class AudioSettings:
                 muted=bool(data.get("muted", DEFAULT_SETTINGS["muted"])),
             )
         except Exception as e:
-            print(
-                f"[Audio] WARNING: Failed to load audio settings, using defaults: {e}"
-            )
+            log.warning("[Audio] Failed to load audio settings, using defaults: %s", e)
             return cls()
 
 
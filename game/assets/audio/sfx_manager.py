@@ -2,6 +2,10 @@ import os
 import pygame
 from typing import Dict, Optional, List, Tuple
 
+from ...log import get_logger
+
+log = get_logger("audio")
+
 
 class SFXManager:
     """
@@ -33,7 +37,7 @@ class SFXManager:
             if current < self.max_channels:
                 pygame.mixer.set_num_channels(self.max_channels)
         except Exception as e:
-            print(f"[SFX] WARNING: Failed to set channels: {e}")
+            log.warning("[SFX] Failed to set channels: %s", e)
 
     # ---------- Registry ----------
 
@@ -51,7 +55,7 @@ class SFXManager:
             return self.cache[key]
 
         if key not in self.sounds:
-            print(f"[SFX] WARNING: Sound '{key}' is not registered.")
+            log.warning("[SFX] Sound '%s' is not registered.", key)
             self.cache[key] = None
             return None
 
@@ -61,7 +65,7 @@ class SFXManager:
 
         path = self.sounds[key]
         if not os.path.exists(path):
-            print(f"[SFX] WARNING: File not found for '{key}': {path}")
+            log.warning("[SFX] File not found for '%s': %s", key, path)
             self.cache[key] = None
             return None
 
@@ -71,7 +75,7 @@ class SFXManager:
             self.cache[key] = sound
             return sound
         except Exception as e:
-            print(f"[SFX] ERROR: Failed to load sound '{key}' ({path}): {e}")
+            log.error("[SFX] Failed to load sound '%s' (%s): %s", key, path, e)
             self.cache[key] = None
             return None
 
@@ -93,7 +97,7 @@ class SFXManager:
             channel = sound.play(loops=loops)
             return channel
         except Exception as e:
-            print(f"[SFX] WARNING: Failed to play sound '{key}': {e}")
+            log.warning("[SFX] Failed to play sound '%s': %s", key, e)
             return None
 
     def play_at(
@@ -150,7 +154,7 @@ class SFXManager:
             channel.play(sound)
             return channel
         except Exception as e:
-            print(f"[SFX] WARNING: Failed positional play for '{key}': {e}")
+            log.warning("[SFX] Failed positional play for '%s': %s", key, e)
             return None
 
     def stop_all(self):
@@ -159,7 +163,7 @@ class SFXManager:
         try:
             pygame.mixer.stop()
         except Exception as e:
-            print(f"[SFX] WARNING: Failed to stop all sounds: {e}")
+            log.warning("[SFX] Failed to stop all sounds: %s", e)
 
     # ---------- Volume ----------
 
@@ -177,7 +181,7 @@ class SFXManager:
             try:
                 sound.set_volume(self._last_set_volume)
             except Exception as e:
-                print(f"[SFX] WARNING: Failed to set volume for '{key}': {e}")
+                log.warning("[SFX] Failed to set volume for '%s': %s", key, e)
 
         # Также обновляем громкость для уже играющих каналов, чтобы
         # изменения ползунка SFX были слышны сразу, а не только для
@@ -188,7 +192,7 @@ class SFXManager:
                 channel = pygame.mixer.Channel(i)
                 channel.set_volume(self._last_set_volume)
         except Exception as e:
-            print(f"[SFX] WARNING: Failed to set volume on channels: {e}")
+            log.warning("[SFX] Failed to set volume on channels: %s", e)
 
 
 __all__ = ["SFXManager"]
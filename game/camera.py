@@ -4,12 +4,19 @@
 
 import pygame
 
+from .log import get_logger
+
+log = get_logger("camera")
+
+
 class Camera:
     def __init__(self, target, screen_size):
         self.target = target
         self.screen_size = screen_size
         self.offset = pygame.math.Vector2(0, 0)
         self.offset_float = pygame.math.Vector2(0, 0)
+        # Смещение на прошлом тике — для интерполяции при отрисовке
+        self.prev_offset = pygame.math.Vector2(0, 0)
         
         # Константы для плавного слежения
         self.CONST = pygame.math.Vector2(
@@ -17,22 +24,39 @@ class Camera:
             -screen_size[1] / 2 + target.rect.height / 2
         )
         
-        print("📷 Камера инициализирована!")
+        log.debug("📷 Камера инициализирована!")
     
-    def update(self):
-        """Обновление позиции камеры"""
+    def update(self, dt=1 / 60):
+        """Обновление позиции камеры (один тик симуляции длиной dt)"""
         if self.target:
-            # Плавное слежение за целью
-            self.offset_float.x += (self.target.rect.x - self.offset_float.x + self.CONST.x) * 0.05
-            self.offset_float.y += (self.target.rect.y - self.offset_float.y + self.CONST.y) * 0.05
+            self.prev_offset.update(self.offset_float)
+            # Плавное слежение за целью: 5% расстояния за тик 60 Гц,
+            # при другом шаге — та же скорость сближения в секунду
+            follow = 1 - (1 - 0.05) ** (dt * 60)
+            self.offset_float.x += (self.target.rect.x - self.offset_float.x + self.CONST.x) * follow
+            self.offset_float.y += (self.target.rect.y - self.offset_float.y + self.CONST.y) * follow
             
             # Округление для избежания артефактов
             self.offset.x, self.offset.y = int(self.offset_float.x), int(self.offset_float.y)
+
+    def interpolate(self, alpha):
+        """Смещение для отрисовки между прошлым и текущим тиком"""
+        offset = self.prev_offset.lerp(self.offset_float, max(0.0, min(alpha, 1.0)))
+        self.offset.x, self.offset.y = int(offset.x), int(offset.y)
     
     def apply(self, rect):
         """Применение смещения камеры к прямоугольнику"""
         return rect.move(-self.offset.x, -self.offset.y)
     
+    def visible_rect(self, margin=0):
+        """Прямоугольник мира, видимый на экране (с необязательным запасом по краям)"""
+        return pygame.Rect(
+            self.offset.x - margin,
+            self.offset.y - margin,
+            self.screen_size[0] + 2 * margin,
+            self.screen_size[1] + 2 * margin,
+        )
+
     def apply_point(self, point):
         """Применение смещения камеры к точке"""
         return (point[0] - self.offset.x, point[1] - self.offset.y)
\ No newline at end of file
@@ -0,0 +1,81 @@
+# game/chunk_streaming.py
+
+
+class ChunkStreamer:
+    """
+    Решает, какие чанки мира должны быть загружены вокруг точки (игрока).
+
+    Чанк загружается, когда оказывается в пределах radius чанков от чанка
+    игрока (по Чебышёву), и выгружается только когда уходит дальше
+    radius + hysteresis. Запас hysteresis не даёт чанку на границе
+    загружаться и выгружаться каждый кадр, пока игрок ходит туда-сюда.
+
+    Сам стример ничего не создаёт — он вызывает on_load(key) / on_unload(key),
+    а уровень строит или удаляет спрайты чанка.
+    """
+
+    def __init__(self, chunk_size, radius=2, hysteresis=1, bounds=None,
+                 on_load=None, on_unload=None):
+        self.chunk_size = chunk_size
+        self.radius = radius
+        self.hysteresis = hysteresis
+        # (left, top, right, bottom) в чанках, включительно; None — без границ
+        self.bounds = bounds
+        self.on_load = on_load
+        self.on_unload = on_unload
+        self.loaded = set()
+        self._center = None
+
+    def chunk_at(self, x, y):
+        size = self.chunk_size
+        return int(x) // size, int(y) // size
+
+    def update(self, x, y):
+        """
+        Подгружает/выгружает чанки вокруг точки мира (x, y).
+
+        Возвращает (загруженные, выгруженные) ключи чанков за этот вызов.
+        Пока игрок остаётся в том же чанке, вызов ничего не делает.
+        """
+        center = self.chunk_at(x, y)
+        if center == self._center:
+            return [], []
+        self._center = center
+        cx, cy = center
+
+        keep = self.radius + self.hysteresis
+        unloaded = [
+            key for key in self.loaded
+            if max(abs(key[0] - cx), abs(key[1] - cy)) > keep
+        ]
+        for key in unloaded:
+            self.loaded.discard(key)
+            if self.on_unload:
+                self.on_unload(key)
+
+        loaded = []
+        radius = self.radius
+        for ky in range(cy - radius, cy + radius + 1):
+            for kx in range(cx - radius, cx + radius + 1):
+                key = (kx, ky)
+                if key in self.loaded or not self._in_bounds(key):
+                    continue
+                self.loaded.add(key)
+                loaded.append(key)
+                if self.on_load:
+                    self.on_load(key)
+
+        return loaded, unloaded
+
+    def unload_all(self):
+        for key in list(self.loaded):
+            self.loaded.discard(key)
+            if self.on_unload:
+                self.on_unload(key)
+        self._center = None
+
+    def _in_bounds(self, key):
+        if self.bounds is None:
+            return True
+        left, top, right, bottom = self.bounds
+        return left <= key[0] <= right and top <= key[1] <= bottom
@@ -0,0 +1,195 @@
+# game/colliders.py
+"""
+Объединённые прямоугольники коллизий статической геометрии.
+
+Раньше каждый тайл земли был отдельным прямоугольником коллизии: ровный пол
+шириной 30 тайлов — это 30 проверок для игрока и врагов. При загрузке уровня
+клетки карты коллизий одного типа жадно сливаются в максимальные
+прямоугольники (greedy meshing):
+
+* полные блоки (SOLID) растут вправо, пока строка продолжается, затем вниз,
+  пока под ними вся строка того же типа;
+* полублоки (HALF) — только вправо: твёрдая у них лишь верхняя половина
+  тайла, и две строки полублоков не дают сплошного прямоугольника.
+
+Склоны и ящики не сливаются — у склона своя форма, а ящик можно разбить,
+поэтому они проверяются как отдельные платформы.
+
+Collider повторяет интерфейс Platform, который нужен проверкам коллизий
+(rect, collision_rect, collision_kind, has_collision, check_collision),
+так что игрок и враги обходят объединённый набор так же, как группу платформ.
+
+sweep_y / sweep_step — непрерывная (swept AABB) проверка вертикального шага
+по этому же набору: быстрое падение за один тик не проскакивает тонкую
+платформу, а останавливается на первой встреченной.
+"""
+
+import pygame
+
+from .collision_map import HALF, SLOPE, SOLID
+
+# Типы клеток, которые сливаются в прямоугольники
+MERGEABLE_KINDS = (SOLID, HALF)
+# На сколько пикселей sweep_step заводит тело внутрь встреченной платформы:
+# обычная проверка перекрытий видит опору и ставит тело на неё
+SWEEP_SKIN = 1
+
+
+class Collider(pygame.sprite.Sprite):
+    """Прямоугольник коллизии из cols x rows клеток одного типа, начиная с клетки (col, row)."""
+
+    has_collision = True
+
+    def __init__(self, kind, col, row, cols, rows, tile_size=128):
+        super().__init__()
+        self.collision_kind = kind
+        self.area = (col, row, cols, rows)
+        self.rect = pygame.Rect(col * tile_size, row * tile_size, cols * tile_size, rows * tile_size)
+        if kind == HALF:
+            # Как у Platform: у полублока твёрдая только верхняя половина
+            self.collision_rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.width, tile_size // 2)
+        else:
+            self.collision_rect = self.rect.copy()
+
+    def __repr__(self):
+        col, row, cols, rows = self.area
+        return f"Collider(kind={self.collision_kind}, cell=({col}, {row}), size={cols}x{rows})"
+
+    def contains_cell(self, col, row):
+        left, top, cols, rows = self.area
+        return left <= col < left + cols and top <= row < top + rows
+
+    def check_collision(self, other_rect):
+        return self.collision_rect.colliderect(other_rect)
+
+
+def merge_cells(collision_map, area=None):
+    """
+    Жадно сливает клетки SOLID и HALF карты коллизий в прямоугольники.
+
+    area — (col, row, cols, rows) в клетках мира: слить только эту область
+    (например, прямоугольник, из которого убрали тайл). По умолчанию — вся карта.
+    Возвращает список Collider; клетки разных прямоугольников не пересекаются.
+    """
+    kinds = collision_map.kinds
+    width = collision_map.width
+    tile_size = collision_map.tile_size
+    origin_col, origin_row = collision_map.origin_col, collision_map.origin_row
+
+    if area is None:
+        left, top, right, bottom = 0, 0, width, collision_map.height
+    else:
+        col, row, cols, rows = area
+        left = max(col - origin_col, 0)
+        top = max(row - origin_row, 0)
+        right = min(col - origin_col + cols, width)
+        bottom = min(row - origin_row + rows, collision_map.height)
+    area_width = right - left
+    if area_width <= 0 or bottom <= top:
+        return []
+
+    # Клетки области, уже вошедшие в какой-нибудь прямоугольник
+    used = bytearray(area_width * (bottom - top))
+    colliders = []
+    for row in range(top, bottom):
+        base = row * width
+        used_base = (row - top) * area_width - left
+        col = left
+        while col < right:
+            kind = kinds[base + col]
+            if kind not in MERGEABLE_KINDS or used[used_base + col]:
+                col += 1
+                continue
+
+            end = col + 1
+            while end < right and kinds[base + end] == kind and not used[used_base + end]:
+                end += 1
+            count = end - col
+
+            last = row + 1
+            if kind == SOLID:
+                while last < bottom:
+                    start = last * width + col
+                    used_start = (last - top) * area_width - left + col
+                    if kinds[start:start + count].count(kind) != count:
+                        break
+                    if used[used_start:used_start + count].count(0) != count:
+                        break
+                    last += 1
+
+            for r in range(row, last):
+                used_start = (r - top) * area_width - left + col
+                used[used_start:used_start + count] = b"\x01" * count
+            colliders.append(
+                Collider(kind, col + origin_col, row + origin_row, count, last - row, tile_size)
+            )
+            col = end
+    return colliders
+
+
+def _slope_top(rect, box):
+    """Верх склона rect над box: склон поднимается вправо, выше всего — у правого края box."""
+    x = min(box.right, rect.right + 1)
+    relative_x = max(0.0, min(1.0, (x - rect.left) / rect.width))
+    return rect.bottom - relative_x * rect.height
+
+
+def sweep_y(colliders, box, dy, area=None):
+    """
+    Непрерывная проверка вертикального шага box на dy пикселей.
+
+    Возвращает (contact, collider): смещение до первого касания и платформу,
+    которой коснулись, или (dy, None), если путь свободен. Учитываются только
+    платформы, которых box в начале шага ещё не касается изнутри: уже
+    перекрытые разрешает обычная проверка. Склоны останавливают только падение.
+
+    colliders — группа с query() (SpatialGroup) или список платформ.
+    area — Rect для запроса к индексу, переиспользуемый между вызовами.
+    """
+    if dy == 0:
+        return dy, None
+    if hasattr(colliders, "query"):
+        if area is None:
+            area = pygame.Rect(0, 0, 0, 0)
+        area.x = box.x
+        area.width = box.width
+        reach = int(abs(dy)) + 1
+        area.y = box.y - reach if dy < 0 else box.y
+        area.height = box.height + reach
+        candidates = colliders.query(area)
+    else:
+        candidates = colliders
+
+    contact, hit = dy, None
+    left, right = box.left, box.right
+    for collider in candidates:
+        if not getattr(collider, "has_collision", True):
+            continue
+        rect = getattr(collider, "collision_rect", collider.rect)
+        if rect.right <= left or rect.left >= right:
+            continue
+        if dy > 0:
+            top = rect.top
+            if getattr(collider, "collision_kind", None) == SLOPE:
+                top = _slope_top(collider.rect, box)
+            distance = top - box.bottom
+            if 0 <= distance < contact:
+                contact, hit = distance, collider
+        elif getattr(collider, "collision_kind", None) != SLOPE:
+            distance = rect.bottom - box.top
+            if contact < distance <= 0:
+                contact, hit = distance, collider
+    return contact, hit
+
+
+def sweep_step(colliders, box, dy, area=None):
+    """
+    Вертикальный шаг dy, укороченный до первой встреченной платформы
+    (с заходом в неё на SWEEP_SKIN пикселей). Если путь свободен — dy как есть.
+    """
+    contact, hit = sweep_y(colliders, box, dy, area)
+    if hit is None:
+        return dy
+    if dy > 0:
+        return min(dy, contact + SWEEP_SKIN)
+    return max(dy, contact - SWEEP_SKIN)
@@ -0,0 +1,166 @@
+# game/collision_map.py
+from array import array
+
+# 🔥 ТИПЫ КОЛЛИЗИЙ ТАЙЛОВ (хранятся в массиве как один байт на клетку)
+EMPTY = 0
+SOLID = 1  # полный блок
+HALF = 2  # semitype: твёрдая только верхняя половина тайла
+SLOPE = 3  # triangle: склон, поднимающийся слева направо
+BOX = 4  # разрушаемый ящик (твёрдый, пока не разбит)
+
+# Если в одну клетку попадают тайлы разных слоёв — побеждает более «твёрдый»
+_KIND_PRIORITY = {EMPTY: 0, SLOPE: 1, HALF: 2, SOLID: 3, BOX: 4}
+
+
+def collision_kind_for_type(platform_type):
+    """Переводит строковый тип платформы в тип коллизии (один раз при создании)."""
+    if platform_type == "box":
+        return BOX
+    if platform_type == "triangle":
+        return SLOPE
+    if platform_type.startswith("semitype"):
+        return HALF
+    return SOLID
+
+
+class TileCollisionMap:
+    """
+    Плотная сетка типов коллизий статической геометрии уровня.
+
+    Один байт на тайл (array("B")), индекс клетки = row * width + col.
+    Вопросы «твёрдая ли клетка» и «где самая верхняя непустая клетка
+    колонки» (column_top) — O(1) обращение по индексу без перебора спрайтов.
+    ground_below(x, y) идёт по колонке вниз от y (но не выше column_top),
+    то есть стоит O(числа пустых клеток до земли) — тоже без спрайтов.
+
+    Все методы принимают координаты клеток мира. origin_col/origin_row —
+    клетка мира, с которой начинается сетка (у бесконечных карт Tiled
+    она может быть отрицательной).
+    """
+
+    def __init__(self, width, height, tile_size=128, origin_col=0, origin_row=0):
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.origin_col = origin_col
+        self.origin_row = origin_row
+        self.kinds = array("B", bytes(width * height))
+        # Верхняя непустая строка в каждой колонке (-1 — колонка пустая)
+        self._column_tops = array("i", [-1] * width)
+
+    # ---------- Запись ----------
+
+    def set_kind(self, col, row, kind):
+        """Записывает тип коллизии клетки (вне карты — игнорируется)."""
+        col -= self.origin_col
+        row -= self.origin_row
+        if not (0 <= col < self.width and 0 <= row < self.height):
+            return
+        self.kinds[row * self.width + col] = kind
+
+        top = self._column_tops[col]
+        if kind != EMPTY:
+            if top == -1 or row < top:
+                self._column_tops[col] = row
+        elif row == top:
+            self._column_tops[col] = self._scan_column(col, row + 1)
+
+    def merge_kind(self, col, row, kind):
+        """Записывает тип, только если он «твёрже» уже записанного в клетке."""
+        current = self.kind_at(col, row)
+        if _KIND_PRIORITY[kind] > _KIND_PRIORITY[current]:
+            self.set_kind(col, row, kind)
+
+    def clear(self, col, row):
+        self.set_kind(col, row, EMPTY)
+
+    def load_kinds(self, data):
+        """Заполняет всю сетку готовыми байтами типов (например, из кэша уровня)."""
+        if len(data) != self.width * self.height:
+            raise ValueError(
+                f"Ожидалось {self.width * self.height} клеток, получено {len(data)}"
+            )
+        kinds = array("B")
+        kinds.frombytes(data)
+        self.kinds = kinds
+        for col in range(self.width):
+            self._column_tops[col] = self._scan_column(col, 0)
+
+    # ---------- Чтение ----------
+
+    def kind_at(self, col, row):
+        """Тип коллизии клетки; всё за пределами карты — EMPTY."""
+        col -= self.origin_col
+        row -= self.origin_row
+        if 0 <= col < self.width and 0 <= row < self.height:
+            return self.kinds[row * self.width + col]
+        return EMPTY
+
+    def kind_at_point(self, x, y):
+        """Тип коллизии клетки под точкой мира (в пикселях)."""
+        size = self.tile_size
+        return self.kind_at(int(x) // size, int(y) // size)
+
+    def is_solid(self, col, row):
+        """Полностью твёрдая клетка (блок или ящик)."""
+        kind = self.kind_at(col, row)
+        return kind == SOLID or kind == BOX
+
+    def is_collidable(self, col, row):
+        """В клетке есть хоть какая-то коллизия (включая полублоки и склоны)."""
+        return self.kind_at(col, row) != EMPTY
+
+    def column_top(self, col):
+        """Y (в пикселях) верха самой верхней непустой клетки колонки или None."""
+        col -= self.origin_col
+        if not 0 <= col < self.width:
+            return None
+        row = self._column_tops[col]
+        return None if row == -1 else (row + self.origin_row) * self.tile_size
+
+    def ground_below(self, x, y):
+        """
+        Y (в пикселях) верха первой непустой клетки в колонке x, начиная с высоты y.
+        Проходит колонку вниз от max(y, column_top): вызывается редко (при
+        разбитии ящика), поэтому таблица отрезков по колонкам не ведётся.
+        """
+        size = self.tile_size
+        col = int(x) // size - self.origin_col
+        if not 0 <= col < self.width:
+            return None
+        top = self._column_tops[col]
+        if top == -1:
+            return None
+        origin_row = self.origin_row
+        start_row = max(int(y) // size - origin_row, top)
+        # Клетка, в которой находится y, считается, только если её верх не выше y
+        if (start_row + origin_row) * size < y:
+            start_row += 1
+        row = self._scan_column(col, start_row)
+        return None if row == -1 else (row + origin_row) * size
+
+    def cells_in_rect(self, rect):
+        """Непустые клетки, которые пересекает прямоугольник: (col, row, kind)."""
+        size = self.tile_size
+        origin_col, origin_row = self.origin_col, self.origin_row
+        left = max(0, rect.left // size - origin_col)
+        top = max(0, rect.top // size - origin_row)
+        right = min(self.width - 1, (rect.right - 1) // size - origin_col)
+        bottom = min(self.height - 1, (rect.bottom - 1) // size - origin_row)
+        kinds = self.kinds
+        width = self.width
+        for row in range(top, bottom + 1):
+            base = row * width
+            for col in range(left, right + 1):
+                kind = kinds[base + col]
+                if kind != EMPTY:
+                    yield col + origin_col, row + origin_row, kind
+
+    def _scan_column(self, col, start_row):
+        # col и start_row — в координатах сетки (без origin)
+        kinds = self.kinds
+        width = self.width
+        for row in range(max(0, start_row), self.height):
+            if kinds[row * width + col] != EMPTY:
+                return row
+        return -1
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional, Optional
+from typing import Dict, List, Optional, Optional
 import json
 import os
 
@@ -36,12 +36,56 @@ class InputConfig:
     escape_to_menu: str = "ESCAPE"
 
 
+@dataclass
+class AssetsConfig:
+    # Бюджет кэша картинок asset_loader (мегабайты декодированных пикселей)
+    image_cache_mb: int = 64
+
+
+@dataclass
+class LevelConfig:
+    # Потоковая подгрузка чанков для больших/бесконечных карт
+    stream_radius: int = 2
+    stream_hysteresis: int = 1
+    stream_min_tiles: int = 40000
+    # Пакетная (NumPy) симуляция врагов включается от этого числа врагов на карте
+    batch_min_enemies: int = 500
+    # Каталог скомпилированного кэша уровней (.lvlc); пусто — пользовательский
+    # каталог кэша (game/level_cache.py DEFAULT_CACHE_DIR)
+    cache_dir: Optional[str] = None
+
+
+@dataclass
+class SimulationConfig:
+    # Частота фиксированного шага симуляции (тиков в секунду)
+    tick_rate: int = 60
+    # Максимальное время кадра, которое симуляция пытается догнать (секунды)
+    max_frame_time: float = 0.25
+    # Ограничение частоты отрисовки; 0 — без ограничения
+    fps_limit: int = 60
+
+
+@dataclass
+class LoggingConfig:
+    # Общий уровень журнала игры (game/log.py): DEBUG, INFO, WARNING, ERROR
+    level: str = "WARNING"
+    # Уровни отдельных подсистем: {"enemies": "DEBUG", ...}
+    levels: Dict[str, str] = None
+    # Файл журнала (пишется фоновым потоком); пусто — без файла
+    file: Optional[str] = None
+    console: bool = True
+
+
 @dataclass
 class GameConfig:
     video: VideoConfig
     audio: AudioConfig
     input: InputConfig
     ui: UIConfig
+    assets: AssetsConfig = None
+    level: LevelConfig = None
+    simulation: SimulationConfig = None
+    logging: LoggingConfig = None
 
 
 def load_config() -> GameConfig:
@@ -56,6 +100,10 @@ def load_config() -> GameConfig:
             audio=AudioConfig(),
             input=InputConfig(left=["LEFT", "A"], right=["RIGHT", "D"]),
             ui=UIConfig(),
+            assets=AssetsConfig(),
+            level=LevelConfig(),
+            simulation=SimulationConfig(),
+            logging=LoggingConfig(levels={}),
         )
 
     with open(CONFIG_PATH, "r", encoding="utf-8") as f:
@@ -65,6 +113,10 @@ def load_config() -> GameConfig:
     a = raw.get("audio", {})
     i = raw.get("input", {})
     u = raw.get("ui", {})
+    s = raw.get("assets", {})
+    lv = raw.get("level", {})
+    sim = raw.get("simulation", {})
+    lg = raw.get("logging", {})
 
     return GameConfig(
         video=VideoConfig(
@@ -88,4 +140,25 @@ def load_config() -> GameConfig:
             animations=u.get("animations", False),
             language=u.get("language", "ru"),
         ),
+        assets=AssetsConfig(
+            image_cache_mb=s.get("image_cache_mb", 64),
+        ),
+        level=LevelConfig(
+            stream_radius=lv.get("stream_radius", 2),
+            stream_hysteresis=lv.get("stream_hysteresis", 1),
+            stream_min_tiles=lv.get("stream_min_tiles", 40000),
+            batch_min_enemies=lv.get("batch_min_enemies", 500),
+            cache_dir=lv.get("cache_dir"),
+        ),
+        simulation=SimulationConfig(
+            tick_rate=sim.get("tick_rate", 60),
+            max_frame_time=sim.get("max_frame_time", 0.25),
+            fps_limit=sim.get("fps_limit", 60),
+        ),
+        logging=LoggingConfig(
+            level=lg.get("level", "WARNING"),
+            levels=lg.get("levels", {}),
+            file=lg.get("file"),
+            console=lg.get("console", True),
+        ),
     )
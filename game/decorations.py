@@ -1,6 +1,7 @@
 # game/decorations.py
 import pygame
 from .asset_loader import asset_loader
+from .sprite_sets import sprite_sets
 
 class Decoration(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height, decoration_type):
@@ -12,16 +13,18 @@ class Decoration(pygame.sprite.Sprite):
         # 🔥 ИСПОЛЬЗУЕМ TILESET ДЛЯ ПОЛУЧЕНИЯ ИЗОБРАЖЕНИЯ
         self.image = self.get_tile_image(decoration_type)
         if self.image:
-            self.image = pygame.transform.scale(self.image, (width, height))
+            # Тайл совпадает по размеру — общий тайл из тайлсета без копии,
+            # иначе одна масштабированная копия на (тайл, размер)
+            self.image = sprite_sets.scaled(self.image, (width, height))
         else:
             # Заглушка если тайл не найден
-            self.image = pygame.Surface((width, height))
             if decoration_type == "mushroom":
-                self.image.fill((255, 100, 100))
+                color = (255, 100, 100)
             elif decoration_type == "cactus":
-                self.image.fill((0, 200, 0))
+                color = (0, 200, 0)
             else:
-                self.image.fill((150, 150, 150))
+                color = (150, 150, 150)
+            self.image = sprite_sets.placeholder((width, height), color)
         
         self.rect = self.image.get_rect(topleft=(x, y))
     
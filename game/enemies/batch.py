@@ -0,0 +1,351 @@
+# game/enemies/batch.py
+"""
+Пакетная симуляция патрулирующих врагов на NumPy.
+
+Slime, Snail и Fly по отдельности гоняют один и тот же Python-код:
+гравитация, шаг патруля, разворот на границах. EnemyBatch хранит
+положения, скорости, направления и границы патруля всех таких врагов
+в массивах и продвигает их одним векторным шагом. Положения — float,
+поэтому медленные враги не застревают на округлении целочисленного Rect.
+
+Спрайты врагов остаются тонкими представлениями: sync() переносит в них
+положение только для врагов в области обновления уровня (их рисуют и с
+ними сталкивается игрок), а таймеры удара, неуязвимости и смерти
+по-прежнему считает сам спрайт (update_state / update_after_move).
+
+Столкновения с геометрией берутся из TileCollisionMap уровня (один
+байт на тайл) вместо перебора спрайтов платформ в
+Level.check_enemy_collisions: враг встаёт на непустую клетку под собой
+и разворачивается перед непустой клеткой впереди. Падение проверяется
+непрерывно: если за тик низ врага пересёк верх непустой клетки, он встаёт
+на неё, даже если шаг был больше клетки.
+
+numpy — необязательная зависимость: без него NUMPY_AVAILABLE == False
+и уровень обновляет врагов по одному, как раньше.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # numpy не установлен — пакетная симуляция недоступна
+    np = None
+
+from ..collision_map import EMPTY
+from ..spatial_hash import SpatialGroup
+
+NUMPY_AVAILABLE = np is not None
+
+# Правила патруля (атрибут patrol_mode у класса врага)
+PATROL_CLAMP = "clamp"  # упирается в границу и идёт обратно (Slime, Snail)
+PATROL_BOUNCE = "bounce"  # разворачивается, выйдя за границу (Fly)
+
+# Как в Level.check_enemy_collisions: враг встаёт на платформу,
+# если ушёл в неё сверху не глубже чем на столько пикселей
+LANDING_TOLERANCE = 20
+# Защита от бесконечного падения, как в Slime/Snail
+FALL_RESET_DISTANCE = 2000
+# Отступ от края уровня, у которого разворачивается Snail
+LEVEL_EDGE_MARGIN = 50
+
+DEFAULT_CAPACITY = 64
+
+
+class EnemyBatch:
+    """
+    Структура массивов (по строке на врага) и векторный шаг патруля.
+
+    Строки плотные: при удалении на место врага переезжает последний,
+    поэтому номер строки врага может меняться — снаружи врагов
+    адресуют самим спрайтом.
+    """
+
+    _FLOAT_FIELDS = (
+        "x", "y", "prev_x", "prev_y", "vx", "vy", "direction", "speed",
+        "gravity", "left", "right", "start_y", "width", "height",
+    )
+    _BOOL_FIELDS = ("active", "clamp", "edge_turn")
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if np is None:
+            raise ImportError("Для пакетной симуляции врагов нужен numpy")
+        self.size = 0
+        self.enemies = []
+        self._rows = {}
+        self.capacity = 0
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.zeros(0, dtype=np.float64))
+        for name in self._BOOL_FIELDS:
+            setattr(self, name, np.zeros(0, dtype=bool))
+        self._grow(max(1, capacity))
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, enemy):
+        return enemy in self._rows
+
+    def _fields(self):
+        return self._FLOAT_FIELDS + self._BOOL_FIELDS
+
+    def _grow(self, capacity):
+        for name in self._fields():
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    # ---------- Состав пакета ----------
+
+    def add(self, enemy):
+        """Добавляет врага (его класс должен задавать patrol_mode)."""
+        if enemy in self._rows:
+            return
+        if self.size == self.capacity:
+            self._grow(self.capacity * 2)
+        self._rows[enemy] = self.size
+        self.enemies.append(enemy)
+        self.size += 1
+        self.load(enemy)
+
+    def remove(self, enemy):
+        row = self._rows.pop(enemy, None)
+        if row is None:
+            return
+        last = self.size - 1
+        if row != last:
+            moved = self.enemies[last]
+            self.enemies[row] = moved
+            self._rows[moved] = row
+            for name in self._fields():
+                values = getattr(self, name)
+                values[row] = values[last]
+        self.enemies.pop()
+        self.size = last
+
+    def clear(self):
+        self._rows.clear()
+        self.enemies.clear()
+        self.size = 0
+
+    def load(self, enemy):
+        """(Пере)читывает строку врага из спрайта — после сброса или телепорта."""
+        row = self._rows[enemy]
+        rect = enemy.rect
+        self.x[row] = self.prev_x[row] = rect.x
+        self.y[row] = self.prev_y[row] = rect.y
+        self.width[row] = rect.width
+        self.height[row] = rect.height
+        self.vx[row] = enemy.velocity.x
+        self.vy[row] = enemy.velocity.y
+        self.direction[row] = enemy.direction
+        self.speed[row] = enemy.speed
+        self.gravity[row] = getattr(enemy, "gravity", 0.0)
+        self.left[row] = enemy.patrol_left
+        self.right[row] = enemy.patrol_right
+        self.start_y[row] = getattr(enemy, "start_y", rect.y)
+        self.clamp[row] = enemy.patrol_mode == PATROL_CLAMP
+        self.edge_turn[row] = getattr(enemy, "turns_at_level_edge", False)
+        self.active[row] = not enemy.is_dead
+
+    def deactivate(self, enemy):
+        """Останавливает врага (смерть): строка больше не двигается."""
+        row = self._rows.get(enemy)
+        if row is not None:
+            self.active[row] = False
+            self.vx[row] = 0.0
+            self.vy[row] = 0.0
+
+    def position(self, enemy):
+        """Точное (float) положение врага."""
+        row = self._rows[enemy]
+        return float(self.x[row]), float(self.y[row])
+
+    # ---------- Симуляция ----------
+
+    def step(self, dt, level):
+        """Один тик патруля всех врагов пакета."""
+        n = self.size
+        if n == 0:
+            return
+        # Срезы — представления массивов, изменения идут прямо в пакет
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        direction = self.direction[:n]
+        left, right = self.left[:n], self.right[:n]
+        width, height = self.width[:n], self.height[:n]
+        active = self.active[:n]
+        falls = self.gravity[:n] > 0
+
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+
+        # Гравитация и движение; у мёртвых скорость обнулена в deactivate()
+        vy += self.gravity[:n] * dt * active
+        vx[:] = self.speed[:n] * direction * active
+        x += vx * dt
+        y += vy * dt
+
+        # Slime/Snail упираются в границы патруля
+        clamp = active & self.clamp[:n]
+        below = clamp & (x < left)
+        above = clamp & (x > right)
+        x[below] = left[below]
+        direction[below] = 1.0
+        x[above] = right[above]
+        direction[above] = -1.0
+
+        # Fly разворачивается, выйдя за свой диапазон
+        bounce = active & ~self.clamp[:n] & ((x > right) | (x < left))
+        direction[bounce] *= -1.0
+
+        # Защита от бесконечного падения
+        fell = falls & (y > self.start_y[:n] + FALL_RESET_DISTANCE)
+        y[fell] = self.start_y[:n][fell]
+        vy[fell] = 0.0
+
+        # Snail разворачивается у краёв уровня
+        edge = active & self.edge_turn[:n] & (
+            (x + width > level.width - LEVEL_EDGE_MARGIN) | (x < LEVEL_EDGE_MARGIN)
+        )
+        direction[edge] *= -1.0
+
+        self._sweep_fall(level.collision_map, x, y, vy, width, height, active)
+        self._collide(level.collision_map, x, y, vy, direction, width, height, active)
+
+    def _sweep_fall(self, collision_map, x, y, vy, width, height, active):
+        """
+        Непрерывное падение: враг встаёт на первую непустую клетку под
+        серединой, верх которой его низ пересёк за тик (между prev_y и y).
+        """
+        n = self.size
+        size = collision_map.tile_size
+        prev_bottom = self.prev_y[:n] + height
+        bottom = y + height
+        # Строки, чей верх лежит в [prev_bottom, bottom]
+        first = np.ceil(prev_bottom / size).astype(np.int64)
+        last = np.floor(bottom / size).astype(np.int64)
+        falling = active & (vy > 0) & (last >= first)
+        if not falling.any():
+            return
+        kinds = np.frombuffer(collision_map.kinds, dtype=np.uint8)
+        center = x + width * 0.5
+        landed = np.zeros(n, dtype=bool)
+        for offset in range(int((last - first)[falling].max()) + 1):
+            row = first + offset
+            top = row * size
+            hit = (
+                falling
+                & ~landed
+                & (row <= last)
+                & (self._kinds_at(collision_map, kinds, center, top + 0.5) != EMPTY)
+            )
+            y[hit] = top[hit] - height[hit]
+            vy[hit] = 0.0
+            landed |= hit
+
+    def _collide(self, collision_map, x, y, vy, direction, width, height, active):
+        """Приземление на непустые клетки и разворот перед ними."""
+        size = collision_map.tile_size
+        kinds = np.frombuffer(collision_map.kinds, dtype=np.uint8)
+
+        # Клетка под серединой нижней грани
+        bottom = y + height
+        ground = self._kinds_at(collision_map, kinds, x + width * 0.5, bottom)
+        top = np.floor(bottom / size) * size
+        land = (
+            active
+            & (vy > 0)
+            & (ground != EMPTY)
+            & (bottom - top < LANDING_TOLERANCE)
+        )
+        y[land] = top[land] - height[land]
+        vy[land] = 0.0
+
+        # Клетка впереди на середине высоты
+        front = np.where(direction > 0, x + width, x - 1)
+        ahead = self._kinds_at(collision_map, kinds, front, y + height * 0.5)
+        direction[active & (ahead != EMPTY)] *= -1.0
+
+    @staticmethod
+    def _kinds_at(collision_map, kinds, px, py):
+        size = collision_map.tile_size
+        col = np.floor(px / size).astype(np.int64) - collision_map.origin_col
+        row = np.floor(py / size).astype(np.int64) - collision_map.origin_row
+        inside = (
+            (col >= 0) & (col < collision_map.width)
+            & (row >= 0) & (row < collision_map.height)
+        )
+        index = np.where(inside, row * collision_map.width + col, 0)
+        return np.where(inside, kinds[index], EMPTY)
+
+    # ---------- Представления ----------
+
+    def sync(self, rect, previous=None):
+        """
+        Переносит состояние врагов, пересекающих rect, в их спрайты
+        (rect, velocity, direction, facing_right) и возвращает этих врагов.
+        previous (dict) получает их положение на начало тика — для
+        интерполяции при отрисовке.
+        """
+        n = self.size
+        if n == 0:
+            return []
+        x, y = self.x[:n], self.y[:n]
+        near = np.flatnonzero(
+            (x < rect.right)
+            & (x + self.width[:n] > rect.left)
+            & (y < rect.bottom)
+            & (y + self.height[:n] > rect.top)
+        )
+        enemies = self.enemies
+        synced = []
+        for row, px, py, old_x, old_y, vx, vy, direction in zip(
+            near.tolist(),
+            x[near].tolist(),
+            y[near].tolist(),
+            self.prev_x[near].tolist(),
+            self.prev_y[near].tolist(),
+            self.vx[near].tolist(),
+            self.vy[near].tolist(),
+            self.direction[near].tolist(),
+        ):
+            enemy = enemies[row]
+            enemy.rect.topleft = (round(px), round(py))
+            if previous is not None:
+                previous[enemy] = (round(old_x), round(old_y))
+            enemy.velocity.x = vx
+            enemy.velocity.y = vy
+            enemy.direction = int(direction)
+            if vx > 0:
+                enemy.facing_right = True
+            elif vx < 0:
+                enemy.facing_right = False
+            synced.append(enemy)
+        return synced
+
+
+class EnemyGroup(SpatialGroup):
+    """
+    SpatialGroup врагов, который держит EnemyBatch в согласии с составом
+    группы: add/kill/empty добавляют и убирают строки пакета. batch=None —
+    обычная группа, враги обновляются по одному.
+    """
+
+    def __init__(self, *sprites, cell_size=128, batch=None, index=None, category=0):
+        self.batch = batch
+        super().__init__(*sprites, cell_size=cell_size, index=index, category=category)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        if self.batch is not None and getattr(sprite, "patrol_mode", None):
+            self.batch.add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        if self.batch is not None:
+            self.batch.remove(sprite)
+
+    def reload(self, sprite):
+        """Перечитывает врага в пакет после того, как его состояние сбросили снаружи."""
+        if self.batch is not None and sprite in self.batch:
+            self.batch.load(sprite)
@@ -1,25 +1,43 @@
 # game/enemies/fly.py
 import pygame
-from ..asset_loader import asset_loader
+from ..asset_loader import asset_loader, get_flipped
 from ..health import HealthComponent
+from ..log import get_logger
+from ..sprite_sets import sprite_sets
+
+log = get_logger("enemies")
+
+
+def load_fly_frames():
+    """Кадры полёта и смерти мухи (один раз на все экземпляры)"""
+    try:
+        fly = [
+            asset_loader.load_image("enemies/fly.png", 0.6),
+            asset_loader.load_image("enemies/fly_move1.png", 0.6),
+        ]
+        still = fly[0]
+    except FileNotFoundError:
+        # Заглушка если спрайты не загрузились: без кадров анимации
+        fly = []
+        still = sprite_sets.placeholder((40, 30), (200, 100, 200))  # Фиолетовый цвет
+    try:
+        dead = asset_loader.load_image("enemies/fly_dead.png", 0.6)
+    except FileNotFoundError:
+        dead = still  # Если спрайт не найден, останется живой
+    return {"fly": fly, "still": [still], "dead": [dead]}
 
 
 class Fly(pygame.sprite.Sprite):
+    # Правила патруля для пакетной симуляции (game/enemies/batch.py)
+    patrol_mode = "bounce"
+
     def __init__(self, x, y):
         super().__init__()
 
-        # Загрузка спрайтов анимации полета
-        try:
-            self.fly_frames = [
-                asset_loader.load_image("enemies/fly.png", 0.6),
-                asset_loader.load_image("enemies/fly_move1.png", 0.6),
-            ]
-            self.image = self.fly_frames[0]
-        except FileNotFoundError:
-            # Заглушка если спрайты не загрузились
-            self.fly_frames = []
-            self.image = pygame.Surface((40, 30))
-            self.image.fill((200, 100, 200))  # Фиолетовый цвет
+        # Общий на всех мух набор кадров
+        self.sprites = sprite_sets.animation("fly", load_fly_frames)
+        self.fly_frames = self.sprites.frames("fly")
+        self.image = self.sprites.frame("still")
 
         self.rect = self.image.get_rect(topleft=(x, y))
 
@@ -53,21 +71,63 @@ class Fly(pygame.sprite.Sprite):
         self.hitbox = pygame.Rect(0, 0, 30, 25)
         self.show_hitbox = True
 
-        print(f"🪰 Муха создана на позиции ({x}, {y})!")
+        log.debug("🪰 Муха создана на позиции (%s, %s)!", x, y)
+
+    def reset(self, x, y):
+        """
+        Возвращает муху в состояние только что созданной в точке (x, y).
+        Кадры не перезагружаются — так пул объектов переиспользует мух.
+        """
+        self.image = self.sprites.frame("still")
+        self.rect.topleft = (x, y)
+        self.direction = 1
+        self.velocity.update(0, 0)
+        self.facing_right = False
+        self.start_x = x
+
+        self.health_component.reset()
+        self.is_invincible = False
+        self.invincibility_timer = 0
+        self.is_dead = False
+        self.death_timer = 0
+        self.will_die_after_hurt = False
+        self.is_hurt = False
+        self.hurt_timer = 0
+
+        self.animation_timer = 0.0
+        self.animation_frame = 0
+
+    @property
+    def patrol_left(self):
+        return self.start_x
+
+    @property
+    def patrol_right(self):
+        return self.start_x + self.move_range
 
     def update(self, dt, level):
         """Обновление мухи"""
+        if not self.update_state(dt):
+            return
+        self.move(dt, level)
+        self.update_after_move(dt)
+
+    def update_state(self, dt):
+        """
+        Таймеры смерти, удара и неуязвимости.
+        Возвращает False, если в этом тике муха уже не двигается.
+        """
         if self.is_dead:
             # Во время смерти просто ждем таймер с уже установленным спрайтом смерти
             self.death_timer -= dt
             if self.death_timer <= 0:
                 self.kill()
-            return
+            return False
 
         if self.will_die_after_hurt and not self.is_hurt:
             self.die()
             self.will_die_after_hurt = False
-            return
+            return False
 
         if self.is_invincible:
             self.invincibility_timer -= dt
@@ -81,8 +141,11 @@ class Fly(pygame.sprite.Sprite):
                 if self.will_die_after_hurt:
                     self.die()
                     self.will_die_after_hurt = False
-                    return
+                    return False
+        return True
 
+    def move(self, dt, level):
+        """Полёт туда-обратно в пределах move_range от стартовой точки"""
         # Движение по горизонтали
         self.velocity.x = self.speed * self.direction
 
@@ -99,7 +162,8 @@ class Fly(pygame.sprite.Sprite):
         if self.rect.x > self.start_x + self.move_range or self.rect.x < self.start_x:
             self.direction *= -1
 
-        # Анимация машущих крыльев, только если не смерть и есть кадры
+    def update_after_move(self, dt):
+        """Анимация машущих крыльев, только если не смерть и есть кадры"""
         if not self.is_dead and self.fly_frames:
             self.animation_timer += dt * self.animation_speed
             if self.animation_timer >= 1.0:
@@ -134,12 +198,8 @@ class Fly(pygame.sprite.Sprite):
         self.death_timer = self.death_duration
         self.velocity.x = 0
 
-        # Загрузка спрайта смерти
-        try:
-            self.image = asset_loader.load_image("enemies/fly_dead.png", 0.6)
-        except FileNotFoundError:
-            # Если спрайт не найден, останется текущий
-            pass
+        # Спрайт смерти из общего набора
+        self.image = self.sprites.frame("dead")
 
     def draw(self, screen, camera):
         """Отрисовка мухи"""
@@ -147,7 +207,6 @@ class Fly(pygame.sprite.Sprite):
 
         # Отрисовка спрайта
         if self.facing_right:
-            flipped_sprite = pygame.transform.flip(self.image, True, False)
-            screen.blit(flipped_sprite, screen_rect)
+            screen.blit(get_flipped(self.image), screen_rect)
         else:
             screen.blit(self.image, screen_rect)
@@ -1,9 +1,45 @@
 import pygame
 from ..health import HealthComponent
-from ..asset_loader import asset_loader
+from ..asset_loader import asset_loader, get_flipped
+from ..colliders import sweep_step
+from ..log import get_logger
+from ..sprite_sets import sprite_sets
+
+log = get_logger("enemies")
+
+
+def load_slime_frames():
+    """Загружает 4 спрайта для анимаций слайма (один раз на все экземпляры)"""
+    try:
+        # 🎨 4 ОСНОВНЫХ СПРАЙТА
+        frames = {
+            "idle": [asset_loader.load_image("enemies/slimePurple.png", 0.6)],  # стоит
+            "move": [asset_loader.load_image("enemies/slimePurple_move.png", 0.6)],  # движется
+            "hurt": [asset_loader.load_image("enemies/slimePurple_hit.png", 0.6)],  # получил урон
+            "dead": [asset_loader.load_image("enemies/slimePurple_dead.png", 0.6)],  # умер
+        }
+        log.info("🎨 4 спрайта слайма загружены успешно!")
+        return frames
+    except Exception as e:
+        log.error("❌ Ошибка загрузки спрайтов слайма: %s", e)
+        # Заглушки если спрайты не загрузились
+        return slime_placeholder_frames()
+
+
+def slime_placeholder_frames():
+    """Простые цветные спрайты для тестирования"""
+    return {
+        "idle": [sprite_sets.placeholder((40, 30), (100, 100, 200))],  # Синий - стоит
+        "move": [sprite_sets.placeholder((40, 30), (80, 80, 180))],  # Темно-синий - движется
+        "hurt": [sprite_sets.placeholder((40, 30), (255, 100, 100))],  # Красный - получил урон
+        "dead": [sprite_sets.placeholder((40, 30), (50, 50, 50))],  # Темный - умер
+    }
 
 
 class Slime(pygame.sprite.Sprite):
+    # Правила патруля для пакетной симуляции (game/enemies/batch.py)
+    patrol_mode = "clamp"
+
     def __init__(self, x, y):
         super().__init__()
 
@@ -12,7 +48,7 @@ class Slime(pygame.sprite.Sprite):
 
         # 🔥 FIX: Ensure current_sprite is NEVER None
         if not hasattr(self, "current_sprite") or self.current_sprite is None:
-            print("⚠️ Creating placeholder sprites for slime")
+            log.warning("⚠️ Creating placeholder sprites for slime")
             self.create_placeholder_sprites()
 
         self.current_sprite = self.idle_sprite
@@ -21,7 +57,7 @@ class Slime(pygame.sprite.Sprite):
         # This ensures the sprite is visible from frame 1
         self.image = self.current_sprite
         if self.image is None:
-            print("❌ CRITICAL: Slime image is None after load_sprites!")
+            log.error("❌ CRITICAL: Slime image is None after load_sprites!")
             self.create_placeholder_sprites()
             self.current_sprite = self.idle_sprite
             self.image = self.current_sprite
@@ -86,55 +122,69 @@ class Slime(pygame.sprite.Sprite):
         self.patrol_left = x - 200
         self.patrol_right = x + 200
 
+    def reset(self, x, y):
+        """
+        Возвращает слайма в состояние только что созданного в точке (x, y).
+        Спрайты не перезагружаются — так пул объектов переиспользует слаймов.
+        """
+        self.current_state = "idle"
+        self.current_sprite = self.idle_sprite
+        self.image = self.current_sprite
+        self.animation_frame = 0
+        self.animation_timer = 0
+
+        self.is_hurt = False
+        self.hurt_timer = 0
+        self.is_invincible = False
+        self.invincibility_timer = 0
+        self.is_dead = False
+        self.death_timer = 0
+        self.will_die_after_hurt = False
+
+        self.rect.topleft = (x, y)
+        self.health_component.reset()
+        self.direction = 1
+        self.velocity.update(0, 0)
+        self.facing_right = True
+
+        self.start_x = x
+        self.start_y = y
+        self.patrol_left = x - 200
+        self.patrol_right = x + 200
+
     def load_sprites(self):
-        """Загружает 4 спрайта для анимаций слайма"""
-        try:
-            # 🎨 4 ОСНОВНЫХ СПРАЙТА
-            self.idle_sprite = asset_loader.load_image(
-                "enemies/slimePurple.png", 0.6
-            )  # стоит
-            self.move_sprite = asset_loader.load_image(
-                "enemies/slimePurple_move.png", 0.6
-            )  # движется
-            self.hurt_sprite = asset_loader.load_image(
-                "enemies/slimePurple_hit.png", 0.6
-            )  # получил урон
-            self.dead_sprite = asset_loader.load_image(
-                "enemies/slimePurple_dead.png", 0.6
-            )  # умер
-
-            print("🎨 4 спрайта слайма загружены успешно!")
-
-        except Exception as e:
-            print(f"❌ Ошибка загрузки спрайтов слайма: {e}")
-            # Заглушки если спрайты не загрузились
-            self.create_placeholder_sprites()
+        """Берёт общий на всех слаймов набор из 4 спрайтов"""
+        self.sprites = sprite_sets.animation("slime", load_slime_frames)
 
         # 🔥 FIX: Ensure current_sprite is always set
-        self.current_sprite = self.idle_sprite if hasattr(self, "idle_sprite") else None
+        self.current_sprite = self.idle_sprite
         if self.current_sprite is None:
-            print("⚠️ ВНИМАНИЕ: current_sprite is None после загрузки!")
+            log.warning("⚠️ ВНИМАНИЕ: current_sprite is None после загрузки!")
             self.create_placeholder_sprites()
             self.current_sprite = self.idle_sprite
 
     def create_placeholder_sprites(self):
-        """Создает простые спрайты для тестирования"""
-        self.idle_sprite = self.create_colored_surface((100, 100, 200))  # Синий - стоит
-        self.move_sprite = self.create_colored_surface(
-            (80, 80, 180)
-        )  # Темно-синий - движется
-        self.hurt_sprite = self.create_colored_surface(
-            (255, 100, 100)
-        )  # Красный - получил урон
-        self.dead_sprite = self.create_colored_surface((50, 50, 50))  # Темный - умер
+        """Переключает слайма на общий набор простых цветных спрайтов"""
+        self.sprites = sprite_sets.animation("slime_placeholder", slime_placeholder_frames)
         self.current_sprite = self.idle_sprite
         self.image = self.current_sprite  # ✅ ВАЖНО!
 
-    def create_colored_surface(self, color):
-        """Создает цветную поверхность для тестирования (как у fly: всегда валидный спрайт)"""
-        surf = pygame.Surface((40, 30), pygame.SRCALPHA)
-        surf.fill(color)
-        return surf
+    # Кадры общего набора: у экземпляра хранится только ссылка на набор
+    @property
+    def idle_sprite(self):
+        return self.sprites.frame("idle")
+
+    @property
+    def move_sprite(self):
+        return self.sprites.frame("move")
+
+    @property
+    def hurt_sprite(self):
+        return self.sprites.frame("hurt")
+
+    @property
+    def dead_sprite(self):
+        return self.sprites.frame("dead")
 
     def update_animation(self, dt):
         """Обновляет анимацию в зависимости от состояния"""
@@ -143,10 +193,10 @@ class Slime(pygame.sprite.Sprite):
         # Определяем текущее состояние
         if self.is_dead:
             self.current_state = "dead"
-            print(f"💀 Анимация смерти: {self.death_timer:.2f} сек осталось")
+            log.debug("💀 Анимация смерти: %.2f сек осталось", self.death_timer)
         elif self.is_hurt:
             self.current_state = "hurt"
-            print(f"💥 Анимация удара: {self.hurt_timer:.2f} сек осталось")
+            log.debug("💥 Анимация удара: %.2f сек осталось", self.hurt_timer)
         elif abs(self.velocity.x) > 0.1:  # Движется
             self.current_state = "move"
         else:
@@ -156,8 +206,8 @@ class Slime(pygame.sprite.Sprite):
         if previous_state != self.current_state:
             self.animation_frame = 0
             self.animation_timer = 0
-            print(
-                f"🔄 Смена состояния слайма: {previous_state} -> {self.current_state}"
+            log.debug(
+                "🔄 Смена состояния слайма: %s -> %s", previous_state, self.current_state
             )
 
         # 🎨 ПРОСТАЯ СИСТЕМА АНИМАЦИЙ - меняем спрайты по состоянию
@@ -186,44 +236,57 @@ class Slime(pygame.sprite.Sprite):
 
     def update(self, dt, level):
         """Обновление слайма с анимациями"""
+        if not self.update_state(dt):
+            return
+        self.move(dt, level)
+        self.update_after_move(dt)
+
+    def update_state(self, dt):
+        """
+        Таймеры смерти, удара и неуязвимости.
+        Возвращает False, если в этом тике слайм уже не двигается.
+        """
         # 💀 Если слайм мертв, обрабатываем анимацию смерти
         if self.is_dead:
             self.death_timer -= dt
             if self.death_timer <= 0:
                 self.kill()
-                print("💀 Слайм умер и удален!")
+                log.debug("💀 Слайм умер и удален!")
             else:
                 self.update_animation(dt)
-            return
+            return False
 
         # 🔥 ПРОВЕРЯЕМ НУЖНО ЛИ ЗАПУСТИТЬ СМЕРТЬ ПОСЛЕ АНИМАЦИИ УДАРА
         if self.will_die_after_hurt and not self.is_hurt:
-            print("💀 Запускаем смерть после завершения анимации удара")
+            log.debug("💀 Запускаем смерть после завершения анимации удара")
             self.die()
             self.will_die_after_hurt = False
-            return
+            return False
 
         # ⚔️ Обновляем таймер неуязвимости
         if self.is_invincible:
             self.invincibility_timer -= dt
             if self.invincibility_timer <= 0:
                 self.is_invincible = False
-                print("🛡️ Неуязвимость слайма закончилась")
+                log.debug("🛡️ Неуязвимость слайма закончилась")
 
         # 🎨 Обновляем анимацию получения урона
         if self.is_hurt:
             self.hurt_timer -= dt
             if self.hurt_timer <= 0:
                 self.is_hurt = False
-                print("🎨 Анимация удара завершена")
+                log.debug("🎨 Анимация удара завершена")
                 if self.will_die_after_hurt:
-                    print(
+                    log.debug(
                         "💀 Немедленно запускаем смерть после завершения анимации удара"
                     )
                     self.die()
                     self.will_die_after_hurt = False
-                    return
+                    return False
+        return True
 
+    def move(self, dt, level):
+        """Патруль: гравитация, движение и разворот на границах патруля"""
         # Применяем гравитацию
         self.velocity.y += self.gravity * dt
 
@@ -233,9 +296,15 @@ class Slime(pygame.sprite.Sprite):
         # Сохраняем старую позицию
         old_x, old_y = self.rect.x, self.rect.y
 
-        # Движение
+        # Движение; падающий слайм встаёт на первую встреченную платформу уровня
         self.rect.x += self.velocity.x * dt
-        self.rect.y += self.velocity.y * dt
+        dy = self.velocity.y * dt
+        colliders = getattr(level, "colliders", None)
+        if colliders is not None:
+            # Как у игрока: шаг заходит в платформу на SWEEP_SKIN, и касание
+            # пола разрешает Level.check_enemy_collisions
+            dy = sweep_step(colliders, self.rect, dy)
+        self.rect.y += dy
 
         # Ограничиваем патруль по X
         if self.rect.x < self.patrol_left:
@@ -249,7 +318,7 @@ class Slime(pygame.sprite.Sprite):
         if self.rect.y > self.start_y + 2000:
             self.rect.y = self.start_y
             self.velocity.y = 0
-            print("⚠️ Slime position clamped to prevent flying away")
+            log.warning("⚠️ Slime position clamped to prevent flying away")
 
         # Обновляем направление взгляда
         if self.velocity.x > 0:
@@ -257,6 +326,8 @@ class Slime(pygame.sprite.Sprite):
         elif self.velocity.x < 0:
             self.facing_right = False
 
+    def update_after_move(self, dt):
+        """Здоровье и анимация после перемещения"""
         # Обновление здоровья
         self.health_component.update(dt)
 
@@ -267,16 +338,17 @@ class Slime(pygame.sprite.Sprite):
         """Получение урона с анимацией и неуязвимостью"""
         # 🔥 ПРОВЕРЯЕМ НЕУЯЗВИМОСТЬ
         if self.is_invincible:
-            print("🛡️ Слайм неуязвим, урон заблокирован")
+            log.debug("🛡️ Слайм неуязвим, урон заблокирован")
             return False
         if self.is_dead:
-            print("💀 Слайм уже мертв, урон невозможен")
+            log.debug("💀 Слайм уже мертв, урон невозможен")
             return False
 
         damaged = self.health_component.take_damage(amount)
         if damaged:
-            print(
-                f"💥 Слайм получил {amount} урона! Осталось HP: {self.health_component.current_health}"
+            log.debug(
+                "💥 Слайм получил %s урона! Осталось HP: %s",
+                amount, self.health_component.current_health,
             )
 
             # 🎨 Включаем анимацию получения урона
@@ -294,13 +366,13 @@ class Slime(pygame.sprite.Sprite):
 
             # 💀 ПРОВЕРКА СМЕРТИ - но НЕ запускаем смерть сразу
             if self.health_component.is_dead():
-                print(
+                log.debug(
                     "💀 Слайм получил смертельный урон, но сначала покажем анимацию удара"
                 )
                 # 🔥 УСТАНАВЛИВАЕМ ФЛАГ ЧТО СЛАЙМ УМРЕТ ПОСЛЕ АНИМАЦИИ УДАРА
                 self.will_die_after_hurt = True
             else:
-                print("🎨 Слайм получил урон, но выжил")
+                log.debug("🎨 Слайм получил урон, но выжил")
 
         return damaged
 
@@ -311,7 +383,7 @@ class Slime(pygame.sprite.Sprite):
         self.velocity.x = 0
         self.velocity.y = 0
 
-        print(f"💀 Запущена анимация смерти на {self.death_duration} секунд")
+        log.debug("💀 Запущена анимация смерти на %s секунд", self.death_duration)
 
     def draw(self, screen, camera):
         """Отрисовка слайма"""
@@ -321,8 +393,7 @@ class Slime(pygame.sprite.Sprite):
         # Отрисовка спрайта
         if self.current_sprite:
             if not self.facing_right:
-                flipped_sprite = pygame.transform.flip(self.current_sprite, True, False)
-                screen.blit(flipped_sprite, (screen_x, screen_y))
+                screen.blit(get_flipped(self.current_sprite), (screen_x, screen_y))
             else:
                 screen.blit(self.current_sprite, (screen_x, screen_y))
         else:
@@ -1,31 +1,47 @@
 # game/enemies/snail.py
 import pygame
-from ..asset_loader import asset_loader
+from ..asset_loader import asset_loader, get_flipped
+from ..colliders import sweep_step
 from ..health import HealthComponent
+from ..log import get_logger
+from ..sprite_sets import sprite_sets
+
+log = get_logger("enemies")
+
+
+def load_snail_frames():
+    """Спрайты улитки и её раковины (один раз на все экземпляры)"""
+    try:
+        walk = asset_loader.load_image("enemies/snail.png", 0.6)
+        log.info("✅ Спрайт улитки загружен: %s", walk)
+    except FileNotFoundError as e:
+        log.warning("⚠️ Спрайт улитки не найден: %s", e)
+        # Заглушка если спрайт не загрузился
+        walk = sprite_sets.placeholder((40, 30), (150, 75, 0))  # Коричневый цвет
+    try:
+        shell = asset_loader.load_image("enemies/snail_shell.png", 0.6)
+    except FileNotFoundError:
+        shell = walk  # Если спрайт не найден, останется живой
+    return {"walk": [walk], "shell": [shell]}
 
 
 class Snail(pygame.sprite.Sprite):
+    # Правила патруля для пакетной симуляции (game/enemies/batch.py)
+    patrol_mode = "clamp"
+    turns_at_level_edge = True
+
     def __init__(self, x, y):
         super().__init__()
 
-        # Загрузка спрайта
-        try:
-            self.image = asset_loader.load_image("enemies/snail.png", 0.6)
-            print(f"✅ Спрайт улитки загружен: {self.image}")
-        except FileNotFoundError as e:
-            print(f"⚠️ Спрайт улитки не найден: {e}")
-            # Заглушка если спрайт не загрузился
-            self.image = pygame.Surface((40, 30))
-            self.image.fill((150, 75, 0))  # Коричневый цвет
+        # Общий на всех улиток набор спрайтов
+        self.sprites = sprite_sets.animation("snail", load_snail_frames)
+        self.image = self.sprites.frame("walk")
 
         if self.image is None:
-            print("❌ КРИТИЧНО: self.image is None для улитки!")
-            self.image = pygame.Surface((40, 30))
-            self.image.fill((150, 75, 0))
+            log.error("❌ КРИТИЧНО: self.image is None для улитки!")
+            self.image = sprite_sets.placeholder((40, 30), (150, 75, 0))
 
-        print(
-            f"📍 Улитка создана: image={self.image}, size={self.image.get_size() if self.image else 'None'}"
-        )
+        log.debug("📍 Улитка создана: image=%s, size=%s", self.image, self.image.get_size())
         self.rect = self.image.get_rect(topleft=(x, y))
 
         # Физика и AI (как у Slime/Fly по структуре)
@@ -58,53 +74,98 @@ class Snail(pygame.sprite.Sprite):
         self.hitbox = pygame.Rect(0, 0, 30, 25)
         self.show_hitbox = True
 
-        print(f"🐌 Улитка создана на позиции ({x}, {y})!")
+        log.debug("🐌 Улитка создана на позиции (%s, %s)!", x, y)
+
+    def reset(self, x, y):
+        """
+        Возвращает улитку в состояние только что созданной в точке (x, y).
+        Спрайт не перезагружается — так пул объектов переиспользует улиток.
+        """
+        self.image = self.sprites.frame("walk")
+        self.rect.topleft = (x, y)
+        self.direction = 1
+        self.velocity.update(0, 0)
+        self.facing_right = False
+
+        self.start_x = x
+        self.start_y = y
+        self.patrol_left = x - 200
+        self.patrol_right = x + 200
+
+        self.health_component.reset()
+        self.is_invincible = False
+        self.invincibility_timer = 0
+        self.is_dead = False
+        self.death_timer = 0
+        self.will_die_after_hurt = False
+        self.is_hurt = False
+        self.hurt_timer = 0
 
     def update(self, dt, level):
         """Обновление улитки"""
+        if not self.update_state(dt):
+            return
+        self.move(dt, level)
+        self.update_after_move(dt)
+
+    def update_state(self, dt):
+        """
+        Таймеры смерти, удара и неуязвимости.
+        Возвращает False, если в этом тике улитка уже не двигается.
+        """
         if self.is_dead:
             self.death_timer -= dt
             if self.death_timer <= 0:
                 self.kill()
-                print("💀 Улитка умерла и удалена!")
-            return
+                log.debug("💀 Улитка умерла и удалена!")
+            return False
 
         # 🔥 ПРОВЕРЯЕМ НУЖНО ЛИ ЗАПУСТИТЬ СМЕРТЬ ПОСЛЕ АНИМАЦИИ УДАРА
         if self.will_die_after_hurt and not self.is_hurt:
-            print("💀 Запускаем смерть после завершения анимации удара")
+            log.debug("💀 Запускаем смерть после завершения анимации удара")
             self.die()
             self.will_die_after_hurt = False
-            return
+            return False
 
         # ⚔️ Обновляем таймер неуязвимости
         if self.is_invincible:
             self.invincibility_timer -= dt
             if self.invincibility_timer <= 0:
                 self.is_invincible = False
-                print("🛡️ Неуязвимость слайма закончилась")
+                log.debug("🛡️ Неуязвимость улитки закончилась")
 
         # 🎨 Обновляем анимацию получения урона
         if self.is_hurt:
             self.hurt_timer -= dt
             if self.hurt_timer <= 0:
                 self.is_hurt = False
-                print("🎨 Анимация удара завершена")
+                log.debug("🎨 Анимация удара завершена")
                 if self.will_die_after_hurt:
-                    print(
+                    log.debug(
                         "💀 Немедленно запускаем смерть после завершения анимации удара"
                     )
                     self.die()
                     self.will_die_after_hurt = False
-                    return
+                    return False
+        return True
+
+    def move(self, dt, level):
+        """Патруль: гравитация, движение и разворот на границах патруля и уровня"""
         # Применяем гравитацию
         self.velocity.y += self.gravity * dt
 
         # Движение по горизонтали
         self.velocity.x = self.speed * self.direction
 
-        # Применяем движение
+        # Применяем движение; падающая улитка встаёт на первую встреченную платформу уровня
         self.rect.x += self.velocity.x * dt
-        self.rect.y += self.velocity.y * dt
+        dy = self.velocity.y * dt
+        colliders = getattr(level, "colliders", None)
+        if colliders is not None:
+            # Как у игрока: шаг заходит в платформу на SWEEP_SKIN, и касание
+            # пола разрешает Level.check_enemy_collisions
+            dy = sweep_step(colliders, self.rect, dy)
+        self.rect.y += dy
 
         # Ограничиваем патруль по X
         if self.rect.x < self.patrol_left:
@@ -118,7 +179,7 @@ class Snail(pygame.sprite.Sprite):
         if self.rect.y > self.start_y + 2000:
             self.rect.y = self.start_y
             self.velocity.y = 0
-            print("⚠️ Snail position clamped to prevent flying/falling away")
+            log.warning("⚠️ Snail position clamped to prevent flying/falling away")
 
         # Обновляем направление
         if self.velocity.x > 0:
@@ -131,7 +192,8 @@ class Snail(pygame.sprite.Sprite):
         if self.rect.right > level_width - 50 or self.rect.left < 50:
             self.direction *= -1
 
-        # Обновление здоровья
+    def update_after_move(self, dt):
+        """Здоровье после перемещения"""
         self.health_component.update(dt)
 
     def take_damage(self, amount):
@@ -145,8 +207,9 @@ class Snail(pygame.sprite.Sprite):
 
         damaged = self.health_component.take_damage(amount)
         if damaged:
-            print(
-                f"💥 Улитка получила {amount} урона! Осталось HP: {self.health_component.current_health}"
+            log.debug(
+                "💥 Улитка получила %s урона! Осталось HP: %s",
+                amount, self.health_component.current_health,
             )
 
             # ⚔️ Включаем неуязвимость
@@ -155,13 +218,13 @@ class Snail(pygame.sprite.Sprite):
 
             # 💀 ПРОВЕРКА СМЕРТИ - но НЕ запускаем смерть сразу
             if self.health_component.is_dead():
-                print(
-                    "💀 Слайм получил смертельный урон, но сначала покажем анимацию удара"
+                log.debug(
+                    "💀 Улитка получила смертельный урон, но сначала покажем анимацию удара"
                 )
                 # 🔥 УСТАНАВЛИВАЕМ ФЛАГ ЧТО СЛАЙМ УМРЕТ ПОСЛЕ АНИМАЦИИ УДАРА
                 self.will_die_after_hurt = True
             else:
-                print("🎨 Слайм получил урон, но выжил")
+                log.debug("🎨 Улитка получила урон, но выжила")
 
         return damaged
 
@@ -171,11 +234,8 @@ class Snail(pygame.sprite.Sprite):
         self.death_timer = self.death_duration
         self.velocity.x = 0
         self.velocity.y = 0
-        # Загрузка спрайта смерти
-        try:
-            self.image = asset_loader.load_image("enemies/snail_shell.png", 0.6)
-        except FileNotFoundError:
-            pass  # Если спрайт не найден, останется старый
+        # Спрайт смерти — раковина из общего набора
+        self.image = self.sprites.frame("shell")
 
     def draw(self, screen, camera):
         """Отрисовка улитки"""
@@ -183,7 +243,6 @@ class Snail(pygame.sprite.Sprite):
 
         # Отрисовка спрайта
         if self.facing_right:
-            flipped_sprite = pygame.transform.flip(self.image, True, False)
-            screen.blit(flipped_sprite, screen_rect)
+            screen.blit(get_flipped(self.image), screen_rect)
         else:
             screen.blit(self.image, screen_rect)
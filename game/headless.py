@@ -0,0 +1,204 @@
+# game/headless.py
+"""
+Headless-режим: симуляция уровня без окна, отрисовки и ограничения FPS.
+
+Уровень, игрок и враги шагают тем же Level.tick, что и в окне игры, но
+тики идут подряд так быстро, как позволяет процессор. Ввод берётся из
+ScriptedInput. Нужен для замеров производительности в CI, ботов и
+массовой проверки уровней на серверах без дисплея.
+
+Запуск:
+    python main.py --headless --ticks 3600 --script "right:240,right+jump:1,right:120"
+    python -m game.headless --level level1 --ticks 600 --output report.json
+"""
+
+import argparse
+import bisect
+import json
+import os
+import time
+from collections import defaultdict
+
+import pygame
+
+# Действия сценария и клавиши, которыми их видит Player
+ACTION_KEYS = {
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+    "jump": pygame.K_SPACE,
+}
+IDLE = "idle"
+
+
+class ScriptedInput:
+    """
+    Заранее записанный ввод: отрезки (число тиков, набор действий).
+
+    Действия держатся весь отрезок; прыжок срабатывает в первый тик отрезка,
+    где "jump" появился (как нажатие клавиши). loop=True повторяет сценарий,
+    иначе после конца игрок стоит на месте.
+    """
+
+    def __init__(self, segments, loop=False):
+        self.segments = []
+        for ticks, actions in segments:
+            actions = frozenset(a for a in actions if a != IDLE)
+            unknown = actions - ACTION_KEYS.keys()
+            if unknown:
+                raise ValueError(f"Неизвестные действия в сценарии: {sorted(unknown)}")
+            self.segments.append((int(ticks), actions))
+        self.loop = loop
+
+        # Тик начала каждого отрезка — для поиска отрезка по номеру тика
+        self._starts = []
+        total = 0
+        for ticks, _ in self.segments:
+            self._starts.append(total)
+            total += ticks
+        self.total_ticks = total
+
+    @classmethod
+    def parse(cls, text, loop=False):
+        """Разбирает сценарий вида "right:120,right+jump:1,idle:60"."""
+        segments = []
+        for part in text.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            actions, _, ticks = part.rpartition(":")
+            if not actions:
+                raise ValueError(f"Ожидался отрезок вида 'действия:тики', получено {part!r}")
+            segments.append((int(ticks), actions.split("+")))
+        return cls(segments, loop=loop)
+
+    def actions_at(self, tick):
+        if self.total_ticks == 0:
+            return frozenset()
+        if tick >= self.total_ticks:
+            if not self.loop:
+                return frozenset()
+            tick %= self.total_ticks
+        index = bisect.bisect_right(self._starts, tick) - 1
+        return self.segments[index][1]
+
+    def keys_at(self, tick):
+        """Состояние клавиш в формате pygame.key.get_pressed()."""
+        keys = defaultdict(bool)
+        for action in self.actions_at(tick):
+            keys[ACTION_KEYS[action]] = True
+        return keys
+
+    def pressed_at(self, tick):
+        """Действия, которые начались именно в этом тике."""
+        current = self.actions_at(tick)
+        if tick == 0:
+            return current
+        return current - self.actions_at(tick - 1)
+
+
+def run_headless(level_name="level1", ticks=3600, script=None, tick_rate=60,
+                 stop_on_complete=True, level_kwargs=None):
+    """
+    Прогоняет уровень ticks тиков без отрисовки и возвращает отчёт (dict):
+    число тиков, время, тиков в секунду и итоговое состояние игрока.
+    """
+    # Окно не нужно, но convert_alpha() при загрузке спрайтов требует
+    # режим дисплея — берём dummy-драйвер SDL и поверхность 1x1
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+    from .levels.level1 import Level
+    from .player import Player
+
+    load_start = time.perf_counter()
+    level = Level(level_name, **(level_kwargs or {}))
+    player = Player(0, 0)
+    level.set_player(player)
+    load_seconds = time.perf_counter() - load_start
+
+    script = script or ScriptedInput([])
+    dt = 1.0 / tick_rate
+    jump_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+    deaths = 0
+
+    simulated = 0
+    start = time.perf_counter()
+    for tick in range(ticks):
+        if "jump" in script.pressed_at(tick):
+            player.handle_event(jump_event)
+        was_alive = player.is_alive
+        level.tick(script.keys_at(tick), dt, tick * dt)
+        simulated += 1
+        if was_alive and not player.is_alive:
+            deaths += 1
+        if stop_on_complete and level.completed:
+            break
+    seconds = time.perf_counter() - start
+
+    return {
+        "level": level_name,
+        "ticks": simulated,
+        "tick_rate": tick_rate,
+        "simulated_seconds": simulated * dt,
+        "load_seconds": load_seconds,
+        "seconds": seconds,
+        "ticks_per_second": simulated / seconds if seconds > 0 else float("inf"),
+        "player": list(player.rect.topleft),
+        "alive": player.is_alive,
+        "deaths": deaths,
+        "coins": player.coins,
+        "completed": level.completed,
+    }
+
+
+def main(argv=None):
+    from .config import load_config
+
+    parser = argparse.ArgumentParser(description="Headless-симуляция уровня")
+    parser.add_argument("--headless", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--level", default="level1")
+    parser.add_argument("--ticks", type=int, default=3600)
+    parser.add_argument("--script", default="", help='например "right:120,right+jump:1"')
+    parser.add_argument("--loop", action="store_true", help="повторять сценарий")
+    parser.add_argument("--tick-rate", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="вывести отчёт в JSON")
+    parser.add_argument("--output", default=None, help="записать JSON-отчёт в файл")
+    args = parser.parse_args(argv)
+
+    from .level_cache import DEFAULT_CACHE_DIR
+
+    config = load_config()
+    tick_rate = args.tick_rate or config.simulation.tick_rate
+    report = run_headless(
+        level_name=args.level,
+        ticks=args.ticks,
+        script=ScriptedInput.parse(args.script, loop=args.loop),
+        tick_rate=tick_rate,
+        level_kwargs={"cache_dir": config.level.cache_dir or DEFAULT_CACHE_DIR},
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(
+            f"🤖 {report['level']}: {report['ticks']} тиков за {report['seconds']:.3f} с "
+            f"— {report['ticks_per_second']:.0f} тиков/с "
+            f"(x{report['ticks_per_second'] / tick_rate:.1f} к реальному времени)"
+        )
+        print(
+            f"  - Игрок: {tuple(report['player'])}, жив: {report['alive']}, "
+            f"смертей: {report['deaths']}, монет: {report['coins']}, "
+            f"уровень пройден: {report['completed']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,6 +13,12 @@ class HealthComponent:
             return True
         return False
     
+    def reset(self):
+        """Полное здоровье без неуязвимости (для переиспользования из пула)"""
+        self.current_health = self.max_health
+        self.invulnerable = False
+        self.invulnerability_timer = 0
+
     def heal(self, amount):
         self.current_health = min(self.max_health, self.current_health + amount)
     
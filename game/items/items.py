@@ -1,6 +1,18 @@
 # game/items/item.py
 import pygame
-from ..asset_loader import asset_loader
+from ..sprite_sets import sprite_sets
+
+# Картинка каждого типа предмета и цвет заглушки, если картинки нет
+ITEM_IMAGES = {
+    "coin": "Hud/hudCoin.png",
+    "key_yellow": "Hud/hudKey_yellow.png",
+    "jewel_blue": "Hud/hudJewel_blue.png",
+}
+ITEM_PLACEHOLDER_COLORS = {
+    "coin": (255, 255, 0),
+    "key_yellow": (255, 255, 0),
+    "jewel_blue": (0, 0, 255),
+}
 
 
 class Item(pygame.sprite.Sprite):
@@ -17,25 +29,29 @@ class Item(pygame.sprite.Sprite):
         self.fall_speed = 0.0
         self.fall_gravity = 1200.0
 
-        # Загрузка спрайта
+        self.image = self.load_image(width, height)
+
+    def load_image(self, width, height):
+        """Общая на все предметы этого типа и размера картинка (или заглушка)"""
         try:
-            if item_type == "coin":
-                self.image = asset_loader.load_image("Hud/hudCoin.png", scale=1)
-            elif item_type == "key_yellow":
-                self.image = asset_loader.load_image("Hud/hudKey_yellow.png", scale=1)
-            elif item_type == "jewel_blue":
-                self.image = asset_loader.load_image("Hud/hudJewel_blue.png", scale=1)
-
-            self.image = pygame.transform.scale(self.image, (width, height))
-        except:
+            return sprite_sets.image(ITEM_IMAGES[self.item_type], size=(width, height))
+        except (pygame.error, OSError, KeyError):
             # Заглушки
-            self.image = pygame.Surface((width, height))
-            if item_type == "coin":
-                self.image.fill((255, 255, 0))
-            elif item_type == "key_yellow":
-                self.image.fill((255, 255, 0))
-            elif item_type == "jewel_blue":
-                self.image.fill((0, 0, 255))
+            color = ITEM_PLACEHOLDER_COLORS.get(self.item_type, (0, 0, 0))
+            return sprite_sets.placeholder((width, height), color)
+
+    def reset(self, x, y, width, height):
+        """
+        Возвращает предмет того же типа в исходное состояние на новом месте
+        (для пула объектов). Картинка меняется, только если сменился размер.
+        """
+        if (width, height) != self.rect.size:
+            self.image = self.load_image(width, height)
+        self.rect = pygame.Rect(x, y, width, height)
+        self.collected = False
+        self.collectible = True
+        self.fall_to_ground_y = None
+        self.fall_speed = 0.0
 
     def collect(self):
         """Собирает предмет и возвращает его тип"""
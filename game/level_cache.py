@@ -0,0 +1,394 @@
+# game/level_cache.py
+"""
+Скомпилированный бинарный кэш уровня.
+
+При первой загрузке TMX уровень сохраняется в .lvlc: сетки GID всех слоёв,
+готовая карта коллизий, таблица объектов и ссылки на tilesets. Имя файла
+содержит sha1 исходного TMX и отпечатка соответствия GID -> тип коллизии
+(его даёт уровень, см. Level.collision_fingerprint), поэтому и правка карты,
+и правка этого соответствия в коде делают старый кэш неактуальным. Повторные загрузки открывают файл через mmap:
+слои тайлов — это memoryview прямо в отображённый файл, без разбора XML
+и без копирования.
+
+Формат (little-endian):
+    заголовок  <4sHH20sIIIIIIIii  magic, версия, флаги, sha1, размеры карты, число
+                                 tilesets / слоёв / групп объектов, начало карты
+    свойства карты (json-строка)
+    tilesets   по записи на tileset
+    слои       заголовок слоя, выравнивание до 4 байт, затем плотная сетка
+               width*height * uint32 или разреженные тройки (col, row, gid) * int32
+    коллизии   <III + width*height байт типов коллизий
+    объекты    группы и их объекты
+"""
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+
+from .tmx_loader import (
+    GID_TYPECODE,
+    MapObject,
+    ObjectGroup,
+    SparseTileLayer,
+    TileLayer,
+    TileMap,
+    Tileset,
+)
+from .log import get_logger
+from .path_utils import user_cache_dir
+
+log = get_logger("level")
+
+MAGIC = b"LVLC"
+FORMAT_VERSION = 2
+# Флаги заголовка
+FLAG_INFINITE = 1
+# Способ хранения слоя
+LAYER_DENSE = 0
+LAYER_SPARSE = 1
+# Кэш — в пользовательском каталоге: рядом с исходниками он попал бы во
+# временную папку распаковки PyInstaller и собирался бы заново при каждом запуске.
+# Другой каталог задаётся в config.json (level.cache_dir)
+DEFAULT_CACHE_DIR = user_cache_dir("level_cache")
+
+_HEADER = struct.Struct("<4sHH20sIIIIIIIii")
+_TILESET = struct.Struct("<IIIIIIIII")
+_LAYER = struct.Struct("<iIIBB")
+_SPARSE_COUNT = struct.Struct("<I")
+_COLLISION = struct.Struct("<III")
+_GROUP = struct.Struct("<iI")
+_OBJECT = struct.Struct("<iIdddd")
+_STR_LEN = struct.Struct("<H")
+
+
+def source_digest(tmx_path, fingerprint=b""):
+    """
+    sha1 исходного TMX (с учётом версии формата кэша). fingerprint — байты
+    всего, от чего кроме TMX зависит запечённая карта коллизий.
+    """
+    sha = hashlib.sha1()
+    sha.update(MAGIC + FORMAT_VERSION.to_bytes(2, "little"))
+    sha.update(len(fingerprint).to_bytes(4, "little") + fingerprint)
+    with open(tmx_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            sha.update(block)
+    return sha.digest()
+
+
+def _cache_stem(tmx_path):
+    return os.path.splitext(os.path.basename(tmx_path))[0]
+
+
+def cache_path_for(tmx_path, digest, cache_dir=DEFAULT_CACHE_DIR):
+    return os.path.join(cache_dir, f"{_cache_stem(tmx_path)}.{digest.hex()[:16]}.lvlc")
+
+
+class CompiledLevel:
+    """Уровень, открытый из .lvlc (держит mmap, пока жив tile_map)."""
+
+    def __init__(self, path, tile_map, collision_kinds, collision_tile_size, mapped):
+        self.path = path
+        self.tile_map = tile_map
+        self.collision_kinds = collision_kinds
+        self.collision_tile_size = collision_tile_size
+        self._mmap = mapped
+
+
+# ---------- Запись ----------
+
+
+def _pack_str(value):
+    data = (value or "").encode("utf-8")
+    return _STR_LEN.pack(len(data)) + data
+
+
+def _pack_props(properties):
+    return _pack_str(json.dumps(properties or {}, ensure_ascii=False))
+
+
+def _pad(parts, size):
+    """Дополняет нулями до кратного 4 смещения."""
+    padding = -size % 4
+    if padding:
+        parts.append(bytes(padding))
+    return size + padding
+
+
+def compile_level(tile_map, collision_map, digest):
+    """Собирает байты .lvlc из разобранной карты и готовой карты коллизий."""
+    parts = [
+        _HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            FLAG_INFINITE if tile_map.infinite else 0,
+            digest,
+            tile_map.width,
+            tile_map.height,
+            tile_map.tilewidth,
+            tile_map.tileheight,
+            len(tile_map.tilesets),
+            len(tile_map.layers),
+            len(tile_map.object_groups),
+            tile_map.origin_col,
+            tile_map.origin_row,
+        ),
+        _pack_props(tile_map.properties),
+    ]
+
+    for tileset in tile_map.tilesets:
+        parts.append(
+            _TILESET.pack(
+                tileset.firstgid,
+                tileset.tilewidth,
+                tileset.tileheight,
+                tileset.tilecount,
+                tileset.columns,
+                tileset.margin,
+                tileset.spacing,
+                tileset.image_width,
+                tileset.image_height,
+            )
+        )
+        parts.append(_pack_str(tileset.name))
+        parts.append(_pack_str(tileset.image))
+        parts.append(_pack_props(tileset.properties))
+
+    size = sum(len(part) for part in parts)
+    for layer in tile_map.layers:
+        sparse = isinstance(layer, SparseTileLayer)
+        header = (
+            _LAYER.pack(
+                layer.id,
+                layer.width,
+                layer.height,
+                int(layer.visible),
+                LAYER_SPARSE if sparse else LAYER_DENSE,
+            )
+            + _pack_str(layer.name)
+            + _pack_props(layer.properties)
+        )
+        parts.append(header)
+        size = _pad(parts, size + len(header))
+        if sparse:
+            cells = array("i")
+            for col, row, gid in layer.tiles():
+                cells.extend((col, row, gid))
+            prefix = _SPARSE_COUNT.pack(layer.tile_count)
+            parts.append(prefix)
+            size += len(prefix)
+            gids = cells
+        else:
+            gids = array(GID_TYPECODE, layer.gids)
+        if sys.byteorder == "big":
+            gids.byteswap()
+        data = gids.tobytes()
+        parts.append(data)
+        size += len(data)
+
+    kinds = collision_map.kinds.tobytes()
+    parts.append(
+        _COLLISION.pack(collision_map.width, collision_map.height, collision_map.tile_size)
+    )
+    parts.append(kinds)
+
+    for group in tile_map.object_groups:
+        parts.append(_GROUP.pack(group.id, len(group.objects)))
+        parts.append(_pack_str(group.name))
+        parts.append(_pack_props(group.properties))
+        for obj in group.objects:
+            parts.append(_OBJECT.pack(obj.id, obj.gid, obj.x, obj.y, obj.width, obj.height))
+            parts.append(_pack_str(obj.name))
+            parts.append(_pack_str(obj.type))
+            parts.append(_pack_props(obj.properties))
+
+    return b"".join(parts)
+
+
+def write_compiled(tmx_path, tile_map, collision_map, cache_dir=DEFAULT_CACHE_DIR, fingerprint=b""):
+    """
+    Сохраняет скомпилированный уровень рядом с другими кэшами.
+
+    Пишет во временный файл и переименовывает, чтобы не оставить
+    полузаписанный кэш. Ошибки записи не критичны — возвращается None.
+    """
+    try:
+        digest = source_digest(tmx_path, fingerprint)
+        path = cache_path_for(tmx_path, digest, cache_dir)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(compile_level(tile_map, collision_map, digest))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log.warning("⚠️ Не удалось сохранить кэш уровня: %s", e)
+        return None
+
+    # Старые версии того же уровня больше не нужны: «<stem>.<16 hex>.lvlc»
+    # с тем же stem, что у cache_path_for (level1.tmx не трогает level1.v2.*)
+    own_cache = re.compile(re.escape(_cache_stem(tmx_path)) + r"\.[0-9a-f]{16}\.lvlc")
+    for entry in os.listdir(cache_dir):
+        stale = os.path.join(cache_dir, entry)
+        if own_cache.fullmatch(entry) and stale != path:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass  # файл может быть открыт другим процессом
+    log.info("💾 Кэш уровня сохранён: %s", path)
+    return path
+
+
+# ---------- Чтение ----------
+
+
+class _Reader:
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+        self.offset = 0
+
+    def unpack(self, fmt):
+        values = fmt.unpack_from(self.buffer, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def string(self):
+        (length,) = self.unpack(_STR_LEN)
+        start = self.offset
+        self.offset += length
+        return bytes(self.view[start:self.offset]).decode("utf-8")
+
+    def props(self):
+        return json.loads(self.string())
+
+    def align(self):
+        self.offset += -self.offset % 4
+
+    def take(self, size):
+        start = self.offset
+        self.offset += size
+        if self.offset > len(self.buffer):
+            raise ValueError("Файл кэша обрезан")
+        return self.view[start:self.offset]
+
+
+def read_compiled(buffer, digest=None):
+    """Разбирает байты .lvlc. Возвращает (tile_map, collision_kinds, tile_size)."""
+    reader = _Reader(buffer)
+    (
+        magic,
+        version,
+        flags,
+        file_digest,
+        width,
+        height,
+        tilewidth,
+        tileheight,
+        tileset_count,
+        layer_count,
+        group_count,
+        origin_col,
+        origin_row,
+    ) = reader.unpack(_HEADER)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Неизвестный формат кэша уровня")
+    if digest is not None and file_digest != digest:
+        raise ValueError("Кэш уровня собран из другой версии TMX")
+
+    tile_map = TileMap(width, height, tilewidth, tileheight)
+    tile_map.infinite = bool(flags & FLAG_INFINITE)
+    tile_map.origin_col = origin_col
+    tile_map.origin_row = origin_row
+    tile_map.properties = reader.props()
+
+    for _ in range(tileset_count):
+        (firstgid, tw, th, tilecount, columns, margin, spacing, image_w, image_h) = (
+            reader.unpack(_TILESET)
+        )
+        tileset = Tileset(
+            firstgid, reader.string(), tw, th, tilecount, columns, margin, spacing,
+        )
+        tileset.image = reader.string() or None
+        tileset.image_width = image_w
+        tileset.image_height = image_h
+        tileset.properties = reader.props()
+        tile_map.tilesets.append(tileset)
+
+    for _ in range(layer_count):
+        layer_id, layer_w, layer_h, visible, storage = reader.unpack(_LAYER)
+        name = reader.string()
+        properties = reader.props()
+        reader.align()
+        if storage == LAYER_SPARSE:
+            (count,) = reader.unpack(_SPARSE_COUNT)
+            cells = array("i", bytes(reader.take(count * 12)))
+            if sys.byteorder == "big":
+                cells.byteswap()
+            layer = SparseTileLayer(name, layer_w, layer_h, layer_id, bool(visible))
+            for index in range(0, len(cells), 3):
+                layer.set_gid(cells[index], cells[index + 1], cells[index + 2])
+            layer.properties = properties
+            tile_map.layers.append(layer)
+            continue
+        data = reader.take(layer_w * layer_h * 4)
+        if sys.byteorder == "big":
+            gids = array(GID_TYPECODE, bytes(data))
+            gids.byteswap()
+        else:
+            # Без копирования: GID читаются прямо из отображённого файла
+            gids = data.cast(GID_TYPECODE)
+        layer = TileLayer(name, layer_w, layer_h, gids, layer_id=layer_id, visible=bool(visible))
+        layer.properties = properties
+        tile_map.layers.append(layer)
+
+    coll_w, coll_h, coll_size = reader.unpack(_COLLISION)
+    collision_kinds = reader.take(coll_w * coll_h)
+
+    for _ in range(group_count):
+        group_id, object_count = reader.unpack(_GROUP)
+        group = ObjectGroup(reader.string(), group_id)
+        group.properties = reader.props()
+        for _ in range(object_count):
+            object_id, gid, x, y, w, h = reader.unpack(_OBJECT)
+            name = reader.string()
+            obj = MapObject(object_id, name, reader.string(), x, y, w, h, gid=gid)
+            obj.properties = reader.props()
+            group.objects.append(obj)
+        tile_map.object_groups.append(group)
+
+    return tile_map, collision_kinds, coll_size
+
+
+def load_compiled(tmx_path, cache_dir=DEFAULT_CACHE_DIR, fingerprint=b""):
+    """
+    Открывает актуальный .lvlc для tmx_path через mmap. fingerprint должен
+    совпадать с тем, с которым кэш записан (см. source_digest).
+
+    Возвращает CompiledLevel или None, если кэша нет, он устарел или повреждён.
+    """
+    try:
+        digest = source_digest(tmx_path, fingerprint)
+    except OSError:
+        return None
+    path = cache_path_for(tmx_path, digest, cache_dir)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        log.warning("⚠️ Не удалось открыть кэш уровня %s: %s", path, e)
+        return None
+
+    try:
+        tile_map, collision_kinds, tile_size = read_compiled(mapped, digest)
+    except (ValueError, struct.error, UnicodeDecodeError) as e:
+        log.warning("⚠️ Кэш уровня повреждён, будет пересобран: %s", e)
+        return None
+
+    tile_map.path = tmx_path
+    return CompiledLevel(path, tile_map, collision_kinds, tile_size, mapped)
@@ -1,36 +1,139 @@
 # game/levels/level1.py
 import pygame
-import base64
-import zlib
+import json
 import os
 from ..platform import Platform
 from game.assets.audio import AudioManager
 from ..enemies.slime import Slime
 from ..enemies.snail import Snail
 from ..enemies.fly import Fly
+from ..enemies.batch import NUMPY_AVAILABLE, EnemyBatch, EnemyGroup
 from ..items.items import Item
 from ..decorations import Decoration, ExitDoor
 from ..asset_loader import asset_loader
 from ..traps.saw import Saw
 from ..traps.spikes import Spikes
+from ..tile_chunks import StaticLayerCache
+from ..spatial_hash import ENEMY, ITEM, TRAP, TRIGGER, SpatialGroup, SpatialHash
+from ..collision_map import BOX, TileCollisionMap, collision_kind_for_type
+from ..slopes import SlopeHeightfield
+from ..colliders import MERGEABLE_KINDS, Collider, merge_cells
+from ..tmx_loader import decode_tile_data, load_tmx
+from ..level_cache import DEFAULT_CACHE_DIR, load_compiled, write_compiled
+from ..chunk_streaming import ChunkStreamer
+from ..timestep import lerp_position
+from ..profiling import profiler
+from ..pooling import PoolRegistry
+from ..log import get_logger
+
+# Насколько ниже нижнего края карты игрок погибает от падения
+# (для level1 высотой 2560 px это прежние 3000 px)
+FALL_DEATH_MARGIN = 440
+
+# Карты от этого числа клеток (и все бесконечные) грузятся потоково
+STREAMING_MIN_TILES = 40000
+
+# От этого числа врагов на карте они симулируются пакетом NumPy (если он есть)
+BATCH_MIN_ENEMIES = 500
+
+log = get_logger("level")
 
 
 def default_level_complete_handler(level_name):
     """Простой обработчик завершения уровня (можно заменить снаружи)."""
-    print(f"✅ Level '{level_name}' completed (default handler).")
+    log.info("✅ Level '%s' completed (default handler).", level_name)
 
 
 class Level:
-    def __init__(self, name):
-        print(f"🗺️ Creating level: {name}")
+    # Как слой тайлов превращается в сущности (по имени слоя; свойство слоя
+    # "kind" в TMX имеет приоритет). Остальные слои — платформы.
+    TILE_LAYER_KINDS = {"traps": "trap", "decoration": "decoration"}
+
+    # Тип объекта в TMX -> тип сущности игры
+    ENEMY_OBJECT_TYPES = ("slime", "snail", "fly", "saw")
+    ITEM_OBJECT_TYPES = {"key": "key_yellow", "ruby": "jewel_blue", "goldcoin": "coin"}
+    DECORATION_OBJECT_TYPES = {"lock": "lock_yellow"}
+    # Декорации, касание которых проверяет уровень (замок двери выхода)
+    TRIGGER_DECORATION_TYPES = ("lock_yellow",)
+    PLATFORM_OBJECT_TYPES = {"box": "box"}
+
+    # 🔥 СООТВЕТСТВИЕ GID ТИПАМ ПЛАТФОРМ ИЗ spritesheet_ground (GID 1-128);
+    # остальные GID — DEFAULT_PLATFORM_TYPE
+    PLATFORM_TYPES_BY_GID = {
+        1: "grass1",
+        2: "grass_half",
+        25: "triangle",
+        57: "semitype1",
+        49: "semitype2",
+        41: "semitype3",
+        9: "grass2",
+        89: "grass3",
+        97: "grass4",
+        73: "grass5",
+        17: "grass6",
+        # Добавьте другие GID по мере необходимости
+    }
+    DEFAULT_PLATFORM_TYPE = "grass"
+
+    def __init__(
+        self,
+        name,
+        tmx_path=None,
+        cache_dir=DEFAULT_CACHE_DIR,
+        streaming=None,
+        stream_radius=2,
+        stream_hysteresis=1,
+        stream_min_tiles=STREAMING_MIN_TILES,
+        batch_enemies=None,
+        batch_min_enemies=BATCH_MIN_ENEMIES,
+    ):
+        log.info("🗺️ Creating level: %s", name)
 
         self.name = name
-        self.platforms = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.items = pygame.sprite.Group()
+        self.tmx_path = tmx_path or os.path.join(
+            asset_loader.base_path, "levels", f"{name}.tmx"
+        )
+        # Скомпилированный кэш (.lvlc) вместо разбора TMX; cache_dir=None — без кэша
+        fingerprint = self.collision_fingerprint()
+        compiled = load_compiled(self.tmx_path, cache_dir, fingerprint) if cache_dir else None
+        self.tile_map = compiled.tile_map if compiled else load_tmx(self.tmx_path)
+        self.loaded_from_cache = compiled is not None
+        self.tile_size = self.tile_map.tilewidth
+        # Потоковый режим: спрайты создаются только в чанках вокруг игрока
+        if streaming is None:
+            streaming = (
+                self.tile_map.infinite
+                or self.tile_map.width * self.tile_map.height >= stream_min_tiles
+            )
+        self.streaming = streaming
+        self.streamer = None
+        # Платформы индексируются по ячейкам размером с тайл (128px) для коллизий
+        self.platforms = SpatialGroup(cell_size=128)
+        # Набор для проверок коллизий: объединённые прямоугольники полных блоков
+        # и полублоков сетки плюс платформы, которые не сливаются (склоны, ящики,
+        # платформы вне сетки). self.platforms остаётся для отрисовки
+        self.colliders = SpatialGroup(cell_size=128)
+        # Сколько точных проверок «враг — платформа» сделано (после широкой фазы)
+        self.enemy_narrow_checks = 0
+        # Динамические группы делят один пространственный индекс сущностей:
+        # у каждой своя категория, и проверки игрока смотрят только нужные
+        # категории рядом с ним; много патрулирующих врагов двигает один
+        # векторный шаг EnemyBatch
+        self.entities = SpatialHash(cell_size=128)
+        if batch_enemies is None:
+            batch_enemies = NUMPY_AVAILABLE and self.count_enemy_objects() >= batch_min_enemies
+        elif batch_enemies and not NUMPY_AVAILABLE:
+            log.warning("⚠️ numpy не установлен — враги обновляются по одному")
+            batch_enemies = False
+        self.enemies = EnemyGroup(
+            batch=EnemyBatch() if batch_enemies else None, index=self.entities, category=ENEMY
+        )
+        self.items = SpatialGroup(index=self.entities, category=ITEM)
         self.doors = pygame.sprite.Group()
-        self.traps = pygame.sprite.Group()
+        self.traps = SpatialGroup(index=self.entities, category=TRAP)
         self.decorations = pygame.sprite.Group()
+        # Декорации-триггеры (замки) — в общем индексе, остальные только рисуются
+        self.triggers = SpatialGroup(index=self.entities, category=TRIGGER)
         self.exit_doors = pygame.sprite.Group()
 
         # Флаг завершения уровня и callback
@@ -38,37 +141,185 @@ class Level:
         self.on_level_complete = default_level_complete_handler
 
         # Загрузка фона
-        original_bg = asset_loader.load_image("backgrounds/colored_grass.png", 1)
+        original_bg = asset_loader.load_image("Backgrounds/colored_grass.png", 1)
         self.background = pygame.transform.scale(original_bg, (1400, 800))
         self.player = None
-        self.player_spawn_point = (0, 1280)  # Из TMX объекта
-        self.width = 30 * 128  # 3840
-        self.height = 20 * 128  # 2560
+        self.player_spawn_point = (0, 0)  # Перезаписывается объектом player из TMX
+        self.width = self.tile_map.width * self.tile_map.tilewidth
+        self.height = self.tile_map.height * self.tile_map.tileheight
+
+        # Плотная карта типов коллизий статической геометрии (1 байт на тайл)
+        self.collision_map = TileCollisionMap(
+            self.tile_map.width,
+            self.tile_map.height,
+            self.tile_size,
+            origin_col=self.tile_map.origin_col,
+            origin_row=self.tile_map.origin_row,
+        )
+        if compiled:
+            self.collision_map.load_kinds(compiled.collision_kinds)
 
         # 🔄 НОВОЕ: Хранение начальных данных врагов для респавна
         self.initial_enemy_data = []
 
-        # 🔥 ЗАГРУЗКА TILESETS - ОБНОВЛЕННЫЕ ПУТИ
+        # Пулы врагов и монет из ящиков: респавн и спавн берут готовые
+        # экземпляры (с уже загруженными спрайтами) вместо конструкторов
+        self.pools = PoolRegistry()
+        self.pools.register("slime", Slime)
+        self.pools.register("snail", Snail)
+        self.pools.register("fly", Fly)
+        self.pools.register("coin", lambda x, y, w, h: Item(x, y, w, h, "coin"))
+
+        # Потоковый режим: спрайты тайлов по чанкам, объекты TMX по чанкам,
+        # живые сущности по id объекта и id уже использованных объектов
+        # (собранные предметы, разбитые ящики), чтобы они не вернулись
+        self._chunk_sprites = {}
+        self._chunk_objects = {}
+        self._live_objects = {}
+        self._consumed_objects = set()
+
+        # Положения подвижных спрайтов в начале последнего тика — для
+        # интерполяции при отрисовке между тиками симуляции
+        self._previous_positions = {}
+
+        # Статические слои (платформы и декорации), запечённые в чанки 8x8 тайлов
+        self.static_layers = StaticLayerCache(chunk_tiles=8, tile_size=self.tile_size)
+
+        # 🔥 ЗАГРУЗКА TILESETS И СЛОЁВ ИЗ TMX
         self.load_tilesets()
-        self.load_from_xml()
-        print(f"🗺️ Уровень '{name}' создан! Спавн игрока: {self.player_spawn_point}")
+        if self.streaming:
+            self.prepare_streaming(stream_radius, stream_hysteresis)
+        else:
+            self.load_from_xml()
+        if cache_dir and not compiled:
+            write_compiled(self.tmx_path, self.tile_map, self.collision_map, cache_dir, fingerprint)
+        # Склоны статичны: ломаные по строкам тайлов строятся один раз
+        self.slopes = SlopeHeightfield.from_collision_map(self.collision_map)
+        self.build_colliders()
+        self.build_static_layers()
+        if self.streaming:
+            self.streamer.update(*self.player_spawn_point)
+        log.info("🗺️ Уровень '%s' создан! Спавн игрока: %s", name, self.player_spawn_point)
+
+    def count_enemy_objects(self):
+        """Число врагов (без пил) в объектных слоях карты."""
+        return sum(
+            1
+            for group in self.tile_map.object_groups
+            for obj in group.objects
+            if obj.type in self.ENEMY_OBJECT_TYPES and obj.type != "saw"
+        )
 
     def load_tilesets(self):
         """Загрузка всех tilesets из TMX"""
-        print("🔄 Загрузка tilesets...")
+        log.debug("🔄 Загрузка tilesets...")
+
+        # Пути картинок в TMX записаны относительно каталога ассетов (Spritesheets/...)
+        for tileset in self.tile_map.tilesets:
+            if tileset.image:
+                asset_loader.load_tileset(
+                    tileset.image,
+                    tileset.firstgid,
+                    tileset.tilewidth,
+                    tileset.tileheight,
+                )
+
+    def _grid_cell(self, rect):
+        """Клетка карты коллизий под прямоугольником или None, если он не выровнен по сетке."""
+        size = self.collision_map.tile_size
+        # В сетку попадают только тайлы, выровненные по сетке
+        if rect.x % size == 0 and rect.y % size == 0 and rect.size == (size, size):
+            return rect.x // size, rect.y // size
+        return None
+
+    def add_platform(self, platform):
+        """Добавляет платформу в группу и отмечает её тип в карте коллизий."""
+        self.platforms.add(platform)
+        cell = self._grid_cell(platform.rect)
+        if cell is not None:
+            self.collision_map.merge_kind(cell[0], cell[1], platform.collision_kind)
+        self._add_collider(platform)
+
+    def remove_platform(self, platform):
+        """Убирает платформу из группы, карты коллизий и запечённых чанков."""
+        self.platforms.remove(platform)
+        self.colliders.remove(platform)
+        cell = self._grid_cell(platform.rect)
+        if cell is not None:
+            self.collision_map.clear(*cell)
+            self._rebuild_colliders_at(*cell)
+        self.static_layers.remove(platform)
+        # Разбитый ящик не должен появиться снова при повторной подгрузке чанка
+        object_id = getattr(platform, "map_object_id", None)
+        if object_id is not None:
+            self._consumed_objects.add(object_id)
+            self._live_objects.pop(object_id, None)
+
+    def _is_merged(self, platform):
+        """Платформа покрыта объединённым прямоугольником своей клетки."""
+        if platform.collision_kind not in MERGEABLE_KINDS:
+            return False
+        cell = self._grid_cell(platform.rect)
+        return cell is not None and self.collision_map.kind_at(*cell) in MERGEABLE_KINDS
+
+    def _add_collider(self, platform):
+        """Добавляет платформу в набор коллизий, если её клетку не покрывает прямоугольник."""
+        if not self._is_merged(platform):
+            self.colliders.add(platform)
+
+    def build_colliders(self):
+        """
+        Сливает полные блоки и полублоки карты коллизий в прямоугольники (при загрузке).
 
-        # 🔥 ОБНОВЛЕННЫЕ ПУТИ - БЕЗ ldesign/
-        tilesets_data = [
-            ("Spritesheets/spritesheet_ground.png", 1, 128, 128),
-            ("Spritesheets/spritesheet_items.png", 129, 128, 128),
-            ("Spritesheets/spritesheet_players.png", 161, 128, 128),
-            ("Spritesheets/spritesheet_tiles.png", 289, 128, 128),
-            ("Spritesheets/spritesheet_enemies.png", 417, 128, 128),
-            ("Spritesheets/spritesheet_hud.png", 522, 128, 128),
-        ]
+        Коллайдеры добавляются в порядке платформ: прямоугольник — на месте
+        первой своей платформы. Проверки «до первого совпадения» (враги)
+        идут в этом порядке и разрешаются так же, как при обходе platforms.
+        """
+        self.colliders.empty()
+        merged = merge_cells(self.collision_map)
+        by_cell = {}
+        for collider in merged:
+            col, row, cols, rows = collider.area
+            for r in range(row, row + rows):
+                for c in range(col, col + cols):
+                    by_cell[(c, r)] = collider
+        for platform in self.platforms:
+            if self._is_merged(platform):
+                self.colliders.add(by_cell[self._grid_cell(platform.rect)])
+            else:
+                self.colliders.add(platform)
+        # Прямоугольники без платформ (клетки из кэша уровня) — в конец
+        self.colliders.add(*merged)
+        cells = sum(collider.area[2] * collider.area[3] for collider in merged)
+        log.info(
+            "🧱 Коллизии: %s клеток слиты в %s прямоугольников, всего коллайдеров %s",
+            cells, len(merged), len(self.colliders),
+        )
 
-        for path, firstgid, tilewidth, tileheight in tilesets_data:
-            asset_loader.load_tileset(path, firstgid, tilewidth, tileheight)
+    def _rebuild_colliders_at(self, col, row):
+        """Пересобирает только прямоугольник, в который входила убранная клетка."""
+        size = self.collision_map.tile_size
+        for collider in self.colliders.query(pygame.Rect(col * size, row * size, size, size)):
+            if isinstance(collider, Collider) and collider.contains_cell(col, row):
+                self.colliders.remove(collider)
+                self.colliders.add(*merge_cells(self.collision_map, collider.area))
+                return
+
+    def add_decoration(self, decoration):
+        """Добавляет декорацию; замки дверей ещё и в группу триггеров."""
+        self.decorations.add(decoration)
+        if decoration.decoration_type in self.TRIGGER_DECORATION_TYPES:
+            self.triggers.add(decoration)
+
+    def build_static_layers(self):
+        """Запекает платформы и декорации в чанки (один раз при загрузке)."""
+        self.static_layers.clear()
+        for platform in self.platforms:
+            self.static_layers.add(platform, layer=0)
+        for decoration in self.decorations:
+            self.static_layers.add(decoration, layer=1)
+        self.static_layers.build()
+        log.info("🧱 Статические слои запечены: %s чанков", self.static_layers.chunk_count)
 
     def set_player(self, player):
         """Установить ссылку на игрока и сбросить состояние врагов при новом запуске уровня"""
@@ -78,6 +329,14 @@ class Level:
             self.player.rect.x = self.player_spawn_point[0]
             self.player.rect.y = self.player_spawn_point[1]
             self.player.respawn_position = self.player_spawn_point
+            if hasattr(self.player, "fall_death_y"):
+                self.player.fall_death_y = (
+                    self.tile_map.origin_row * self.tile_size + self.height + FALL_DEATH_MARGIN
+                )
+
+            # Карта высот склонов: соседний склон ищется по клетке, а не перебором платформ
+            if hasattr(self.player, "slopes"):
+                self.player.slopes = self.slopes
 
             # Callback для удара игроком по ящику box (спавн монеты)
             if hasattr(self.player, "on_box_hit"):
@@ -136,14 +395,18 @@ class Level:
 
                 # Убедимся что у врага есть изображение
                 if not hasattr(enemy, "image") or enemy.image is None:
-                    print(
-                        f"⚠️ У врага {enemy.__class__.__name__} нет изображения! Создаём placeholder..."
+                    log.warning(
+                        "⚠️ У врага %s нет изображения! Создаём placeholder...",
+                        enemy.__class__.__name__,
                     )
                     if hasattr(enemy, "create_placeholder_sprites"):
                         enemy.create_placeholder_sprites()
                         enemy.current_sprite = enemy.idle_sprite
                         enemy.image = enemy.current_sprite
 
+                # Сброшенное состояние — в строку пакетной симуляции
+                self.enemies.reload(enemy)
+
             # Обновим анимации после сброса
             for enemy in self.enemies:
                 if hasattr(enemy, "update_animation"):
@@ -151,7 +414,7 @@ class Level:
 
     def spawn_coin_from_box(self, box_platform):
         """При ударе по ящику box создаёт монету, уничтожает ящик и заставляет монету падать на землю."""
-        if not box_platform or getattr(box_platform, "platform_type", None) != "box":
+        if not box_platform or getattr(box_platform, "collision_kind", None) != BOX:
             return
 
         # Каждый ящик должен выдавать монету только один раз, пока уровень не будет пересоздан
@@ -160,36 +423,19 @@ class Level:
 
         box_rect = box_platform.rect
 
-        # Найдём первую твёрдую платформу под ящиком, чтобы знать, где монета должна приземлиться
-        ground_y = None
-        for platform in self.platforms:
-            if platform is box_platform:
-                continue
-            if not getattr(platform, "has_collision", True):
-                continue
-
-            # Горизонтальное пересечение
-            if (
-                platform.rect.right <= box_rect.left
-                or platform.rect.left >= box_rect.right
-            ):
-                continue
-
-            # Платформа должна находиться ниже низа ящика
-            if platform.rect.top >= box_rect.bottom:
-                if ground_y is None or platform.rect.top < ground_y:
-                    ground_y = platform.rect.top
+        # Первая непустая клетка под ящиком — туда монета должна приземлиться (проход по колонке карты)
+        ground_y = self.collision_map.ground_below(box_rect.centerx, box_rect.bottom)
 
         # На всякий случай, если не нашли платформу (не должно случиться на нормальной карте)
         if ground_y is None:
             ground_y = box_rect.bottom + 5 * 128
 
-        coin = Item(
+        coin = self.pools.acquire(
+            "coin",
             box_rect.x,
             box_rect.y,
             box_rect.width,
             box_rect.height,
-            "coin",
         )
 
         # Стартуем монету снизу ящика и даём ей цель падения до земли
@@ -200,12 +446,9 @@ class Level:
         self.items.add(coin)
         box_platform.coin_spawned = True
 
-        # Удаляем ящик: он считается разрушенным и больше не блокирует движение
-        try:
-            self.platforms.remove(box_platform)
-        except ValueError:
-            # Если ящик уже удалён из группы — просто игнорируем
-            pass
+        # Удаляем ящик: он считается разрушенным и больше не блокирует движение.
+        # Перестраиваются только чанки под ящиком.
+        self.remove_platform(box_platform)
 
         # Небольшой звуковой эффект (используем тот же, что и для сбора монеты)
         try:
@@ -213,157 +456,89 @@ class Level:
             if audio:
                 audio.sfx.play("player_collect_coin")
         except Exception as e:
-            print(f"[Audio][Level1] spawn_coin_from_box sfx failed: {e}")
+            log.warning("[Audio][Level1] spawn_coin_from_box sfx failed: %s", e)
 
     def decode_layer_data(self, encoded_data):
-        """Декодирование данных слоя тайлов из base64+zlib"""
+        """Декодирование данных слоя тайлов из base64+zlib (список GID)"""
         try:
-            encoded_data = encoded_data.strip().replace("\n", "").replace("\r", "")
-            decoded = base64.b64decode(encoded_data)
-            decompressed = zlib.decompress(decoded)
-
-            tile_data = []
-            for i in range(0, len(decompressed), 4):
-                tile_gid = int.from_bytes(decompressed[i : i + 4], byteorder="little")
-                tile_data.append(tile_gid)
-
-            return tile_data
+            return list(decode_tile_data(encoded_data, "base64", "zlib"))
         except Exception as e:
-            print(f"❌ Ошибка декодирования слоя: {e}")
+            log.error("❌ Ошибка декодирования слоя: %s", e)
             return []
 
     def load_from_xml(self):
-        """Загрузка уровня из XML данных TMX"""
+        """Загрузка слоёв и объектов уровня из разобранного TMX"""
         try:
-            # 🔥 ЗАГРУЗКА ВСЕХ СЛОЕВ ИЗ TMX
-            self.load_ground_layer()
-            self.load_semiground_layer()
-            self.load_triangleleft_layer()
-            self.load_traps_layer()
-            self.load_decoration_layer()
+            for layer in self.tile_map.layers:
+                self.load_tile_layer(layer)
             self.load_objects_from_xml()
 
-            print("✅ Все слои TMX загружены!")
+            log.info("✅ Все слои TMX загружены!")
 
         except Exception as e:
-            print(f"❌ Ошибка загрузки уровня: {e}")
-            import traceback
-
-            traceback.print_exc()
-            self.create_fallback_level()
-
-    def load_ground_layer(self):
-        """Загрузка основного слоя земли"""
-        print("🔄 Загрузка ground layer...")
-        ground_layer_data = "eJxjYBgFo2AUjHTASWdzYeJMJJqXCNWLD3tCzcUmx4RGg3AkiW4YqUCQARJejFA+OWmGkbASOIDFNRMSRo87YjGp6WwUjAJqAAC+IgLF"
-        tile_data = self.decode_layer_data(ground_layer_data)
-
-        for y in range(20):
-            for x in range(30):
-                tile_index = y * 30 + x
-                if tile_index < len(tile_data):
-                    tile_gid = tile_data[tile_index]
-
-                    if tile_gid != 0:  # Есть тайл
-                        platform_type = self.get_platform_type_by_gid(tile_gid)
+            log.exception("❌ Ошибка загрузки уровня: %s", e)
 
-                        platform = Platform(x * 128, y * 128, 128, 128, platform_type)
-                        self.platforms.add(platform)
-
-        print(f"✅ Ground layer: {len(self.platforms)} платформ")
-
-    def load_semiground_layer(self):
-        """Загрузка слоя semiground"""
-        print("🔄 Загрузка semiground layer...")
-        semiground_data = (
-            "eJxjYBjawBKIDYFYc6AdQgKAuZnaamkJKAnnoRJHtHAnPf0+VMJ5FIyCUTAKRgIAAN5vBEc="
-        )
-        tile_data = self.decode_layer_data(semiground_data)
-
-        for y in range(20):
-            for x in range(30):
-                tile_index = y * 30 + x
-                if tile_index < len(tile_data):
-                    tile_gid = tile_data[tile_index]
-
-                    if tile_gid != 0:
-                        platform_type = self.get_platform_type_by_gid(tile_gid)
-                        platform = Platform(x * 128, y * 128, 128, 128, platform_type)
-                        self.platforms.add(platform)
-
-    def load_triangleleft_layer(self):
-        """Загрузка слоя triangleleft"""
-        print("🔄 Загрузка triangleleft layer...")
-        triangleleft_data = "eJxjYBgFo2AUjALqA8mBdsAoGAWjYBQMIAAAhsQAGg=="
-        tile_data = self.decode_layer_data(triangleleft_data)
-
-        for y in range(20):
-            for x in range(30):
-                tile_index = y * 30 + x
-                if tile_index < len(tile_data):
-                    tile_gid = tile_data[tile_index]
-
-                    if tile_gid != 0:
-                        platform_type = self.get_platform_type_by_gid(tile_gid)
-                        platform = Platform(x * 128, y * 128, 128, 128, platform_type)
-                        self.platforms.add(platform)
-
-    def load_traps_layer(self):
-        """Загрузка слоя ловушек"""
-        print("🔄 Загрузка traps layer...")
-        traps_layer_data = (
-            "eJxjYBgFQxHMYqSvvlEwCsgFuNLcaFocGgAUT+hxNRp3o2AUEAYA+iEEPg=="
-        )
-        tile_data = self.decode_layer_data(traps_layer_data)
-
-        for y in range(20):
-            for x in range(30):
-                tile_index = y * 30 + x
-                if tile_index < len(tile_data):
-                    tile_gid = tile_data[tile_index]
-
-                    if tile_gid != 0:  # Есть ловушка
-                        spike = Spikes(x * 128, y * 128, 128, 128)
-                        self.traps.add(spike)
-
-        print(f"✅ Traps layer: {len(self.traps)} ловушек")
-
-    def load_decoration_layer(self):
-        """Загрузка слоя декораций"""
-        print("🔄 Загрузка decoration layer...")
-        decoration_layer_data = (
-            "eJxjYBgFo2DkgGjGgXYBdUHKAPknZ5iFI7mgZIDCoQZob+wgiIPhlp9GwSigJgAA5dUC2w=="
+    def layer_kind(self, layer):
+        """Во что превращается слой тайлов: platform, trap или decoration"""
+        return layer.properties.get(
+            "kind", self.TILE_LAYER_KINDS.get(layer.name, "platform")
         )
-        tile_data = self.decode_layer_data(decoration_layer_data)
 
-        for y in range(20):
-            for x in range(30):
-                tile_index = y * 30 + x
-                if tile_index < len(tile_data):
-                    tile_gid = tile_data[tile_index]
-
-                    if tile_gid != 0:
-                        deco_type = self.get_decoration_type_by_gid(tile_gid)
-                        decoration = Decoration(x * 128, y * 128, 128, 128, deco_type)
-                        self.decorations.add(decoration)
-
-        print(f"✅ Decoration layer: {len(self.decorations)} декораций")
+    def create_tile_sprite(self, kind, col, row, gid):
+        """Создаёт спрайт одного тайла слоя (без добавления в группы)"""
+        size = self.tile_size
+        x, y = col * size, row * size
+        if kind == "trap":
+            return Spikes(x, y, size, size)
+        if kind == "decoration":
+            return Decoration(x, y, size, size, self.get_decoration_type_by_gid(gid))
+        return Platform(x, y, size, size, self.get_platform_type_by_gid(gid))
+
+    def load_tile_layer(self, layer):
+        """Создаёт платформы, ловушки или декорации из слоя тайлов"""
+        kind = self.layer_kind(layer)
+        log.debug("🔄 Загрузка %s layer (%s)...", layer.name, kind)
+        count = 0
+        for col, row, gid in layer.tiles():
+            sprite = self.create_tile_sprite(kind, col, row, gid)
+            if kind == "trap":
+                self.traps.add(sprite)
+            elif kind == "decoration":
+                self.add_decoration(sprite)
+            else:
+                self.add_platform(sprite)
+            count += 1
+
+        log.debug("✅ %s layer: %s тайлов", layer.name, count)
 
     def load_objects_from_xml(self):
         """Загрузка объектов из objectgroups"""
-        print("🔄 Загрузка объектов из TMX...")
-
-        # 🔥 ВРАГИ ИЗ OBJECTGROUP (GID из spritesheet_enemies)
-        enemies_data = [
-            # slime (GID 418 = 417 + 1)
-            (898, 1268 - 128, 128, 128, "slime"),
-            # snail (GID 459 = 417 + 42)
-            (1790, 1264 - 128, 128, 128, "snail"),
-            # saw (GID 481 = 417 + 64)
-            (2684, 1788 - 128, 128, 128, "saw"),
-            # fly (GID 475 = 417 + 58)
-            (2308, 1648 - 128, 128, 128, "fly"),
-        ]
+        log.debug("🔄 Загрузка объектов из TMX...")
+
+        enemies_data = []
+        items_data = []
+        decorations_data = []
+        box_data = []
+
+        # 🔥 ОБЪЕКТЫ ИЗ OBJECTGROUP: тип объекта в TMX -> сущность игры
+        for group in self.tile_map.object_groups:
+            for obj in group.objects:
+                x, y = int(obj.x), int(obj.top)
+                w, h = int(obj.width), int(obj.height)
+                if obj.type in self.ENEMY_OBJECT_TYPES:
+                    enemies_data.append((x, y, w, h, obj.type))
+                elif obj.type in self.ITEM_OBJECT_TYPES:
+                    items_data.append((x, y, w, h, self.ITEM_OBJECT_TYPES[obj.type]))
+                elif obj.type in self.DECORATION_OBJECT_TYPES:
+                    decorations_data.append(
+                        (x, y, w, h, self.DECORATION_OBJECT_TYPES[obj.type])
+                    )
+                elif obj.type in self.PLATFORM_OBJECT_TYPES:
+                    box_data.append((x, y, w, h, self.PLATFORM_OBJECT_TYPES[obj.type]))
+                elif obj.type == "player":
+                    self.player_spawn_point = (x, y)
+                else:
+                    log.warning("⚠️ Неизвестный тип объекта в TMX: '%s' (id=%s)", obj.type, obj.id)
 
         # 🔄 НОВОЕ: Сохраняем начальные данные врагов для респавна после смерти игрока
         self.initial_enemy_data = enemies_data
@@ -373,100 +548,234 @@ class Level:
         self.enemies.empty()
 
         for x, y, w, h, enemy_type in enemies_data:
-            enemy = None
-            try:
-                print(f"🔄 Попытка создания врага {enemy_type} на позиции ({x}, {y})")
-                if enemy_type == "slime":
-                    enemy = Slime(x, y)
-                    # 🔥 FIX: Validate image is set
-                    if enemy.image is None:
-                        print(f"❌ Slime создан но image is None! Исправляем...")
-                        enemy.create_placeholder_sprites()
-                        enemy.image = enemy.idle_sprite
-                    print(f"✅ Slime создан успешно с image: {enemy.image}")
-                elif enemy_type == "snail":
-                    enemy = Snail(x, y)
-                    print(f"✅ Snail создан успешно: {enemy}")
-                elif enemy_type == "fly":
-                    enemy = Fly(x, y)
-                    print(f"✅ Fly создан успешно: {enemy}")
-                elif enemy_type == "saw":
-                    saw = Saw(x, y)
-                    self.traps.add(saw)
-                    print(f"✅ Saw добавлен в ловушки")
-                    continue  # Skip adding to enemies group
-
-                # 🔥 FIX: Double-check image before adding to group
-                if enemy is not None:
-                    if not hasattr(enemy, "image") or enemy.image is None:
-                        print(f"⚠️ {enemy_type} missing image before add, fixing...")
-                        if hasattr(enemy, "idle_sprite"):
-                            enemy.image = enemy.idle_sprite
-                        elif hasattr(enemy, "create_placeholder_sprites"):
-                            enemy.create_placeholder_sprites()
-                            enemy.image = enemy.idle_sprite
-
-                    self.enemies.add(enemy)
-                    print(
-                        f"✅ Враг {enemy_type} добавлен в группу врагов. Всего врагов: {len(self.enemies)}"
-                    )
-                else:
-                    print(
-                        f"⚠️ ВНИМАНИЕ: Враг {enemy_type} не был создан (enemy is None)"
-                    )
-
-            except Exception as e:
-                print(f"❌ Ошибка создания врага {enemy_type}: {e}")
-                import traceback
-
-                traceback.print_exc()
+            self.create_enemy(enemy_type, x, y)
 
         # 🔥 ПРЕДМЕТЫ ИЗ OBJECTGROUP
-        items_data = [
-            # Ключ (GID 572 = 522 + 50)
-            (440, 364 - 128, 128, 128, "key_yellow"),
-            # Рубин (GID 522)
-            (2432, 128 - 128, 128, 128, "jewel_blue"),
-            # Монеты (GID 158 = 129 + 29)
-            (384, 1024 - 128, 128, 128, "coin"),
-            (512, 1024 - 128, 128, 128, "coin"),
-            (640, 1024 - 128, 128, 128, "coin"),
-            (2560, 1280 - 128, 128, 128, "coin"),
-            (2816, 1664 - 128, 128, 128, "coin"),
-            (2048, 768 - 128, 128, 128, "coin"),
-            (1852, 368 - 128, 128, 128, "coin"),
-        ]
-
         for x, y, w, h, item_type in items_data:
             item = Item(x, y, w, h, item_type)
             self.items.add(item)
 
         # 🔥 ДЕКОРАЦИИ ИЗ OBJECTGROUP
-        decorations_data = [
-            # Замок (GID 363 = 289 + 74) — визуальный замок над дверью
-            (840, 1590 - 32, 32, 32, "lock_yellow"),
-        ]
-
         for x, y, w, h, deco_type in decorations_data:
             decoration = Decoration(x, y, w, h, deco_type)
-            self.decorations.add(decoration)
+            self.add_decoration(decoration)
 
-        box_data = [
-            # Ящики (GID 341 = 289 + 52)
-            (1792, 1664 - 128, 128, 128, "box"),
-            (1920, 1664 - 128, 128, 128, "box"),
-        ]
+        # 🔥 ЯЩИКИ (платформы-объекты)
         for x, y, w, h, platform_type in box_data:
             platform = Platform(x, y, w, h, platform_type)
-            self.platforms.add(platform)
+            self.add_platform(platform)
+
+        log.info(
+            "✅ Objects loaded: %s врагов, %s предметов, %s декораций",
+            len(self.enemies), len(self.items), len(self.decorations),
+        )
+
+    def create_enemy(self, enemy_type, x, y):
+        """Создаёт врага (или пилу — она живёт среди ловушек) и добавляет в группу"""
+        enemy = None
+        try:
+            log.debug("🔄 Попытка создания врага %s на позиции (%s, %s)", enemy_type, x, y)
+            if enemy_type == "slime":
+                enemy = self.pools.acquire("slime", x, y)
+                # 🔥 FIX: Validate image is set
+                if enemy.image is None:
+                    log.error("❌ Slime создан но image is None! Исправляем...")
+                    enemy.create_placeholder_sprites()
+                    enemy.image = enemy.idle_sprite
+                log.debug("✅ Slime создан успешно с image: %s", enemy.image)
+            elif enemy_type == "snail":
+                enemy = self.pools.acquire("snail", x, y)
+                log.debug("✅ Snail создан успешно: %s", enemy)
+            elif enemy_type == "fly":
+                enemy = self.pools.acquire("fly", x, y)
+                log.debug("✅ Fly создан успешно: %s", enemy)
+            elif enemy_type == "saw":
+                saw = Saw(x, y)
+                self.traps.add(saw)
+                log.debug("✅ Saw добавлен в ловушки")
+                return saw  # Skip adding to enemies group
+
+            # 🔥 FIX: Double-check image before adding to group
+            if enemy is not None:
+                if not hasattr(enemy, "image") or enemy.image is None:
+                    log.warning("⚠️ %s missing image before add, fixing...", enemy_type)
+                    if hasattr(enemy, "idle_sprite"):
+                        enemy.image = enemy.idle_sprite
+                    elif hasattr(enemy, "create_placeholder_sprites"):
+                        enemy.create_placeholder_sprites()
+                        enemy.image = enemy.idle_sprite
+
+                # Экземпляр из пула мог принадлежать другому объекту карты
+                enemy.map_object_id = None
+                self.enemies.add(enemy)
+                log.debug(
+                    "✅ Враг %s добавлен в группу врагов. Всего врагов: %s",
+                    enemy_type, len(self.enemies),
+                )
+            else:
+                log.warning("⚠️ ВНИМАНИЕ: Враг %s не был создан (enemy is None)", enemy_type)
+
+        except Exception as e:
+            log.exception("❌ Ошибка создания врага %s: %s", enemy_type, e)
+        return enemy
+
+    def release_to_pool(self, sprite):
+        """Возвращает убранную с уровня сущность (убитого врага, собранную монету) в её пул"""
+        self.pools.release(sprite)
+
+    # ---------- Потоковая загрузка чанков ----------
+
+    def prepare_streaming(self, radius, hysteresis):
+        """
+        Готовит потоковую загрузку большой или бесконечной карты.
 
-        print(
-            f"✅ Objects loaded: {len(self.enemies)} врагов, {len(self.items)} предметов, {len(self.decorations)} декораций"
+        Спрайты здесь не создаются: объекты TMX раскладываются по чанкам,
+        карта коллизий заполняется по слоям целиком (1 байт на клетку),
+        а тайлы и сущности появляются в load_chunk, когда игрок рядом.
+        """
+        log.info("🔄 Потоковый режим: радиус %s чанка(ов), запас %s", radius, hysteresis)
+        chunk_size = self.static_layers.chunk_size
+        for group in self.tile_map.object_groups:
+            for obj in group.objects:
+                if obj.type == "player":
+                    self.player_spawn_point = (int(obj.x), int(obj.top))
+                    continue
+                key = (int(obj.x) // chunk_size, int(obj.top) // chunk_size)
+                self._chunk_objects.setdefault(key, []).append(obj)
+
+        if not self.loaded_from_cache:
+            self.fill_collision_map()
+
+        self.streamer = ChunkStreamer(
+            chunk_size,
+            radius=radius,
+            hysteresis=hysteresis,
+            on_load=self.load_chunk,
+            on_unload=self.unload_chunk,
         )
 
+    def fill_collision_map(self):
+        """Заполняет карту коллизий по слоям и ящикам, не создавая спрайтов"""
+        kinds_by_gid = {}
+        merge_kind = self.collision_map.merge_kind
+        for layer in self.tile_map.layers:
+            if self.layer_kind(layer) != "platform":
+                continue
+            for col, row, gid in layer.tiles():
+                kind = kinds_by_gid.get(gid)
+                if kind is None:
+                    kind = collision_kind_for_type(self.get_platform_type_by_gid(gid))
+                    kinds_by_gid[gid] = kind
+                merge_kind(col, row, kind)
+
+        for objects in self._chunk_objects.values():
+            for obj in objects:
+                if obj.type in self.PLATFORM_OBJECT_TYPES:
+                    rect = pygame.Rect(int(obj.x), int(obj.top), int(obj.width), int(obj.height))
+                    cell = self._grid_cell(rect)
+                    if cell is not None:
+                        platform_type = self.PLATFORM_OBJECT_TYPES[obj.type]
+                        merge_kind(cell[0], cell[1], collision_kind_for_type(platform_type))
+
+    def spawn_map_object(self, obj):
+        """Создаёт сущность для объекта TMX и добавляет её в нужную группу"""
+        x, y = int(obj.x), int(obj.top)
+        w, h = int(obj.width), int(obj.height)
+        if obj.type in self.ENEMY_OBJECT_TYPES:
+            return self.create_enemy(obj.type, x, y)
+        if obj.type in self.ITEM_OBJECT_TYPES:
+            item = Item(x, y, w, h, self.ITEM_OBJECT_TYPES[obj.type])
+            self.items.add(item)
+            return item
+        if obj.type in self.DECORATION_OBJECT_TYPES:
+            decoration = Decoration(x, y, w, h, self.DECORATION_OBJECT_TYPES[obj.type])
+            self.add_decoration(decoration)
+            self.static_layers.add(decoration, layer=1)
+            return decoration
+        if obj.type in self.PLATFORM_OBJECT_TYPES:
+            platform = Platform(x, y, w, h, self.PLATFORM_OBJECT_TYPES[obj.type])
+            self.platforms.add(platform)
+            self._add_collider(platform)
+            self.static_layers.add(platform, layer=0)
+            return platform
+        log.warning("⚠️ Неизвестный тип объекта в TMX: '%s' (id=%s)", obj.type, obj.id)
+        return None
+
+    def load_chunk(self, key):
+        """Создаёт тайлы и объекты чанка (вызывается стримером)"""
+        tiles = self.static_layers.chunk_tiles
+        left, top = key[0] * tiles, key[1] * tiles
+        sprites = []
+        for layer in self.tile_map.layers:
+            kind = self.layer_kind(layer)
+            for col, row, gid in layer.tiles_in_rect(left, top, left + tiles, top + tiles):
+                sprite = self.create_tile_sprite(kind, col, row, gid)
+                if kind == "trap":
+                    self.traps.add(sprite)
+                elif kind == "decoration":
+                    self.add_decoration(sprite)
+                    self.static_layers.add(sprite, layer=1)
+                else:
+                    # Карта коллизий уже заполнена в prepare_streaming
+                    self.platforms.add(sprite)
+                    self._add_collider(sprite)
+                    self.static_layers.add(sprite, layer=0)
+                sprites.append(sprite)
+        self._chunk_sprites[key] = sprites
+
+        for obj in self._chunk_objects.get(key, ()):
+            if obj.id in self._live_objects or obj.id in self._consumed_objects:
+                continue
+            sprite = self.spawn_map_object(obj)
+            if sprite is not None:
+                sprite.map_object_id = obj.id
+                self._live_objects[obj.id] = sprite
+
+    def unload_chunk(self, key):
+        """Удаляет спрайты чанка; сущности выгружаются по их текущему положению"""
+        for sprite in self._chunk_sprites.pop(key, ()):
+            sprite.kill()
+            self.static_layers.remove(sprite)
+
+        size = self.static_layers.chunk_size
+        chunk_rect = pygame.Rect(key[0] * size, key[1] * size, size, size)
+        for object_id, sprite in list(self._live_objects.items()):
+            if getattr(sprite, "map_object_id", None) != object_id:
+                # Убитый враг вернулся в пул и уже достался другому объекту
+                del self._live_objects[object_id]
+                continue
+            if not chunk_rect.collidepoint(sprite.rect.center):
+                continue
+            if getattr(sprite, "collected", False):
+                self._consumed_objects.add(object_id)
+            sprite.kill()
+            self.static_layers.remove(sprite)
+            self.release_to_pool(sprite)
+            del self._live_objects[object_id]
+
     def respawn_killed_enemies(self):
         """Возрождает всех убитых врагов при респавне игрока"""
-        print("🔄 Проверка убитых врагов для респавна...")
+        log.debug("🔄 Проверка убитых врагов для респавна...")
+
+        if self.streaming:
+            # Возрождаем только врагов загруженных чанков; остальные появятся сами при подгрузке
+            for key in self.streamer.loaded:
+                for obj in self._chunk_objects.get(key, ()):
+                    if obj.type not in self.ENEMY_OBJECT_TYPES:
+                        continue
+                    sprite = self._live_objects.get(obj.id)
+                    if (
+                        sprite is not None
+                        and sprite.alive()
+                        and sprite.map_object_id == obj.id
+                    ):
+                        continue
+                    enemy = self.spawn_map_object(obj)
+                    if enemy is not None:
+                        enemy.map_object_id = obj.id
+                        self._live_objects[obj.id] = enemy
+            log.info("✅ Респавн врагов завершен. Всего врагов: %s", len(self.enemies))
+            return
         
         # Подсчитываем текущих живых врагов по типам
         alive_enemy_count = {}
@@ -492,38 +801,13 @@ class Level:
             initial_count = initial_enemy_count.get(enemy_type, 0)
             
             if current_count < initial_count:
-                # Есть убитые враги этого типа, возрождаем одного
-                enemy = None
-                try:
-                    print(f"🔄 Возрождение врага {enemy_type} на позиции ({x}, {y})")
-                    if enemy_type == "slime":
-                        enemy = Slime(x, y)
-                        if enemy.image is None:
-                            enemy.create_placeholder_sprites()
-                            enemy.image = enemy.idle_sprite
-                    elif enemy_type == "snail":
-                        enemy = Snail(x, y)
-                    elif enemy_type == "fly":
-                        enemy = Fly(x, y)
-                    
-                    if enemy is not None:
-                        if not hasattr(enemy, "image") or enemy.image is None:
-                            if hasattr(enemy, "idle_sprite"):
-                                enemy.image = enemy.idle_sprite
-                            elif hasattr(enemy, "create_placeholder_sprites"):
-                                enemy.create_placeholder_sprites()
-                                enemy.image = enemy.idle_sprite
-                        
-                        self.enemies.add(enemy)
-                        # Обновляем счетчик чтобы не создавать дубликаты
-                        alive_enemy_count[enemy_type] = alive_enemy_count.get(enemy_type, 0) + 1
-                        print(f"✅ Враг {enemy_type} возрожден успешно")
-                except Exception as e:
-                    print(f"❌ Ошибка возрождения врага {enemy_type}: {e}")
-                    import traceback
-                    traceback.print_exc()
+                # Есть убитые враги этого типа, возрождаем одного (экземпляр из пула)
+                enemy = self.create_enemy(enemy_type, x, y)
+                if enemy is not None:
+                    # Обновляем счетчик чтобы не создавать дубликаты
+                    alive_enemy_count[enemy_type] = alive_enemy_count.get(enemy_type, 0) + 1
         
-        print(f"✅ Респавн врагов завершен. Всего врагов: {len(self.enemies)}")
+        log.info("✅ Респавн врагов завершен. Всего врагов: %s", len(self.enemies))
 
     def check_exit_door_collision(self):
         """
@@ -537,19 +821,15 @@ class Level:
         if not self.player:
             return
 
-        player_rect = (
-            self.player.get_actual_hitbox()
-            if hasattr(self.player, "get_actual_hitbox")
-            else self.player.rect
-        )
+        player_rect = getattr(self.player, "world_hitbox", self.player.rect)
 
-        for decoration in self.decorations:
+        for decoration in self.triggers.query(player_rect):
             if player_rect.colliderect(decoration.rect):
                 # Ожидаем жёлтый замок
                 if decoration.decoration_type == "lock_yellow":
                     if getattr(self.player, "has_yellow_key", False):
                         if not self.completed:
-                            print(
+                            log.info(
                                 "✅ Условие выхода выполнено: есть жёлтый ключ и столкновение с дверью."
                             )
                             self.completed = True
@@ -558,29 +838,34 @@ class Level:
                                 self.on_level_complete(self.name)
                     else:
                         # Нет ключа — сообщение (можно интегрировать с HUD)
-                        print("🚪 You need a yellow key to open this door")
+                        log.debug("🚪 You need a yellow key to open this door")
 
                 # если будут двери других цветов — можно расширить здесь
 
     def get_platform_type_by_gid(self, gid):
         """Определяет тип платформы по GID"""
-        # 🔥 СООТВЕТСТВИЕ GID ТИПАМ ПЛАТФОРМ ИЗ spritesheet_ground
-        platform_types = {
-            # spritesheet_ground (GID 1-128)
-            1: "grass1",
-            2: "grass_half",
-            25: "triangle",
-            57: "semitype1",
-            49: "semitype2",
-            41: "semitype3",
-            9: "grass2",
-            89: "grass3",
-            97: "grass4",
-            73: "grass5",
-            17: "grass6",
-            # Добавьте другие GID по мере необходимости
+        return self.PLATFORM_TYPES_BY_GID.get(gid, self.DEFAULT_PLATFORM_TYPE)
+
+    def collision_fingerprint(self):
+        """
+        Отпечаток того, как код переводит карту в коллизии: тип коллизии
+        каждого GID из таблицы и по умолчанию, ящиков и роли слоёв. Входит
+        в ключ кэша уровня: правка таблиц или collision_kind_for_type
+        делает запечённую карту коллизий неактуальной.
+        """
+        mapping = {
+            "gids": sorted(
+                (gid, collision_kind_for_type(platform_type))
+                for gid, platform_type in self.PLATFORM_TYPES_BY_GID.items()
+            ),
+            "default": collision_kind_for_type(self.DEFAULT_PLATFORM_TYPE),
+            "objects": sorted(
+                (obj_type, collision_kind_for_type(platform_type))
+                for obj_type, platform_type in self.PLATFORM_OBJECT_TYPES.items()
+            ),
+            "layers": sorted(self.TILE_LAYER_KINDS.items()),
         }
-        return platform_types.get(gid, "grass")
+        return json.dumps(mapping, sort_keys=True).encode("utf-8")
 
     def get_decoration_type_by_gid(self, gid):
         """Определяет тип декорации по GID"""
@@ -604,7 +889,12 @@ class Level:
         Если игрока нет (например, при ошибке инициализации), обновляем весь уровень.
         """
         if not self.player:
-            return pygame.Rect(0, 0, self.width, self.height)
+            return pygame.Rect(
+                self.tile_map.origin_col * self.tile_size,
+                self.tile_map.origin_row * self.tile_size,
+                self.width,
+                self.height,
+            )
 
         half_w, half_h = 700, 400
         margin = 400
@@ -616,54 +906,116 @@ class Level:
             2 * (half_h + margin),
         )
 
+    def tick(self, keys, dt, current_time=0.0):
+        """
+        Один тик симуляции: ввод и физика игрока, затем враги, ловушки и
+        предметы. Общий шаг для окна игры (main.py) и headless-режима.
+        keys — состояние клавиш как у pygame.key.get_pressed().
+        """
+        player = self.player
+        with profiler.section("player.update"):
+            player.store_previous_position()
+            player.handle_keys(keys, self.colliders, dt)
+            player.update(
+                platforms=self.colliders,
+                enemies=self.enemies,
+                current_time=current_time,
+                traps=self.traps,
+                dt=dt,
+            )
+        with profiler.section("level.update"):
+            self.update(dt)
+
     def update(self, dt):
         """Обновление уровня с локализованными апдейтами."""
-        update_rect = self._compute_update_rect()
+        if self.streaming and self.player:
+            self.streamer.update(*self.player.rect.center)
 
-        for enemy in self.enemies:
-            if enemy.rect.colliderect(update_rect):
-                enemy.update(dt, self)
-                self.check_enemy_collisions(enemy)
-
-        for trap in self.traps:
+        update_rect = self._compute_update_rect()
+        previous = self._previous_positions = {}
+
+        if self.enemies.batch is not None:
+            self.update_enemy_batch(dt, update_rect, previous)
+        else:
+            # Только враги из ячеек индекса под областью обновления
+            for enemy in self.enemies.query(update_rect):
+                if enemy.rect.colliderect(update_rect):
+                    previous[enemy] = enemy.rect.topleft
+                    enemy.update(dt, self)
+                    if not enemy.alive():
+                        # Анимация смерти закончилась — в пул до следующего респавна
+                        self.release_to_pool(enemy)
+                        continue
+                    self.check_enemy_collisions(enemy)
+                    self.enemies.refresh(enemy)
+
+        for trap in self.traps.query(update_rect):
             if hasattr(trap, "rect") and trap.rect.colliderect(update_rect):
                 trap.update(dt, self)
 
         if self.player:
-            # Обновляем анимацию для динамических предметов (например, монет из ящиков)
+            # Обновляем анимацию для динамических предметов (например, монет из ящиков);
+            # все предметы, иначе монета, упавшая за область обновления, зависнет
             for item in self.items:
                 if hasattr(item, "update"):
+                    start = item.rect.topleft
                     item.update(dt)
+                    # Переиндексируем только сдвинувшиеся (падающие) предметы
+                    if item.rect.topleft != start:
+                        previous[item] = start
+                        self.items.refresh(item)
 
             self.check_item_collection()
             self.check_exit_door_collision()
 
+    def update_enemy_batch(self, dt, update_rect, previous):
+        """
+        Все враги пакета шагают одним векторным шагом; спрайты в области
+        обновления получают новое положение и досчитывают свои таймеры.
+        """
+        batch = self.enemies.batch
+        batch.step(dt, self)
+        for enemy in batch.sync(update_rect, previous):
+            if enemy.update_state(dt):
+                enemy.update_after_move(dt)
+            elif enemy.alive():
+                batch.deactivate(enemy)
+            else:
+                self.release_to_pool(enemy)
+                continue
+            self.enemies.refresh(enemy)
+
     def check_item_collection(self):
         """Проверка сбора предметов игроком"""
-        for item in self.items.sprites():
+        # Широкая фаза: только предметы из ячеек индекса под игроком
+        for item in self.items.query(self.player.rect):
             if not item.collected and self.player.rect.colliderect(item.rect):
                 item_type = item.collect()
                 if item_type:
-                    print(f"🎁 Собран предмет: {item_type}")
+                    log.debug("🎁 Собран предмет: %s", item_type)
+                    if getattr(item, "pool_key", None):
+                        # Монета из ящика: убираем с уровня и возвращаем в пул
+                        item.kill()
+                        self.release_to_pool(item)
                     try:
                         audio = AudioManager.get_instance()
                     except Exception as e:
                         audio = None
-                        print(f"[Audio][Level1] Failed to get AudioManager: {e}")
+                        log.warning("[Audio][Level1] Failed to get AudioManager: %s", e)
                     if item_type == "coin":
                         self.player.coins += 1
                         if audio:
                             try:
                                 audio.sfx.play("player_collect_coin")
                             except Exception as e:
-                                print(f"[Audio][Level1] coin sfx failed: {e}")
+                                log.warning("[Audio][Level1] coin sfx failed: %s", e)
                     elif item_type == "jewel_blue":
                         self.player.coins += 10
                         if audio:
                             try:
                                 audio.sfx.play("player_collect_coin")
                             except Exception as e:
-                                print(f"[Audio][Level1] jewel sfx failed: {e}")
+                                log.warning("[Audio][Level1] jewel sfx failed: %s", e)
                     elif item_type == "key_yellow":
                         # логический флаг ключа для замка
                         self.player.collect_yellow_key()
@@ -672,72 +1024,121 @@ class Level:
                             try:
                                 audio.sfx.play("player_collect_coin")
                             except Exception as e:
-                                print(f"[Audio][Level1] key sfx failed: {e}")
+                                log.warning("[Audio][Level1] key sfx failed: %s", e)
 
     def check_enemy_collisions(self, enemy):
-        """Проверка столкновений врага с платформами"""
-        for platform in self.platforms:
-            if not platform.has_collision:
-                continue
-
-            if hasattr(platform, "check_collision") and platform.check_collision(
-                enemy.rect
-            ):
-                # Столкновение сверху
-                if (
-                    enemy.velocity.y > 0
-                    and enemy.rect.bottom > platform.rect.top
-                    and enemy.rect.top < platform.rect.top
-                    and abs(enemy.rect.bottom - platform.rect.top) < 20
-                ):
-
-                    enemy.rect.bottom = platform.rect.top
-                    enemy.velocity.y = 0
-                    return True
-
-                # Столкновение снизу
-                elif (
-                    enemy.velocity.y < 0
-                    and enemy.rect.top < platform.rect.bottom
-                    and enemy.rect.bottom > platform.rect.bottom
-                    and abs(enemy.rect.top - platform.rect.bottom) < 20
-                ):
-
-                    enemy.rect.top = platform.rect.bottom
-                    enemy.velocity.y = 0
-                    return True
-
-                # Столкновение сбоку
-                elif enemy.velocity.x != 0 and (
-                    (enemy.rect.right > platform.rect.left and enemy.direction > 0)
-                    or (enemy.rect.left < platform.rect.right and enemy.direction < 0)
-                ):
-
-                    enemy.direction *= -1
+        """
+        Проверка столкновений врага с платформами.
+
+        Проверяется набор коллизий уровня (объединённые прямоугольники и
+        отдельные платформы). Широкая фаза — коллайдеры из ячеек индекса,
+        которые пересекает enemy.rect: любая check_collision требует
+        пересечения с rect, так что остальные заведомо мимо. Точная проверка идёт
+        только для них; их число копится в enemy_narrow_checks и в
+        счётчике профайлера "enemy_checks".
+
+        Разрешается первое совпадение, поэтому кандидаты идут в порядке
+        добавления в группу, как при полном обходе: враг, касающийся пола
+        и стены сразу, выталкивается от той же платформы, что и раньше.
+        """
+        checks = 0
+        try:
+            for platform in self.colliders.query(enemy.rect, ordered=True):
+                if not platform.has_collision or not hasattr(platform, "check_collision"):
+                    continue
+                checks += 1
+                if self._resolve_enemy_platform(enemy, platform):
                     return True
+            return False
+        finally:
+            self.enemy_narrow_checks += checks
+            if profiler.enabled:
+                profiler.count("enemy_checks", checks)
+
+    def _resolve_enemy_platform(self, enemy, platform):
+        """Точная фаза: выталкивает врага из платформы или разворачивает его."""
+        if not platform.check_collision(enemy.rect):
+            return False
+
+        # Столкновение сверху
+        if (
+            enemy.velocity.y > 0
+            and enemy.rect.bottom > platform.rect.top
+            and enemy.rect.top < platform.rect.top
+            and abs(enemy.rect.bottom - platform.rect.top) < 20
+        ):
+
+            enemy.rect.bottom = platform.rect.top
+            enemy.velocity.y = 0
+            return True
+
+        # Столкновение снизу
+        elif (
+            enemy.velocity.y < 0
+            and enemy.rect.top < platform.rect.bottom
+            and enemy.rect.bottom > platform.rect.bottom
+            and abs(enemy.rect.top - platform.rect.bottom) < 20
+        ):
+
+            enemy.rect.top = platform.rect.bottom
+            enemy.velocity.y = 0
+            return True
+
+        # Столкновение сбоку
+        elif enemy.velocity.x != 0 and (
+            (enemy.rect.right > platform.rect.left and enemy.direction > 0)
+            or (enemy.rect.left < platform.rect.right and enemy.direction < 0)
+        ):
+
+            enemy.direction *= -1
+            return True
 
         return False
 
-    def draw(self, screen, camera):
-        """Отрисовка уровня в правильном порядке"""
-        screen.blit(self.background, (0, 0))
+    def draw_interpolated(self, sprite, screen, camera, alpha):
+        """Рисует спрайт между положением на прошлом и текущем тике."""
+        current = sprite.rect.topleft
+        position = lerp_position(self._previous_positions.get(sprite), current, alpha)
+        if position == current:
+            sprite.draw(screen, camera)
+            return
+        sprite.rect.topleft = position
+        try:
+            sprite.draw(screen, camera)
+        finally:
+            sprite.rect.topleft = current
 
-        # 1. Основные платформы
-        for platform in self.platforms:
-            platform.draw(screen, camera)
+    def draw(self, screen, camera, alpha=1.0):
+        """Отрисовка уровня в правильном порядке (alpha — доля следующего тика)"""
+        screen.blit(self.background, (0, 0))
 
-        # 2. Декорации
-        for decoration in self.decorations:
-            decoration.draw(screen, camera)
+        # 1-2. Платформы и декорации — готовыми чанками
+        chunk_blits = self.static_layers.draw(screen, camera)
+
+        # Рисуем только то, что попадает в камеру. Запас в один тайл нужен
+        # спрайтам, у которых картинка больше rect (например, пила).
+        if hasattr(camera, "visible_rect"):
+            view = camera.visible_rect(margin=128)
+            traps = self.traps.query(view)
+            enemies = self.enemies.query(view)
+            items = self.items.query(view)
+        else:
+            traps, enemies, items = self.traps, self.enemies, self.items
+
+        if profiler.enabled:
+            drawn = len(traps) + len(enemies) + len(items)
+            profiler.count("entities", drawn)
+            # Фон + чанки + по одному blit на сущность
+            profiler.count("blits", 1 + chunk_blits + drawn)
 
         # 3. Ловушки
-        for trap in self.traps:
+        for trap in traps:
             trap.draw(screen, camera)
 
         # 4. Враги
-        for enemy in self.enemies:
-            enemy.draw(screen, camera)
+        for enemy in enemies:
+            self.draw_interpolated(enemy, screen, camera, alpha)
 
         # 5. Предметы
-        for item in self.items:
-            item.draw(screen, camera)
+        for item in items:
+            self.draw_interpolated(item, screen, camera, alpha)
@@ -0,0 +1,265 @@
+# game/levels/synthetic.py
+"""
+Генератор синтетических уровней для нагрузочных прогонов.
+
+Строит TMX того же вида, что и level1.tmx (те же tilesets, слои и типы
+объектов), но любого размера и с любым числом врагов, ловушек и
+предметов. Рельеф — случайное блуждание высоты поверхности; на подъёмах
+стоят тайлы-склоны, над землёй — полупрозрачные платформы semiground.
+Генерация детерминирована: одинаковые параметры и seed дают байт в байт
+одинаковый файл.
+
+    path = write_synthetic_level("/tmp/big.tmx", width=1000, height=200,
+                                 slimes=500, snails=500, flies=500, seed=7)
+    level = Level("big", tmx_path=path)
+"""
+
+import base64
+import random
+import sys
+import zlib
+from array import array
+from dataclasses import asdict, dataclass
+
+from ..tmx_loader import GID_TYPECODE
+
+TILE_SIZE = 128
+
+# Tilesets level1.tmx: (firstgid, name, tilecount, columns, image, width, height, margin)
+TILESETS = (
+    (1, "spritesheet_ground", 128, 8, "Spritesheets/spritesheet_ground.png", 1024, 2048, 0),
+    (129, "spritesheet_items", 32, 8, "Spritesheets/spritesheet_items.png", 1024, 512, 0),
+    (161, "spritesheet_players", 128, 8, "Spritesheets/spritesheet_players.png", 1024, 2048, 0),
+    (289, "spritesheet_tiles", 128, 8, "Spritesheets/spritesheet_tiles.png", 1024, 2048, 0),
+    (417, "spritesheet_enemies", 105, 7, "Spritesheets/spritesheet_enemies.png", 1024, 2048, 2),
+    (522, "spritesheet_hud", 64, 8, "Spritesheets/spritesheet_hud.png", 1024, 1024, 0),
+)
+
+# GID тайлов (как в level1)
+GROUND_GID = 9
+SLOPE_GID = 25
+SEMI_LEFT_GID, SEMI_MIDDLE_GID, SEMI_RIGHT_GID = 57, 49, 41
+SPIKES_GID = 410
+DECORATION_GIDS = (347, 356, 364, 372, 380, 349)
+
+# GID картинки объекта по его типу
+OBJECT_GIDS = {
+    "player": 252,
+    "slime": 418,
+    "snail": 459,
+    "fly": 475,
+    "saw": 481,
+    "goldcoin": 158,
+    "ruby": 522,
+    "key": 572,
+    "box": 341,
+    "lock": 363,
+}
+
+
+@dataclass
+class SyntheticLevelSpec:
+    """Параметры синтетического уровня (размеры — в тайлах)."""
+
+    width: int = 200
+    height: int = 40
+    seed: int = 0
+    # Толщина земли под поверхностью
+    ground_depth: int = 3
+    # Вероятность, что высота поверхности меняется в следующей колонке;
+    # на каждом подъёме ставится тайл-склон
+    slope_density: float = 0.1
+    # Вероятность начать полупрозрачную платформу над колонкой
+    platform_density: float = 0.03
+    decoration_density: float = 0.02
+    slimes: int = 10
+    snails: int = 10
+    flies: int = 10
+    saws: int = 3
+    spikes: int = 10
+    coins: int = 30
+    rubies: int = 3
+    boxes: int = 5
+
+
+class _Builder:
+    """Собирает слои и объекты одного уровня по SyntheticLevelSpec."""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        size = spec.width * spec.height
+        self.layers = {
+            name: array(GID_TYPECODE, bytes(4 * size))
+            for name in ("ground", "triangleleft", "semiground", "traps", "decoration")
+        }
+        self.objects = {"enemy": [], "items": [], "spawn": []}
+        self.next_object_id = 1
+
+    def set_tile(self, layer, col, row, gid):
+        self.layers[layer][row * self.spec.width + col] = gid
+
+    def add_object(self, group, obj_type, col, row, width=TILE_SIZE, height=TILE_SIZE,
+                   dx=0, dy=0):
+        """Объект-тайл: в TMX y — нижняя граница, поэтому row + 1."""
+        self.objects[group].append(
+            (self.next_object_id, obj_type, OBJECT_GIDS[obj_type],
+             col * TILE_SIZE + dx, (row + 1) * TILE_SIZE + dy, width, height)
+        )
+        self.next_object_id += 1
+
+    def build(self):
+        spec = self.spec
+        rng = self.rng
+        low = max(2, spec.height * 2 // 5)
+        high = max(low, spec.height - spec.ground_depth - 1)
+
+        # Высота поверхности по колонкам — случайное блуждание
+        surface = []
+        row = (low + high) // 2
+        for col in range(spec.width):
+            if col > 1 and rng.random() < spec.slope_density:
+                row = min(high, max(low, row + rng.choice((-1, 1))))
+            surface.append(row)
+        self.surface = surface
+
+        for col, top in enumerate(surface):
+            for row in range(top, min(spec.height, top + spec.ground_depth)):
+                self.set_tile("ground", col, row, GROUND_GID)
+            # Подъём вправо на одну клетку — склон перед ступенькой
+            if col + 1 < spec.width and surface[col + 1] == top - 1:
+                self.set_tile("triangleleft", col, top - 1, SLOPE_GID)
+
+        # Ровные колонки (без склона и ступеньки рядом) — для врагов, шипов и предметов
+        flat = [
+            col for col in range(2, spec.width - 1)
+            if surface[col - 1] == surface[col] == surface[col + 1]
+        ]
+        if not flat:
+            flat = list(range(spec.width))
+
+        self.build_platforms(surface)
+        self.build_decorations(flat)
+        self.build_entities(flat)
+        return self
+
+    def build_platforms(self, surface):
+        spec = self.spec
+        col = 2
+        while col < spec.width - 3:
+            if self.rng.random() < spec.platform_density:
+                length = self.rng.randint(3, 5)
+                row = min(surface[col:col + length]) - self.rng.randint(3, 4)
+                if row >= 1:
+                    for i in range(length):
+                        gid = SEMI_MIDDLE_GID
+                        if i == 0:
+                            gid = SEMI_LEFT_GID
+                        elif i == length - 1:
+                            gid = SEMI_RIGHT_GID
+                        self.set_tile("semiground", col + i, row, gid)
+                col += length + 2
+            else:
+                col += 1
+
+    def build_decorations(self, flat):
+        for col in flat:
+            if self.rng.random() < self.spec.decoration_density:
+                gid = self.rng.choice(DECORATION_GIDS)
+                self.set_tile("decoration", col, self.surface[col] - 1, gid)
+
+    def build_entities(self, flat):
+        spec = self.spec
+        rng = self.rng
+        surface = self.surface
+
+        self.add_object("spawn", "player", 0, surface[0] - 1)
+
+        # Шипы — по разным ровным колонкам, подальше от спавна
+        candidates = [col for col in flat if col > 4]
+        for col in rng.sample(candidates, min(spec.spikes, len(candidates))):
+            self.set_tile("traps", col, surface[col] - 1, SPIKES_GID)
+
+        def ground_col():
+            return rng.choice(flat)
+
+        for obj_type, count in (("slime", spec.slimes), ("snail", spec.snails), ("saw", spec.saws)):
+            for _ in range(count):
+                col = ground_col()
+                self.add_object("enemy", obj_type, col, surface[col] - 1, dx=rng.randint(0, 64))
+        for _ in range(spec.flies):
+            col = ground_col()
+            self.add_object("enemy", "fly", col, surface[col] - rng.randint(3, 5), dx=rng.randint(0, 64))
+
+        for obj_type, count in (("goldcoin", spec.coins), ("ruby", spec.rubies)):
+            for _ in range(count):
+                col = ground_col()
+                self.add_object("items", obj_type, col, surface[col] - rng.randint(2, 3))
+        for _ in range(spec.boxes):
+            col = ground_col()
+            self.add_object("items", "box", col, surface[col] - 3)
+
+        # Ключ в начале уровня, дверь с замком — в конце
+        self.add_object("items", "key", 3, surface[3] - 2)
+        last = spec.width - 2
+        self.add_object("items", "lock", last, surface[last] - 1, width=32, height=32, dx=48, dy=-48)
+
+
+def _encode_layer(gids):
+    if sys.byteorder != "little":
+        gids = array(gids.typecode, gids)
+        gids.byteswap()
+    return base64.b64encode(zlib.compress(gids.tobytes())).decode("ascii")
+
+
+def generate_tmx(spec=None, **params):
+    """Возвращает текст TMX для spec (или для параметров SyntheticLevelSpec)."""
+    spec = spec or SyntheticLevelSpec(**params)
+    builder = _Builder(spec).build()
+    width, height = spec.width, spec.height
+
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        f'<map version="1.10" orientation="orthogonal" renderorder="right-down" '
+        f'width="{width}" height="{height}" tilewidth="{TILE_SIZE}" tileheight="{TILE_SIZE}" '
+        f'infinite="0" nextlayerid="9" nextobjectid="{builder.next_object_id}">\n',
+        " <properties>\n",
+    ]
+    for key, value in asdict(spec).items():
+        parts.append(f'  <property name="synthetic.{key}" value="{value}"/>\n')
+    parts.append(" </properties>\n")
+
+    for firstgid, name, tilecount, columns, image, image_w, image_h, margin in TILESETS:
+        margin_attr = f' margin="{margin}"' if margin else ""
+        parts.append(
+            f' <tileset firstgid="{firstgid}" name="{name}" tilewidth="{TILE_SIZE}" '
+            f'tileheight="{TILE_SIZE}"{margin_attr} tilecount="{tilecount}" columns="{columns}">\n'
+            f'  <image source="{image}" width="{image_w}" height="{image_h}"/>\n'
+            f" </tileset>\n"
+        )
+
+    for layer_id, (name, gids) in enumerate(builder.layers.items(), start=1):
+        parts.append(
+            f' <layer id="{layer_id}" name="{name}" width="{width}" height="{height}">\n'
+            f'  <data encoding="base64" compression="zlib">{_encode_layer(gids)}</data>\n'
+            f" </layer>\n"
+        )
+
+    for group_id, (name, objects) in enumerate(builder.objects.items(), start=6):
+        parts.append(f' <objectgroup id="{group_id}" name="{name}">\n')
+        for obj_id, obj_type, gid, x, y, w, h in objects:
+            parts.append(
+                f'  <object id="{obj_id}" type="{obj_type}" gid="{gid}" '
+                f'x="{x}" y="{y}" width="{w}" height="{h}"/>\n'
+            )
+        parts.append(" </objectgroup>\n")
+
+    parts.append("</map>\n")
+    return "".join(parts)
+
+
+def write_synthetic_level(path, spec=None, **params):
+    """Генерирует уровень и записывает его в path. Возвращает path."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(generate_tmx(spec, **params))
+    return path
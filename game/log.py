@@ -0,0 +1,111 @@
+# game/log.py
+"""
+Журнал игры: стандартный logging с уровнями по подсистемам.
+
+Раньше враги, загрузчик ассетов и уровень печатали в консоль через print
+прямо в горячем цикле (слайм — каждый кадр, пока ранен или умирает), и при
+сотнях врагов вывод в консоль сам по себе ронял кадры. Теперь каждая
+подсистема пишет в свой логгер:
+
+    from .log import get_logger
+
+    log = get_logger("enemies")
+    log.debug("💀 Анимация смерти: %.2f сек осталось", self.death_timer)
+
+Сообщения форматируются только если уровень включён: аргументы передаются
+отдельно (%-стиль), а не f-строкой. Включённые записи уходят в очередь,
+а в файл и консоль их пишет фоновый поток (QueueListener), так что
+игровой цикл не ждёт ввода-вывода.
+
+Без setup_logging() действует поведение logging по умолчанию: видны только
+предупреждения и ошибки.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+ROOT_LOGGER = "game"
+# Подсистемы, у которых в config.json можно задать свой уровень
+SUBSYSTEMS = ("assets", "audio", "camera", "enemies", "level", "player", "traps")
+FILE_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+CONSOLE_FORMAT = "%(message)s"
+
+_listener = None
+_queue_handler = None
+
+
+def get_logger(subsystem):
+    """Логгер подсистемы: get_logger("enemies") -> logging.getLogger("game.enemies")."""
+    return logging.getLogger(f"{ROOT_LOGGER}.{subsystem}")
+
+
+def parse_level(level):
+    """Уровень из строки конфига ("debug", "WARNING") или числа."""
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Неизвестный уровень журнала: {level}")
+    return value
+
+
+def setup_logging(level="WARNING", levels=None, file=None, console=True):
+    """
+    Настраивает журнал игры: общий уровень, уровни подсистем (levels —
+    {"enemies": "DEBUG", ...}) и фоновую запись в file и/или консоль.
+    Повторный вызов заменяет прежнюю настройку.
+    """
+    global _listener, _queue_handler
+    shutdown_logging()
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(parse_level(level))
+    for subsystem in SUBSYSTEMS:
+        get_logger(subsystem).setLevel(logging.NOTSET)
+    for subsystem, subsystem_level in (levels or {}).items():
+        get_logger(subsystem).setLevel(parse_level(subsystem_level))
+
+    handlers = []
+    if file:
+        file_handler = logging.FileHandler(file, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter(FILE_FORMAT))
+        handlers.append(file_handler)
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        handlers.append(console_handler)
+    if not handlers:
+        # Некуда писать — глушим журнал игры целиком
+        root.addHandler(logging.NullHandler())
+        root.propagate = False
+        return None
+
+    records = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(records)
+    root.addHandler(_queue_handler)
+    # Записи не дублируются в корневой логгер Python
+    root.propagate = False
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Дописывает очередь, останавливает фоновый поток и закрывает файлы."""
+    global _listener, _queue_handler
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        if handler is _queue_handler or isinstance(handler, logging.NullHandler):
+            root.removeHandler(handler)
+    root.propagate = True
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+    _listener = None
+    _queue_handler = None
+
+
+atexit.register(shutdown_logging)
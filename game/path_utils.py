@@ -27,3 +27,36 @@ def resource_path(*parts: str) -> str:
         # Development mode: calculate project root (parent of 'game' directory)
         base = os.path.dirname(os.path.dirname(__file__))
     return os.path.join(base, *parts)
+
+
+# Папка игры в пользовательских каталогах (кэш и т.п.)
+APP_DIR_NAME = "rpg_platformer"
+
+
+def user_cache_dir(*parts: str) -> str:
+    """Get a per-user cache directory for the game (the directory is not created).
+
+    Unlike resource_path, this location survives between runs of a
+    PyInstaller bundle, whose extraction directory is temporary:
+    - Windows: %LOCALAPPDATA%\\rpg_platformer
+    - macOS: ~/Library/Caches/rpg_platformer
+    - Other: $XDG_CACHE_HOME/rpg_platformer (default ~/.cache/rpg_platformer)
+
+    Args:
+        *parts: Path components inside the game cache directory
+
+    Returns:
+        str: Absolute path inside the per-user cache directory
+
+    Example:
+        >>> user_cache_dir("level_cache")
+        # Windows: "C:/Users/User/AppData/Local/rpg_platformer/level_cache"
+    """
+    home = os.path.expanduser("~")
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(home, "AppData", "Local")
+    elif sys.platform == "darwin":
+        base = os.path.join(home, "Library", "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(home, ".cache")
+    return os.path.join(base, APP_DIR_NAME, *parts)
@@ -1,23 +1,28 @@
 # game/platform.py
 import pygame
 from .asset_loader import asset_loader
+from .sprite_sets import sprite_sets
+from .collision_map import HALF, SLOPE, collision_kind_for_type
 
 class Platform(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height, platform_type="grass", is_trap=False, is_door=False):
         super().__init__()
         
         self.platform_type = platform_type
+        # Тип коллизии вычисляется один раз, а не строковыми проверками на каждый запрос
+        self.collision_kind = collision_kind_for_type(platform_type)
         self.is_trap = is_trap
         self.is_door = is_door
         
         # 🔥 ИСПОЛЬЗУЕМ TILESET ДЛЯ ПОЛУЧЕНИЯ ИЗОБРАЖЕНИЯ
         self.image = self.get_tile_image(platform_type)
         if self.image:
-            self.image = pygame.transform.scale(self.image, (width, height))
+            # Тайл совпадает по размеру — общий тайл из тайлсета без копии,
+            # иначе одна масштабированная копия на (тайл, размер)
+            self.image = sprite_sets.scaled(self.image, (width, height))
         else:
             # Заглушка если тайл не найден
-            self.image = pygame.Surface((width, height))
-            self.image.fill((100, 200, 100))  # Зеленый для платформ
+            self.image = sprite_sets.placeholder((width, height), (100, 200, 100))  # Зеленый для платформ
         
         self.rect = self.image.get_rect(topleft=(x, y))
         self.has_collision = True
@@ -29,7 +34,7 @@ class Platform(pygame.sprite.Sprite):
     
     def create_collision_rect(self):
         """Создает специальные collision rect для разных типов платформ"""
-        if self.platform_type.startswith("semitype"):
+        if self.collision_kind == HALF:
             # 🔥 ДЛЯ SEMITYPE: урезаем в 2 раза снизу (верхняя половина)
             return pygame.Rect(
                 self.rect.x,
@@ -49,7 +54,7 @@ class Platform(pygame.sprite.Sprite):
         if not self.has_collision:
             return False
 
-        if self.platform_type == "triangle":
+        if self.collision_kind == SLOPE:
             return self._check_triangle_collision(other_rect)
 
         return self.collision_rect.colliderect(other_rect)
@@ -74,28 +79,15 @@ class Platform(pygame.sprite.Sprite):
         if sample_left >= sample_right:
             return False
 
-        bottom = other_rect.bottom
-        top = other_rect.top
+        # Склон поднимается слева направо, поэтому выше всего поверхность
+        # на правом краю пересечения: если низ прямоугольника не достаёт до
+        # неё там, то не достаёт и левее — одной точки достаточно
+        relative_x = (sample_right - triangle_rect.left) / triangle_rect.width
+        relative_x = max(0.0, min(1.0, relative_x))
+        surface_y = triangle_rect.bottom - relative_x * triangle_rect.height
 
-        # Проверяем несколько точек по ширине пересечения (лево, центр, право)
-        sample_points = (
-            sample_left,
-            (sample_left + sample_right) * 0.5,
-            sample_right,
-        )
-
-        for point_x in sample_points:
-            relative_x = (point_x - triangle_rect.left) / triangle_rect.width
-            relative_x = max(0.0, min(1.0, relative_x))
-
-            slope_height = relative_x * triangle_rect.height
-            surface_y = triangle_rect.bottom - slope_height
-
-            # Толеранс помогает при высокой скорости движения
-            if bottom >= surface_y - 2 and top <= triangle_rect.bottom + 2:
-                return True
-
-        return False
+        # Толеранс помогает при высокой скорости движения
+        return other_rect.bottom >= surface_y - 2 and other_rect.top <= triangle_rect.bottom + 2
     
     
     
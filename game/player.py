@@ -1,6 +1,37 @@
 import pygame
-from .asset_loader import asset_loader
+from .asset_loader import asset_loader, get_flipped
+from .log import get_logger
+from .sprite_sets import sprite_sets
 from game.assets.audio import AudioManager
+from .collision_map import BOX, SLOPE
+from .colliders import sweep_step
+from .slopes import SlopeHeightfield
+from .timestep import lerp_position
+
+# Запас вокруг хитбокса при запросе платформ из пространственного индекса:
+# по горизонтали — один тайл (соседние тайлы склона), по вертикали — полтайла
+COLLISION_QUERY_MARGIN_X = 128
+COLLISION_QUERY_MARGIN_Y = 64
+
+# Скорости, гравитация и анимация игрока заданы «на тик 60 Гц»; при другом
+# шаге симуляции они масштабируются на dt * BASE_TICK_RATE
+BASE_TICK_RATE = 60
+
+log = get_logger("player")
+
+
+def load_player_frames():
+    """Спрайты анимаций игрока (один набор на всех игроков)"""
+    return {
+        "idle": [asset_loader.load_image("player/alienPink_front.png", 0.6)],
+        "run": [
+            asset_loader.load_image("player/alienPink_stand.png", 0.6),
+            asset_loader.load_image("player/alienPink_walk1.png", 0.6),
+            asset_loader.load_image("player/alienPink_walk2.png", 0.6),
+        ],
+        "jump": [asset_loader.load_image("player/alienPink_jump.png", 0.6)],
+        "land": [asset_loader.load_image("player/alienPink_duck.png", 0.6)],
+    }
 
 
 class Player:
@@ -31,6 +62,17 @@ class Player:
     def __init__(self, x, y):
         self.rect = pygame.Rect(x, y, 80, 100)
         self.hitbox = pygame.Rect(10, 10, 60, 90)
+        # Хитбокс в мировых координатах и область запроса к индексу платформ:
+        # по одному Rect на игрока, сдвигаются на месте (см. world_hitbox)
+        self._world_hitbox = self.hitbox.move(x, y)
+        self._query_area = self._world_hitbox.inflate(
+            2 * COLLISION_QUERY_MARGIN_X, 2 * COLLISION_QUERY_MARGIN_Y
+        )
+        self._sweep_area = self._world_hitbox.copy()
+        # Точное (float) положение: шаг dt * BASE_TICK_RATE дробный при любой
+        # частоте тиков, кроме 60, и не должен теряться при округлении rect
+        self.pos_x = float(x)
+        self.pos_y = float(y)
 
         self.velocity_y = 0
         self.velocity_x = 0
@@ -81,12 +123,18 @@ class Player:
         self.respawn_timer = 0
         self.respawn_duration = 2.0
         self.respawn_position = (x, y)
+        # Ниже этой высоты игрок погибает от падения (уровень задаёт свою)
+        self.fall_death_y = 3000
 
         # 🔥 ДОБАВЛЕНО: Переменные для предотвращения дрожания
         self.blocked_left = False
         self.blocked_right = False
         self.on_slope = False
 
+        # Карта высот склонов уровня (устанавливается уровнем); без неё
+        # соседние склоны ищутся среди платформ, переданных в коллизии
+        self.slopes = None
+
         # Callback, который может быть установлен уровнем для обработки удара по ящику
         self.on_box_hit = None
 
@@ -94,7 +142,7 @@ class Player:
         self.on_respawn = None
 
         self.health_component = self.HealthComponent(60)
-        print(f"🎯 Player created at position: ({x}, {y})")
+        log.debug("🎯 Player created at position: (%s, %s)", x, y)
 
         # Загрузка спрайтов
         self.load_sprites()
@@ -104,23 +152,23 @@ class Player:
         self.old_x = x
         self.old_y = y
 
+        # Положение на прошлом тике — для интерполяции при отрисовке
+        self.prev_pos = (x, y)
+
     def collect_yellow_key(self):
         """Отмечает, что игрок подобрал жёлтый ключ."""
         self.has_yellow_key = True
-        print("🔑 Yellow key collected")
+        log.info("🔑 Yellow key collected")
 
     def load_sprites(self):
-        """Загружает все спрайты для анимаций"""
-        self.idle_sprite = asset_loader.load_image("player/alienPink_front.png", 0.6)
-        self.run_sprites = [
-            asset_loader.load_image("player/alienPink_stand.png", 0.6),
-            asset_loader.load_image("player/alienPink_walk1.png", 0.6),
-            asset_loader.load_image("player/alienPink_walk2.png", 0.6),
-        ]
-        self.jump_sprite = asset_loader.load_image("player/alienPink_jump.png", 0.6)
-        self.land_sprite = asset_loader.load_image("player/alienPink_duck.png", 0.6)
-
-    def update_animation(self, moved):
+        """Берёт общий набор спрайтов для анимаций игрока"""
+        self.sprites = sprite_sets.animation("player", load_player_frames)
+        self.idle_sprite = self.sprites.frame("idle")
+        self.run_sprites = self.sprites.frames("run")
+        self.jump_sprite = self.sprites.frame("jump")
+        self.land_sprite = self.sprites.frame("land")
+
+    def update_animation(self, moved, dt=1 / BASE_TICK_RATE):
         """Обновляет анимацию в зависимости от состояния игрока"""
         if not self.is_alive:
             return
@@ -144,7 +192,7 @@ class Player:
             self.animation_timer = 0
 
         # Прогресс таймера анимации
-        self.animation_timer += self.animation_speed
+        self.animation_timer += self.animation_speed * (dt * BASE_TICK_RATE)
 
         if self.current_state == "run":
             # Бег — циклическая анимация
@@ -175,10 +223,15 @@ class Player:
         self.current_state = "idle"
         self.current_sprite = self.idle_sprite
 
-    def update(self, platforms, enemies, current_time, traps=None):
-        """Обновление состояния игрока с системой урона"""
+    def store_previous_position(self):
+        """Запоминает положение в начале тика (вызывается до handle_keys)."""
+        self.prev_pos = self.rect.topleft
+
+    def update(self, platforms, enemies, current_time, traps=None, dt=1 / BASE_TICK_RATE):
+        """Обновление состояния игрока с системой урона (один тик длиной dt)"""
+        step = dt * BASE_TICK_RATE
         if not self.is_alive:
-            self.respawn_timer -= 1 / 60
+            self.respawn_timer -= dt
             if self.respawn_timer <= 0:
                 self.respawn()
             return
@@ -188,7 +241,7 @@ class Player:
         self.old_y = self.rect.y
 
         # Смерть при падении за карту
-        if self.rect.y > 3000:
+        if self.rect.y > self.fall_death_y:
             self.health_component.current_health = 0
             self.die()
 
@@ -198,13 +251,13 @@ class Player:
 
         # Таймер неуязвимости
         if self.is_invincible:
-            self.invincibility_timer -= 1 / 60
+            self.invincibility_timer -= dt
             if self.invincibility_timer <= 0:
                 self.is_invincible = False
 
         # Таймер отскока
         if self.is_knockback:
-            self.knockback_timer -= 1 / 60
+            self.knockback_timer -= dt
             if self.knockback_timer <= 0:
                 self.is_knockback = False
                 self.velocity_x = 0
@@ -215,9 +268,11 @@ class Player:
         if not self.is_knockback:
             self.handle_horizontal_collisions(platforms)
 
-        # Применяем гравитацию
-        self.velocity_y += self.gravity
-        self.rect.y += self.velocity_y
+        # Применяем гравитацию; шаг по вертикали обрезается на первой
+        # встреченной платформе, чтобы быстрое падение (или большой dt)
+        # не проскакивало тонкие полублоки
+        self.velocity_y += self.gravity * step
+        self.move_y(sweep_step(platforms, self.world_hitbox, self.velocity_y * step, self._sweep_area))
 
         # Обрабатываем вертикальные столкновения
         self.handle_vertical_collisions(platforms)
@@ -228,7 +283,7 @@ class Player:
         elif was_on_ground:
             self.time_since_ground = 0
         else:
-            self.time_since_ground += 1 / 60
+            self.time_since_ground += dt
 
         # Автопрыжок по буферу
         if not self.is_knockback and self.jump_buffer > 0 and self.can_jump():
@@ -238,6 +293,29 @@ class Player:
         # Проверка врагов
         self.check_enemy_collisions(enemies, current_time)
 
+    def get_nearby_platforms(self, platforms):
+        """
+        Возвращает платформы-кандидаты для проверки коллизий.
+
+        Если platforms поддерживает query() (SpatialGroup уровня), берём только
+        платформы из ячеек вокруг хитбокса. Иначе (обычный список) — все.
+        Проверки коллизий останавливаются на первой подходящей платформе,
+        поэтому кандидаты идут в порядке группы (ordered=True), а не ячеек.
+        """
+        if hasattr(platforms, "query"):
+            hitbox = self.world_hitbox
+            area = self._query_area
+            area.x = hitbox.x - COLLISION_QUERY_MARGIN_X
+            area.y = hitbox.y - COLLISION_QUERY_MARGIN_Y
+            return platforms.query(area, ordered=True)
+        return platforms
+
+    def get_slope_heightfield(self, platforms):
+        """Карта высот склонов уровня или собранная по переданным платформам."""
+        if self.slopes is not None:
+            return self.slopes
+        return SlopeHeightfield.from_platforms(platforms)
+
     def handle_horizontal_collisions(self, platforms):
         """Обрабатывает горизонтальные столкновения для ВСЕХ типов движения"""
         # 🔥 СБРАСЫВАЕМ ФЛАГИ БЛОКИРОВКИ ПЕРЕД ПРОВЕРКОЙ
@@ -245,11 +323,13 @@ class Player:
         self.blocked_right = False
         self.on_slope = False
 
+        platforms = self.get_nearby_platforms(platforms)
+
         # Сначала обрабатываем все треугольные платформы, чтобы понять, стоим ли мы на склоне
         for platform in platforms:
             if hasattr(platform, "has_collision") and not platform.has_collision:
                 continue
-            if getattr(platform, "platform_type", None) != "triangle":
+            if getattr(platform, "collision_kind", None) != SLOPE:
                 continue
             if not self.check_collision(platform):
                 continue
@@ -259,7 +339,7 @@ class Player:
             self.handle_triangle_collision(platform, platforms)
 
             # If we're on a slope and moving horizontally, adjust vertical position
-            player_hitbox = self.get_actual_hitbox()
+            player_hitbox = self.world_hitbox
             if self.on_ground and abs(self.velocity_x) > 0:
                 # Calculate the expected Y position on the slope based on X position
                 relative_x = (player_hitbox.centerx - platform.rect.left) / platform.rect.width
@@ -271,15 +351,15 @@ class Player:
 
                 # If we're moving right and approaching the edge, look for next slope
                 if relative_x > 0.7 and self.velocity_x > 0:
-                    for next_platform in platforms:
-                        if (getattr(next_platform, "platform_type", None) == "triangle" and 
-                            abs(next_platform.rect.left - platform.rect.right) < 5):
-                            # Found adjacent slope, adjust position to transition smoothly
-                            next_relative_x = (player_hitbox.centerx - next_platform.rect.left) / next_platform.rect.width
-                            next_relative_x = max(0.0, min(1.0, next_relative_x))
-                            next_slope_height = next_relative_x * next_platform.rect.height
-                            expected_y = next_platform.rect.bottom - next_slope_height - self.hitbox.height - self.hitbox.y
-                            break
+                    slopes = self.get_slope_heightfield(platforms)
+                    cell = slopes.cell_of(platform.rect)
+                    next_cell = slopes.next_slope_right(*cell) if cell else None
+                    if next_cell is not None:
+                        # Found adjacent slope, adjust position to transition smoothly
+                        next_surface_y = slopes.run_at(*next_cell).surface_y(
+                            player_hitbox.centerx, next_cell[0]
+                        )
+                        expected_y = next_surface_y - self.hitbox.height - self.hitbox.y
 
                 # Smoothly adjust Y position to match slope
                 if abs(self.rect.y - expected_y) < 20:  # Only adjust if difference is reasonable
@@ -290,7 +370,7 @@ class Player:
             # Пропускаем платформы без коллизий
             if hasattr(platform, "has_collision") and not platform.has_collision:
                 continue
-            if getattr(platform, "platform_type", None) == "triangle":
+            if getattr(platform, "collision_kind", None) == SLOPE:
                 continue
 
             if self.check_collision(platform):
@@ -306,7 +386,7 @@ class Player:
                     platform_top = platform.rect.top
                     platform_bottom = platform.rect.bottom
 
-                player_hitbox = self.get_actual_hitbox()
+                player_hitbox = self.world_hitbox
 
                 # Only handle as horizontal collision if there's significant vertical overlap
                 vertical_overlap = min(player_hitbox.bottom, platform_bottom) - max(player_hitbox.top, platform_top)
@@ -362,6 +442,8 @@ class Player:
         """Обрабатывает вертикальные столкновения"""
         self.on_ground = False
 
+        platforms = self.get_nearby_platforms(platforms)
+
         for platform in platforms:
             # Пропускаем платформы без коллизий
             if hasattr(platform, "has_collision") and not platform.has_collision:
@@ -369,7 +451,7 @@ class Player:
 
             if self.check_collision(platform):
                 # 🔥 ОСОБАЯ ОБРАБОТКА ДЛЯ ТРЕУГОЛЬНИКОВ
-                if platform.platform_type == "triangle":
+                if getattr(platform, "collision_kind", None) == SLOPE:
                     self.handle_triangle_collision(platform, platforms)
                     continue
 
@@ -391,13 +473,13 @@ class Player:
 
                 elif self.velocity_y < 0:  # Движение вверх
                     # Ударились головой о нижнюю часть платформы
-                    if getattr(platform, "platform_type", None) == "box" and callable(
+                    if getattr(platform, "collision_kind", None) == BOX and callable(
                         getattr(self, "on_box_hit", None)
                     ):
                         try:
                             self.on_box_hit(platform)
                         except Exception as e:
-                            print(f"[Player] on_box_hit callback failed: {e}")
+                            log.error("[Player] on_box_hit callback failed: %s", e)
                     self.rect.top = platform_bottom
                     self.velocity_y = 0
                 break
@@ -405,7 +487,7 @@ class Player:
     def handle_triangle_collision(self, triangle, platforms=None):
         """Обрабатывает столкновение с треугольной платформой (правый треугольник, подъём слева направо)"""
         self.on_slope = True
-        player_hitbox = self.get_actual_hitbox()
+        player_hitbox = self.world_hitbox
 
         # Горизонтальная проекция игрока должна быть над треугольником
         player_center_x = player_hitbox.centerx
@@ -443,18 +525,12 @@ class Player:
 
         # Check if we're near the right edge and moving right
         if (relative_x > 0.8 and self.velocity_x > 0 and platforms):
-            # Look for next triangle tile to the right
-            next_tile_x = triangle_right
-            next_tile_y = triangle_bottom
-
-            # Find any triangle tile at this position
-            for platform in platforms:
-                if (platform.platform_type == "triangle" and 
-                    abs(platform.rect.left - next_tile_x) < 5 and 
-                    abs(platform.rect.bottom - next_tile_y) < 5):
-                    # Found adjacent triangle tile, increase tolerance
-                    look_ahead_distance = 30
-                    break
+            # Next triangle tile to the right in the same row of the heightfield
+            slopes = self.get_slope_heightfield(platforms)
+            cell = slopes.cell_of(triangle.rect)
+            if cell is not None and (cell[0] + 1, cell[1]) in slopes:
+                # Found adjacent triangle tile, increase tolerance
+                look_ahead_distance = 30
 
         # 🔥 FIX: Adaptive tolerance at slope peak for smooth transition
         if relative_x > 0.85:
@@ -477,21 +553,56 @@ class Player:
             self.velocity_y = 0
             self.time_since_ground = 0
 
+    @property
+    def world_hitbox(self):
+        """
+        Хитбокс в мировых координатах.
+
+        Это всегда один и тот же Rect: он сдвигается на месте, только если
+        позиция игрока изменилась с прошлого обращения, а не создаётся на
+        каждую проверку коллизии. Снаружи его не изменяют; чтобы сохранить
+        положение, берут копию (.copy()).
+        """
+        hitbox = self._world_hitbox
+        offset = self.hitbox
+        x = self.rect.x + offset.x
+        y = self.rect.y + offset.y
+        if hitbox.x != x or hitbox.y != y:
+            hitbox.x = x
+            hitbox.y = y
+        return hitbox
+
+    def move_x(self, dx):
+        """Сдвигает точное положение по X и переносит его в rect."""
+        # rect передвинули снаружи (столкновение, респаун) — он главнее
+        if round(self.pos_x) != self.rect.x:
+            self.pos_x = float(self.rect.x)
+        self.pos_x += dx
+        self.rect.x = round(self.pos_x)
+
+    def move_y(self, dy):
+        """Сдвигает точное положение по Y и переносит его в rect."""
+        if round(self.pos_y) != self.rect.y:
+            self.pos_y = float(self.rect.y)
+        self.pos_y += dy
+        self.rect.y = round(self.pos_y)
+
     def get_actual_hitbox(self):
-        """Возвращает актуальный хитбокс в мировых координатах"""
-        return pygame.Rect(
-            self.rect.x + self.hitbox.x,
-            self.rect.y + self.hitbox.y,
-            self.hitbox.width,
-            self.hitbox.height,
-        )
+        """
+        Возвращает актуальный хитбокс в мировых координатах — новый Rect,
+        который можно хранить и менять. Горячие пути читают world_hitbox.
+        """
+        return self.world_hitbox.copy()
 
     def check_enemy_collisions(self, enemies, current_time):
         """Проверяет столкновения с врагами"""
         if not enemies:
             return
 
-        if hasattr(enemies, "sprites"):
+        if hasattr(enemies, "query"):
+            # Широкая фаза: только враги из ячеек индекса под хитбоксом игрока
+            enemy_iterable = enemies.query(self.world_hitbox)
+        elif hasattr(enemies, "sprites"):
             enemy_iterable = enemies.sprites()
         else:
             enemy_iterable = enemies
@@ -535,7 +646,7 @@ class Player:
                 try:
                     AudioManager.get_instance().sfx.play("player_take_damage")
                 except Exception as e:
-                    print(f"[Audio][Player] take_damage sfx failed: {e}")
+                    log.warning("[Audio][Player] take_damage sfx failed: %s", e)
 
                 self.is_invincible = True
                 self.invincibility_timer = self.invincibility_duration
@@ -561,7 +672,7 @@ class Player:
         try:
             AudioManager.get_instance().sfx.play("player_death")
         except Exception as e:
-            print(f"[Audio][Player] death sfx failed: {e}")
+            log.warning("[Audio][Player] death sfx failed: %s", e)
 
         self.is_alive = False
         self.respawn_timer = self.respawn_duration
@@ -582,13 +693,16 @@ class Player:
         self.invincibility_timer = 3.0
         self.current_state = "idle"
         self.current_sprite = self.idle_sprite
+        self.pos_x, self.pos_y = float(self.rect.x), float(self.rect.y)
+        # Телепорт на точку респауна не интерполируем
+        self.prev_pos = self.rect.topleft
 
         # Вызываем callback респавна, если он установлен (для возрождения врагов и т.д.)
         if callable(self.on_respawn):
             try:
                 self.on_respawn()
             except Exception as e:
-                print(f"[Player] on_respawn callback failed: {e}")
+                log.error("[Player] on_respawn callback failed: %s", e)
 
     def check_collision_with_enemy(self, enemy):
         """Проверка коллизии с врагом"""
@@ -597,7 +711,7 @@ class Player:
         if hasattr(enemy, "is_hurt") and enemy.is_hurt:
             return False
 
-        return self.get_actual_hitbox().colliderect(enemy.rect)
+        return self.world_hitbox.colliderect(enemy.rect)
 
     def handle_event(self, event):
         """Обработка событий"""
@@ -611,20 +725,21 @@ class Player:
             self.handle_landing_animation()
             pygame.time.set_timer(pygame.USEREVENT + 1, 0)
 
-    def handle_keys(self, keys, platforms):
+    def handle_keys(self, keys, platforms, dt=1 / BASE_TICK_RATE):
         """🔥 ИСПРАВЛЕНИЕ: Теперь принимает platforms как параметр"""
         if not self.is_alive or self.is_knockback:
             return
 
         moved = False
+        distance = self.speed * (dt * BASE_TICK_RATE)
 
         # 🔥 ИСПРАВЛЕНИЕ: ПРОВЕРЯЕМ БЛОКИРОВКУ ПЕРЕД ДВИЖЕНИЕМ
         if (keys[pygame.K_LEFT] or keys[pygame.K_a]) and not self.blocked_left:
-            self.rect.x -= self.speed
+            self.move_x(-distance)
             self.facing_right = False
             moved = True
         if (keys[pygame.K_RIGHT] or keys[pygame.K_d]) and not self.blocked_right:
-            self.rect.x += self.speed
+            self.move_x(distance)
             self.facing_right = True
             moved = True
 
@@ -632,7 +747,7 @@ class Player:
         if moved:
             self.handle_horizontal_collisions(platforms)
 
-        self.update_animation(moved)
+        self.update_animation(moved, dt)
 
     def can_jump(self):
         return (
@@ -649,7 +764,7 @@ class Player:
             try:
                 AudioManager.get_instance().sfx.play("player_jump")
             except Exception as e:
-                print(f"[Audio][Player] jump sfx failed: {e}")
+                log.warning("[Audio][Player] jump sfx failed: %s", e)
 
     def check_collision(self, platform):
         """Проверка коллизии с платформой"""
@@ -659,13 +774,17 @@ class Player:
 
         # 🔥 ИСПОЛЬЗУЕМ НОВУЮ СИСТЕМУ КОЛЛИЗИЙ
         if hasattr(platform, "check_collision"):
-            return platform.check_collision(self.get_actual_hitbox())
+            return platform.check_collision(self.world_hitbox)
         else:
             # Фолбэк на старую систему
-            return self.get_actual_hitbox().colliderect(platform.rect)
+            return self.world_hitbox.colliderect(platform.rect)
 
     def check_trap_collisions(self, traps, current_time):
         """Проверка столкновений с ловушками"""
+        if hasattr(traps, "query"):
+            # Широкая фаза: ловушки из ячеек индекса под хитбоксом — его же
+            # проверяют и пила, и шипы
+            traps = traps.query(self.world_hitbox)
         for trap in traps:
             if hasattr(trap, "check_collision") and trap.check_collision(self):
                 self.take_damage_from_trap(trap.damage)
@@ -680,7 +799,7 @@ class Player:
                 try:
                     AudioManager.get_instance().sfx.play("player_take_damage")
                 except Exception as e:
-                    print(f"[Audio][Player] trap damage sfx failed: {e}")
+                    log.warning("[Audio][Player] trap damage sfx failed: %s", e)
 
                 self.is_invincible = True
                 self.invincibility_timer = self.invincibility_duration
@@ -689,20 +808,26 @@ class Player:
                 if self.health_component.current_health <= 0:
                     self.die()
 
-    def draw(self, screen, camera):
-        """Отрисовка игрока"""
+    def draw(self, screen, camera, alpha=1.0):
+        """Отрисовка игрока (alpha — доля следующего тика для интерполяции)"""
         if not self.is_alive:
             return
 
-        screen_x = self.rect.x - camera.offset.x
-        screen_y = self.rect.y - camera.offset.y
+        # Вне камеры — не рисуем
+        if hasattr(camera, "visible_rect") and not camera.visible_rect().colliderect(
+            self.rect
+        ):
+            return
+
+        x, y = lerp_position(self.prev_pos, self.rect.topleft, alpha)
+        screen_x = x - camera.offset.x
+        screen_y = y - camera.offset.y
 
         if self.is_invincible and int(self.invincibility_timer * 10) % 2 == 0:
             return
 
         if self.current_sprite:
             if not self.facing_right:
-                flipped_sprite = pygame.transform.flip(self.current_sprite, True, False)
-                screen.blit(flipped_sprite, (screen_x, screen_y))
+                screen.blit(get_flipped(self.current_sprite), (screen_x, screen_y))
             else:
                 screen.blit(self.current_sprite, (screen_x, screen_y))
@@ -0,0 +1,111 @@
+# game/pooling.py
+"""
+Пулы объектов: переиспользование врагов и предметов вместо создания новых.
+
+Конструкторы Slime/Snail/Fly грузят спрайты и печатают в консоль, Item
+масштабирует картинку, поэтому респавн сотни врагов разом заметно
+подвисает. Пул хранит убранные с уровня экземпляры и при следующем
+запросе возвращает один из них, вызвав его reset-хук вместо конструктора:
+
+    pools = PoolRegistry()
+    pools.register("slime", Slime)          # reset-хук по умолчанию: obj.reset(x, y)
+    slime = pools.acquire("slime", x, y)    # из пула или Slime(x, y)
+    ...
+    slime.kill()
+    pools.release(slime)                    # снова доступен для acquire
+
+Объект помнит свой пул (pool_key), повторный release ничего не делает.
+"""
+
+DEFAULT_MAX_SIZE = 1024
+
+
+class ObjectPool:
+    """
+    Свободные экземпляры одного типа.
+
+    factory(*args) создаёт новый объект, когда пул пуст; reset(obj, *args)
+    готовит возвращённый объект к повторному использованию (по умолчанию
+    вызывается obj.reset(*args)). Сверх max_size объекты не хранятся.
+    """
+
+    def __init__(self, factory, reset=None, max_size=DEFAULT_MAX_SIZE):
+        self.factory = factory
+        self.reset = reset
+        self.max_size = max_size
+        self._free = []
+        # Статистика: сколько объектов создано конструктором и сколько взято из пула
+        self.created = 0
+        self.reused = 0
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            obj.pooled = False
+            if self.reset is None:
+                obj.reset(*args, **kwargs)
+            else:
+                self.reset(obj, *args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        obj = self.factory(*args, **kwargs)
+        obj.pooled = False
+        return obj
+
+    def release(self, obj):
+        """Возвращает объект в пул; False — уже в пуле или пул полон."""
+        if getattr(obj, "pooled", False) or len(self._free) >= self.max_size:
+            return False
+        obj.pooled = True
+        self._free.append(obj)
+        return True
+
+    def prefill(self, count, *args, **kwargs):
+        """Заранее создаёт объекты, чтобы первые acquire не звали конструктор."""
+        while len(self._free) < min(count, self.max_size):
+            obj = self.factory(*args, **kwargs)
+            self.created += 1
+            obj.pooled = True
+            self._free.append(obj)
+
+    def clear(self):
+        self._free.clear()
+
+
+class PoolRegistry:
+    """Пулы по ключу типа (например, "slime" или "coin")."""
+
+    def __init__(self):
+        self.pools = {}
+
+    def register(self, key, factory, reset=None, max_size=DEFAULT_MAX_SIZE):
+        pool = self.pools[key] = ObjectPool(factory, reset, max_size)
+        return pool
+
+    def __contains__(self, key):
+        return key in self.pools
+
+    def acquire(self, key, *args, **kwargs):
+        obj = self.pools[key].acquire(*args, **kwargs)
+        obj.pool_key = key
+        return obj
+
+    def release(self, obj):
+        """Возвращает объект в пул его типа; объекты не из пула игнорируются."""
+        pool = self.pools.get(getattr(obj, "pool_key", None))
+        return pool.release(obj) if pool is not None else False
+
+    def stats(self):
+        """{ключ: (создано, переиспользовано, свободно)} — для отладки и тестов."""
+        return {
+            key: (pool.created, pool.reused, len(pool))
+            for key, pool in self.pools.items()
+        }
+
+    def clear(self):
+        for pool in self.pools.values():
+            pool.clear()
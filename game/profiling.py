@@ -0,0 +1,169 @@
+# game/profiling.py
+"""
+Лёгкий покадровый профайлер фаз игрового цикла.
+
+    from game.profiling import profiler
+
+    with profiler.section("level.draw"):
+        level.draw(screen, camera)
+
+    @profiler.timed("hud.draw")
+    def draw(...): ...
+
+    profiler.count("blits", 12)
+
+Пока profiler.enabled == False, section() возвращает общий пустой
+контекст-менеджер, а count() сразу выходит — цена выключенного профайлера
+одна проверка флага. Во включённом режиме время каждой фазы суммируется
+за кадр, а end_frame() складывает итоги кадра в кольцевые буферы на
+history кадров (для графика и средних значений в оверлее).
+"""
+
+import functools
+import time
+from collections import deque
+
+DEFAULT_HISTORY = 240
+
+
+class _NullSection:
+    """Контекст-менеджер, который ничего не делает (профайлер выключен)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    """
+    Замер одной фазы; объект переиспользуется для одного и того же имени,
+    поэтому фаза не может быть вложена сама в себя.
+    """
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        current = self.profiler._current
+        current[self.name] = current.get(self.name, 0.0) + elapsed
+        return False
+
+
+class Profiler:
+    def __init__(self, history=DEFAULT_HISTORY, enabled=False):
+        self.enabled = enabled
+        self.history = history
+        # Кольцевые буферы: время кадра и каждой фазы (секунды), счётчики
+        self.frame_times = deque(maxlen=history)
+        self.phase_times = {}
+        self.counters = {}
+        self._sections = {}
+        self._current = {}
+        self._current_counts = {}
+        self._frame_start = None
+
+    def section(self, name):
+        """Контекст-менеджер, добавляющий время блока к фазе name текущего кадра."""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def timed(self, name):
+        """Декоратор: всё время вызова функции идёт в фазу name."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.section(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def count(self, name, amount=1):
+        """Счётчик текущего кадра (сущности, blit-ы и т.п.)."""
+        if not self.enabled:
+            return
+        self._current_counts[name] = self._current_counts.get(name, 0) + amount
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame_start = time.perf_counter()
+        self._current = {}
+        self._current_counts = {}
+
+    def end_frame(self):
+        """Закрывает кадр и складывает его итоги в кольцевые буферы."""
+        if not self.enabled or self._frame_start is None:
+            return
+        self.frame_times.append(time.perf_counter() - self._frame_start)
+        self._frame_start = None
+
+        # Фаза, которой в этом кадре не было, получает 0 — буферы идут в ногу
+        for name in self._current.keys() - self.phase_times.keys():
+            self.phase_times[name] = deque(maxlen=self.history)
+        for name, samples in self.phase_times.items():
+            samples.append(self._current.get(name, 0.0))
+
+        for name in self._current_counts.keys() - self.counters.keys():
+            self.counters[name] = deque(maxlen=self.history)
+        for name, samples in self.counters.items():
+            samples.append(self._current_counts.get(name, 0))
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        if not enabled:
+            self._frame_start = None
+
+    def reset(self):
+        self.frame_times.clear()
+        self.phase_times.clear()
+        self.counters.clear()
+        self._current = {}
+        self._current_counts = {}
+        self._frame_start = None
+
+    def average(self, name, frames=60):
+        """Среднее время фазы за последние frames кадров (секунды)."""
+        samples = self.phase_times.get(name)
+        if not samples:
+            return 0.0
+        recent = list(samples)[-frames:]
+        return sum(recent) / len(recent)
+
+    def average_frame(self, frames=60):
+        if not self.frame_times:
+            return 0.0
+        recent = list(self.frame_times)[-frames:]
+        return sum(recent) / len(recent)
+
+    def last_count(self, name):
+        samples = self.counters.get(name)
+        return samples[-1] if samples else 0
+
+
+# Глобальный профайлер игрового цикла
+profiler = Profiler()
@@ -0,0 +1,179 @@
+# game/slopes.py
+"""
+Склоны уровня как карта высот по строкам тайлов.
+
+Каждый тайл-склон (SLOPE) поднимается слева направо на всю высоту клетки.
+Соседние склоны одной строки сливаются в одну ломаную (SlopeRun), а клетки
+индексируются словарём (col, row) -> ломаная. Поэтому вопросы игрока
+«где поверхность склона под x» и «есть ли следующий склон справа» —
+O(1) обращения вместо перебора всех платформ.
+
+Карта строится при загрузке уровня из TileCollisionMap (склоны статичны);
+для списка платформ без уровня (тесты, редакторы) есть from_platforms.
+"""
+
+from .collision_map import SLOPE
+
+# Строки, в которых ищется следующий склон справа: выше, та же, ниже
+# (в таком же порядке их возвращал запрос к пространственному индексу)
+NEIGHBOUR_ROWS = (-1, 0, 1)
+
+
+class SlopeRun:
+    """
+    Ломаная из подряд идущих склонов одной строки: клетки first_col..last_col.
+    В каждой клетке поверхность линейно поднимается от низа (слева) до верха (справа).
+    """
+
+    __slots__ = ("row", "first_col", "last_col", "tile_size")
+
+    def __init__(self, row, first_col, last_col, tile_size):
+        self.row = row
+        self.first_col = first_col
+        self.last_col = last_col
+        self.tile_size = tile_size
+
+    def __repr__(self):
+        return f"SlopeRun(row={self.row}, cols={self.first_col}..{self.last_col})"
+
+    @property
+    def left(self):
+        return self.first_col * self.tile_size
+
+    @property
+    def right(self):
+        return (self.last_col + 1) * self.tile_size
+
+    @property
+    def bottom(self):
+        return (self.row + 1) * self.tile_size
+
+    @property
+    def top(self):
+        return self.row * self.tile_size
+
+    def points(self):
+        """Вершины ломаной: низ и верх каждого зубца."""
+        size = self.tile_size
+        bottom, top = self.bottom, self.top
+        result = []
+        for col in range(self.first_col, self.last_col + 1):
+            result.append((col * size, bottom))
+            result.append(((col + 1) * size, top))
+        return result
+
+    def surface_y(self, x, col=None):
+        """
+        Y поверхности над мировым x. col — клетка ломаной, по которой считать
+        (на стыке двух зубцов x принадлежит обоим); по умолчанию — клетка под x.
+        """
+        size = self.tile_size
+        if col is None:
+            col = min(max(int(x) // size, self.first_col), self.last_col)
+        relative_x = (x - col * size) / size
+        relative_x = max(0.0, min(1.0, relative_x))
+        return self.bottom - relative_x * size
+
+
+class SlopeHeightfield:
+    """Все склоны уровня: ломаные по строкам и индекс клеток."""
+
+    def __init__(self, tile_size=128):
+        self.tile_size = tile_size
+        # (col, row) -> SlopeRun
+        self._cells = {}
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __contains__(self, cell):
+        return cell in self._cells
+
+    @classmethod
+    def from_collision_map(cls, collision_map):
+        """Собирает ломаные по клеткам SLOPE карты коллизий."""
+        heightfield = cls(collision_map.tile_size)
+        kinds = collision_map.kinds
+        width = collision_map.width
+        origin_col, origin_row = collision_map.origin_col, collision_map.origin_row
+        for row in range(collision_map.height):
+            base = row * width
+            col = 0
+            while col < width:
+                if kinds[base + col] != SLOPE:
+                    col += 1
+                    continue
+                first = col
+                while col + 1 < width and kinds[base + col + 1] == SLOPE:
+                    col += 1
+                heightfield._add_run(row + origin_row, first + origin_col, col + origin_col)
+                col += 1
+        return heightfield
+
+    @classmethod
+    def from_platforms(cls, platforms, tile_size=128):
+        """Ломаные по выровненным по сетке платформам-склонам (без карты коллизий)."""
+        heightfield = cls(tile_size)
+        for platform in platforms:
+            if getattr(platform, "collision_kind", None) != SLOPE:
+                continue
+            cell = heightfield.cell_of(platform.rect)
+            if cell is not None:
+                heightfield.add(*cell)
+        return heightfield
+
+    def cell_of(self, rect):
+        """Клетка тайла-склона с прямоугольником rect или None, если он не по сетке."""
+        size = self.tile_size
+        if rect.x % size == 0 and rect.y % size == 0 and rect.size == (size, size):
+            return rect.x // size, rect.y // size
+        return None
+
+    def _add_run(self, row, first_col, last_col):
+        run = SlopeRun(row, first_col, last_col, self.tile_size)
+        for col in range(first_col, last_col + 1):
+            self._cells[(col, row)] = run
+        return run
+
+    def add(self, col, row):
+        """Добавляет склон в клетку, сливая его с ломаными слева и справа."""
+        if (col, row) in self._cells:
+            return self._cells[(col, row)]
+        left = self._cells.get((col - 1, row))
+        right = self._cells.get((col + 1, row))
+        first = left.first_col if left else col
+        last = right.last_col if right else col
+        return self._add_run(row, first, last)
+
+    def remove(self, col, row):
+        """Убирает склон из клетки, разрезая его ломаную надвое."""
+        run = self._cells.pop((col, row), None)
+        if run is None:
+            return
+        if run.first_col < col:
+            self._add_run(row, run.first_col, col - 1)
+        if col < run.last_col:
+            self._add_run(row, col + 1, run.last_col)
+
+    def runs(self):
+        """Все ломаные (каждая один раз), сверху вниз и слева направо."""
+        unique = {id(run): run for run in self._cells.values()}
+        return sorted(unique.values(), key=lambda run: (run.row, run.first_col))
+
+    def run_at(self, col, row):
+        return self._cells.get((col, row))
+
+    def surface_y(self, x, row):
+        """Y поверхности склона в строке row над мировым x или None, если склона нет."""
+        col = int(x) // self.tile_size
+        run = self._cells.get((col, row))
+        if run is None:
+            return None
+        return run.surface_y(x, col)
+
+    def next_slope_right(self, col, row):
+        """Клетка (col, row) склона, продолжающего склон (col, row) вправо, или None."""
+        for d_row in NEIGHBOUR_ROWS:
+            if (col + 1, row + d_row) in self._cells:
+                return col + 1, row + d_row
+        return None
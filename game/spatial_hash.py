@@ -0,0 +1,199 @@
+# game/spatial_hash.py
+import itertools
+
+import pygame
+
+# Категории сущностей (биты маски запроса) для общего индекса уровня:
+# один SpatialHash на врагов, ловушки, предметы и триггеры, а каждая
+# проверка смотрит только свои категории рядом с игроком
+ENEMY = 1
+TRAP = 2
+ITEM = 4
+TRIGGER = 8
+
+
+class SpatialHash:
+    """
+    Равномерная пространственная сетка (spatial hash).
+
+    Каждый объект регистрируется во всех ячейках cell_size x cell_size,
+    которые пересекает его прямоугольник. Запрос по прямоугольнику
+    просматривает только эти ячейки, поэтому стоимость зависит от размера
+    запроса, а не от общего числа объектов на карте.
+
+    У каждого объекта есть биты категорий (ENEMY, TRAP, ...): query(rect, mask)
+    возвращает только объекты, у которых есть хоть один бит из mask, так что
+    в одном индексе могут жить сущности разных групп.
+
+    Порядок результата query — порядок обхода ячеек. Проверкам «до первого
+    совпадения» нужен порядок добавления объектов (как у обхода группы):
+    его даёт query(..., ordered=True).
+    """
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        # (cx, cy) -> {obj: категории} (dict как упорядоченное множество)
+        self._cells = {}
+        # obj -> (left, top, right, bottom) в координатах ячеек
+        self._ranges = {}
+        # obj -> биты категорий
+        self._categories = {}
+        # obj -> номер добавления (для query(..., ordered=True))
+        self._order = {}
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._ranges)
+
+    def __contains__(self, obj):
+        return obj in self._ranges
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size if rect.width > 0 else rect.left // size,
+            (rect.bottom - 1) // size if rect.height > 0 else rect.top // size,
+        )
+
+    def insert(self, obj, rect, category=0):
+        """Добавляет объект с битами category (или перемещает, если он уже есть)."""
+        if obj in self._ranges:
+            categories = self._categories[obj]
+            if category & ~categories:
+                self._set_categories(obj, categories | category)
+            self.update(obj, rect)
+            return
+        cell_range = self._cell_range(rect)
+        self._ranges[obj] = cell_range
+        self._categories[obj] = category
+        self._order[obj] = next(self._counter)
+        self._add_to_cells(obj, cell_range)
+
+    def remove(self, obj, category=None):
+        """
+        Удаляет объект из сетки (без ошибки, если его нет). С category снимаются
+        только эти биты; объект уходит из сетки, когда битов не осталось.
+        """
+        if category is not None and obj in self._categories:
+            remaining = self._categories[obj] & ~category
+            if remaining:
+                self._set_categories(obj, remaining)
+                return
+        cell_range = self._ranges.pop(obj, None)
+        if cell_range is None:
+            return
+        del self._categories[obj]
+        del self._order[obj]
+        left, top, right, bottom = cell_range
+        cells = self._cells
+        for cy in range(top, bottom + 1):
+            for cx in range(left, right + 1):
+                cell = cells.get((cx, cy))
+                if cell is not None:
+                    cell.pop(obj, None)
+                    if not cell:
+                        del cells[(cx, cy)]
+
+    def update(self, obj, rect):
+        """Обновляет положение объекта; ячейки меняются только при выходе за их границы."""
+        old_range = self._ranges.get(obj)
+        if old_range is None:
+            self.insert(obj, rect)
+            return
+        new_range = self._cell_range(rect)
+        if new_range == old_range:
+            return
+        categories = self._categories[obj]
+        order = self._order[obj]
+        self.remove(obj)
+        self._ranges[obj] = new_range
+        self._categories[obj] = categories
+        self._order[obj] = order
+        self._add_to_cells(obj, new_range)
+
+    def _set_categories(self, obj, categories):
+        self._categories[obj] = categories
+        self._add_to_cells(obj, self._ranges[obj])
+
+    def _add_to_cells(self, obj, cell_range):
+        left, top, right, bottom = cell_range
+        category = self._categories[obj]
+        cells = self._cells
+        for cy in range(top, bottom + 1):
+            for cx in range(left, right + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = {obj: category}
+                else:
+                    cell[obj] = category
+
+    def query(self, rect, mask=None, ordered=False):
+        """
+        Возвращает список объектов из ячеек, которые пересекает rect (без дубликатов).
+        mask — биты категорий: только объекты хотя бы с одним из них.
+        ordered — отсортировать по порядку добавления в индекс.
+        """
+        left, top, right, bottom = self._cell_range(rect)
+        cells = self._cells
+        found = {}
+        for cy in range(top, bottom + 1):
+            for cx in range(left, right + 1):
+                cell = cells.get((cx, cy))
+                if not cell:
+                    continue
+                if mask is None:
+                    found.update(cell)
+                else:
+                    for obj, category in cell.items():
+                        if category & mask:
+                            found[obj] = None
+        if ordered:
+            return sorted(found, key=self._order.__getitem__)
+        return list(found)
+
+    def clear(self):
+        self._cells.clear()
+        self._ranges.clear()
+        self._categories.clear()
+        self._order.clear()
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """
+    pygame.sprite.Group со встроенным SpatialHash.
+
+    Индекс обновляется автоматически при add/remove/kill. Если спрайт
+    перемещается, нужно вызвать refresh(sprite), чтобы переложить его в
+    новые ячейки (дёшево, если ячейки не поменялись).
+
+    Несколько групп могут делить один индекс (index=...), каждая со своей
+    категорией: query группы видит только свою категорию, а запрос к
+    общему индексу по маске — сразу несколько групп.
+    """
+
+    def __init__(self, *sprites, cell_size=128, index=None, category=0):
+        self.index = index if index is not None else SpatialHash(cell_size)
+        self.category = category
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.index.insert(sprite, sprite.rect, self.category)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.index.remove(sprite, self.category or None)
+
+    def refresh(self, sprite):
+        """Переиндексирует спрайт после перемещения."""
+        if sprite in self.index:
+            self.index.update(sprite, sprite.rect)
+
+    def query(self, rect, ordered=False):
+        """
+        Спрайты группы рядом с rect (широкая фаза, без точной проверки пересечения).
+        ordered=True — в порядке добавления, как при обходе самой группы.
+        """
+        return self.index.query(rect, self.category or None, ordered)
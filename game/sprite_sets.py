@@ -0,0 +1,162 @@
+# game/sprite_sets.py
+"""
+Общие (flyweight) наборы картинок для спрайтов.
+
+Раньше каждый Item и Spikes делал свой pygame.transform.scale — личную
+копию 128x128 RGBA (64 КБ) на экземпляр, а каждый враг сам собирал
+ссылки на свои кадры и при ошибке загрузки рисовал свою заглушку.
+Здесь картинки хранятся один раз на (тип, размер) и раздаются всем
+экземплярам; у экземпляра остаются только номер кадра и таймеры.
+
+    from game.sprite_sets import sprite_sets
+
+    image = sprite_sets.image("Hud/hudCoin.png", size=(128, 128))
+    tile = sprite_sets.scaled(asset_loader.get_tile_image(341), (64, 64))
+    frames = sprite_sets.animation("slime", build_slime_frames)
+    frames.frame("move", 1)
+
+Выданные поверхности общие — рисовать на них нельзя (как и на тайлах
+из asset_loader.get_tile_image).
+
+Реестр держит картинки и наборы слабыми ссылками: память принадлежит
+экземплярам, которые их рисуют, и бюджетному LRU asset_loader. Когда
+спрайтов типа не осталось, их картинка освобождается, а не живёт в
+реестре мимо бюджета. При смене уровня реестр очищается (clear()).
+"""
+
+import weakref
+
+import pygame
+
+from .asset_loader import asset_loader, surface_bytes
+
+
+class AnimationSet:
+    """
+    Неизменяемый набор кадров по состояниям: {"idle": (кадр,), "move": (...)}.
+    Один объект на тип сущности, общий для всех её экземпляров.
+    """
+
+    __slots__ = ("name", "_states", "__weakref__")
+
+    def __init__(self, name, states):
+        self.name = name
+        self._states = {state: tuple(frames) for state, frames in states.items()}
+
+    def __contains__(self, state):
+        return state in self._states
+
+    @property
+    def states(self):
+        return tuple(self._states)
+
+    def frames(self, state):
+        return self._states[state]
+
+    def frame(self, state, index=0):
+        frames = self._states[state]
+        return frames[index % len(frames)]
+
+    def surfaces(self):
+        """Все различные поверхности набора (для подсчёта памяти)."""
+        unique = {}
+        for frames in self._states.values():
+            for surface in frames:
+                unique[id(surface)] = surface
+        return list(unique.values())
+
+
+class SpriteSetRegistry:
+    """Реестр общих картинок: масштабированные файлы и тайлы, заглушки и анимации."""
+
+    def __init__(self, loader=asset_loader):
+        self.loader = loader
+        # (name, scale, size) -> Surface; слабые значения: запись живёт, пока
+        # картинку держит хоть один спрайт
+        self._images = weakref.WeakValueDictionary()
+        # Исходная поверхность -> {size: масштабированная копия}; слабые ключи,
+        # как у get_flipped: копия живёт, пока жив исходный спрайт
+        self._scaled = weakref.WeakKeyDictionary()
+        # (size, color, kind) -> Surface
+        self._placeholders = weakref.WeakValueDictionary()
+        # key -> AnimationSet
+        self._animations = weakref.WeakValueDictionary()
+
+    def image(self, name, size=None, scale=1):
+        """
+        Картинка из файла, при необходимости приведённая к size — одна копия
+        на (файл, масштаб, размер). Ошибки загрузки пробрасываются как у
+        asset_loader.load_image.
+        """
+        key = (name, scale, size)
+        image = self._images.get(key)
+        if image is None:
+            image = self.loader.load_image(name, scale)
+            if size is not None:
+                image = self.scaled(image, size)
+            self._images[key] = image
+        return image
+
+    def scaled(self, surface, size):
+        """surface, приведённая к size, — одна копия на (поверхность, размер)."""
+        if surface.get_size() == size:
+            return surface
+        variants = self._scaled.get(surface)
+        if variants is None:
+            variants = self._scaled[surface] = {}
+        scaled = variants.get(size)
+        if scaled is None:
+            scaled = variants[size] = pygame.transform.scale(surface, size)
+        return scaled
+
+    def placeholder(self, size, color, kind="fill", draw=None):
+        """
+        Общая заглушка размера size цвета color. draw(surface) может
+        дорисовать узор; kind отличает заглушки с разными узорами.
+        """
+        key = (size, color, kind)
+        surface = self._placeholders.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color)
+            if draw is not None:
+                draw(surface)
+            self._placeholders[key] = surface
+        return surface
+
+    def animation(self, key, build):
+        """AnimationSet по ключу; build() -> {состояние: [кадры]} вызывается один раз."""
+        animation = self._animations.get(key)
+        if animation is None:
+            animation = self._animations[key] = AnimationSet(key, build())
+        return animation
+
+    def stats(self):
+        """Число живых общих поверхностей и байт их пикселей (без учёта листов тайлсетов)."""
+        surfaces = {}
+        for group in (self._images, self._placeholders):
+            for surface in group.values():
+                surfaces[id(surface)] = surface
+        for variants in self._scaled.values():
+            for surface in variants.values():
+                surfaces[id(surface)] = surface
+        animations = list(self._animations.values())
+        for animation in animations:
+            for surface in animation.surfaces():
+                surfaces[id(surface)] = surface
+        return {
+            "surfaces": len(surfaces),
+            "bytes": sum(surface_bytes(s) for s in surfaces.values()),
+            "animations": len(animations),
+        }
+
+    def clear(self):
+        """Забывает все общие картинки (при смене уровня)."""
+        self._images.clear()
+        self._scaled.clear()
+        self._placeholders.clear()
+        self._animations.clear()
+
+
+# Общий реестр картинок всех спрайтов
+sprite_sets = SpriteSetRegistry()
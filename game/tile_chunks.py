@@ -0,0 +1,145 @@
+# game/tile_chunks.py
+import pygame
+
+
+class StaticLayerCache:
+    """
+    Кэш статических слоёв уровня, «запечённых» в поверхности-чанки.
+
+    Вместо того чтобы каждый кадр рисовать сотни тайлов по одному, тайлы
+    неизменяемых слоёв (ground, semiground, triangleleft, decoration)
+    один раз рисуются в поверхности размером chunk_tiles x chunk_tiles тайлов.
+    Кадр рисует только несколько видимых чанков.
+
+    Чанк перестраивается только тогда, когда меняются тайлы под ним
+    (например, разрушен ящик) — см. remove() и invalidate().
+    """
+
+    def __init__(self, chunk_tiles=8, tile_size=128):
+        self.chunk_tiles = chunk_tiles
+        self.tile_size = tile_size
+        self.chunk_size = chunk_tiles * tile_size
+
+        # (cx, cy) -> список спрайтов, попадающих в чанк
+        self._chunk_sprites = {}
+        # (cx, cy) -> запечённая поверхность
+        self._surfaces = {}
+        # чанки, которые нужно перестроить перед следующей отрисовкой
+        self._dirty = set()
+        # спрайт -> (слой, порядковый номер) для стабильного порядка отрисовки
+        self._order = {}
+        self._next_seq = 0
+
+    def _chunk_keys(self, rect):
+        """Ключи всех чанков, которые пересекает прямоугольник."""
+        size = self.chunk_size
+        left = rect.left // size
+        top = rect.top // size
+        right = (rect.right - 1) // size
+        bottom = (rect.bottom - 1) // size
+        for cy in range(top, bottom + 1):
+            for cx in range(left, right + 1):
+                yield (cx, cy)
+
+    def add(self, sprite, layer=0):
+        """Добавляет статический спрайт. Слои с большим номером рисуются поверх."""
+        if sprite in self._order:
+            return
+        self._order[sprite] = (layer, self._next_seq)
+        self._next_seq += 1
+        for key in self._chunk_keys(sprite.rect):
+            self._chunk_sprites.setdefault(key, []).append(sprite)
+            self._dirty.add(key)
+
+    def remove(self, sprite):
+        """Убирает спрайт из кэша и помечает затронутые чанки на перестройку."""
+        if self._order.pop(sprite, None) is None:
+            return
+        for key in self._chunk_keys(sprite.rect):
+            sprites = self._chunk_sprites.get(key)
+            if not sprites:
+                continue
+            try:
+                sprites.remove(sprite)
+            except ValueError:
+                continue
+            if not sprites:
+                del self._chunk_sprites[key]
+                self._surfaces.pop(key, None)
+            self._dirty.add(key)
+
+    def invalidate(self, rect):
+        """Помечает чанки под прямоугольником на перестройку (например, сменилась картинка тайла)."""
+        for key in self._chunk_keys(rect):
+            if key in self._chunk_sprites:
+                self._dirty.add(key)
+
+    def clear(self):
+        """Полностью очищает кэш."""
+        self._chunk_sprites.clear()
+        self._surfaces.clear()
+        self._dirty.clear()
+        self._order.clear()
+
+    def build(self):
+        """Перестраивает все «грязные» чанки (вызывается при загрузке уровня)."""
+        for key in list(self._dirty):
+            self._bake(key)
+        self._dirty.clear()
+
+    def _bake(self, key):
+        sprites = self._chunk_sprites.get(key)
+        if not sprites:
+            self._surfaces.pop(key, None)
+            return
+
+        size = self.chunk_size
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        origin_x = key[0] * size
+        origin_y = key[1] * size
+
+        for sprite in sorted(sprites, key=self._order.__getitem__):
+            surface.blit(
+                sprite.image, (sprite.rect.x - origin_x, sprite.rect.y - origin_y)
+            )
+
+        # Формат экрана ускоряет blit, но доступен только при открытом окне
+        if pygame.display.get_surface() is not None:
+            try:
+                surface = surface.convert_alpha()
+            except pygame.error:
+                pass
+
+        self._surfaces[key] = surface
+
+    @property
+    def chunk_count(self):
+        return len(self._surfaces)
+
+    def draw(self, screen, camera):
+        """
+        Рисует видимые чанки, при необходимости перестраивая изменённые.
+        Возвращает число нарисованных чанков (blit-ов).
+        """
+        size = self.chunk_size
+        offset_x = int(camera.offset.x)
+        offset_y = int(camera.offset.y)
+        screen_w, screen_h = screen.get_size()
+
+        first_cx = offset_x // size
+        first_cy = offset_y // size
+        last_cx = (offset_x + screen_w - 1) // size
+        last_cy = (offset_y + screen_h - 1) // size
+
+        blits = 0
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                key = (cx, cy)
+                if key in self._dirty:
+                    self._bake(key)
+                    self._dirty.discard(key)
+                surface = self._surfaces.get(key)
+                if surface is not None:
+                    screen.blit(surface, (cx * size - offset_x, cy * size - offset_y))
+                    blits += 1
+        return blits
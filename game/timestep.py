@@ -0,0 +1,57 @@
+# game/timestep.py
+
+TIME_EPSILON = 1e-9
+
+
+class FixedTimestep:
+    """
+    Аккумулятор фиксированного шага симуляции.
+
+    Кадр отрисовки может длиться сколько угодно (144 Гц, 30 Гц, подтормаживание),
+    а симуляция всегда шагает на одинаковый dt = 1 / tick_rate. Время кадра
+    копится в accumulator; advance() возвращает, сколько целых тиков нужно
+    выполнить, а остаток даёт alpha — долю следующего тика для интерполяции
+    при отрисовке.
+
+    max_frame_time ограничивает время одного кадра: после долгой загрузки
+    или паузы в отладчике игра не пытается догнать секунды симуляции разом
+    («спираль смерти»), а просто теряет это время.
+    """
+
+    def __init__(self, tick_rate=60, max_frame_time=0.25):
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.ticks = 0
+
+    def advance(self, frame_time):
+        """Добавляет время кадра (секунды) и возвращает число тиков для выполнения."""
+        frame_time = min(max(frame_time, 0.0), self.max_frame_time)
+        self.accumulator += frame_time
+
+        # Допуск на ошибку округления: 144 кадра по 1/144 с — ровно 60 тиков
+        steps = 0
+        while self.accumulator >= self.dt - TIME_EPSILON:
+            self.accumulator = max(self.accumulator - self.dt, 0.0)
+            steps += 1
+
+        self.ticks += steps
+        self.alpha = self.accumulator / self.dt
+        return steps
+
+    def reset(self):
+        """Сбрасывает накопленное время (например, после загрузки уровня)."""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+
+def lerp_position(previous, current, alpha):
+    """Точка между положением на прошлом и текущем тике (для отрисовки)."""
+    if previous is None or alpha >= 1.0:
+        return current
+    return (
+        round(previous[0] + (current[0] - previous[0]) * alpha),
+        round(previous[1] + (current[1] - previous[1]) * alpha),
+    )
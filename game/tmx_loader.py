@@ -0,0 +1,497 @@
+# game/tmx_loader.py
+import base64
+import gzip
+import os
+import sys
+import zlib
+from array import array
+from xml.etree import ElementTree
+
+# Старшие биты GID в Tiled — флаги отражения/поворота тайла
+FLIPPED_HORIZONTALLY = 0x80000000
+FLIPPED_VERTICALLY = 0x40000000
+FLIPPED_DIAGONALLY = 0x20000000
+ROTATED_HEXAGONAL_120 = 0x10000000
+GID_MASK = 0x0FFFFFFF
+
+# Типкод array для 32-битных беззнаковых GID
+GID_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+# Слой с долей непустых клеток не больше этой хранится разреженно
+SPARSE_MAX_DENSITY = 0.05
+# Размер корзины разреженного слоя (в тайлах) для запросов по области
+SPARSE_BUCKET_TILES = 16
+
+# Элементы, у которых в TMX могут быть <properties>
+_PROPERTY_OWNERS = {"map", "tileset", "tile", "layer", "objectgroup", "object", "imagelayer", "group"}
+
+
+class TmxError(Exception):
+    """Файл TMX не удалось разобрать (неподдерживаемый формат или битые данные)."""
+
+
+class Tileset:
+    """Описание tileset из TMX (картинка и сетка тайлов)."""
+
+    def __init__(self, firstgid, name, tilewidth, tileheight, tilecount=0, columns=0,
+                 margin=0, spacing=0, image=None, image_width=0, image_height=0):
+        self.firstgid = firstgid
+        self.name = name
+        self.tilewidth = tilewidth
+        self.tileheight = tileheight
+        self.tilecount = tilecount
+        self.columns = columns
+        self.margin = margin
+        self.spacing = spacing
+        self.image = image  # путь к картинке как он записан в TMX/TSX
+        self.image_width = image_width
+        self.image_height = image_height
+        self.properties = {}
+
+
+class TileLayer:
+    """Слой тайлов: GID хранятся плоским array, индекс = row * width + col."""
+
+    def __init__(self, name, width, height, gids, layer_id=0, visible=True):
+        self.id = layer_id
+        self.name = name
+        self.width = width
+        self.height = height
+        self.gids = gids
+        self.visible = visible
+        self.properties = {}
+
+    def gid_at(self, col, row):
+        if 0 <= col < self.width and 0 <= row < self.height:
+            return self.gids[row * self.width + col]
+        return 0
+
+    @property
+    def tile_count(self):
+        return sum(1 for gid in self.gids if gid)
+
+    def tiles(self):
+        """Непустые тайлы слоя: (col, row, gid)."""
+        width = self.width
+        for index, gid in enumerate(self.gids):
+            if gid:
+                yield index % width, index // width, gid
+
+    def tiles_in_rect(self, left, top, right, bottom):
+        """Непустые тайлы в области клеток [left, right) x [top, bottom)."""
+        width = self.width
+        gids = self.gids
+        left, right = max(0, left), min(width, right)
+        for row in range(max(0, top), min(self.height, bottom)):
+            base = row * width
+            for col in range(left, right):
+                gid = gids[base + col]
+                if gid:
+                    yield col, row, gid
+
+
+class SparseTileLayer:
+    """
+    Разреженный слой: хранятся только непустые клетки.
+
+    Клетки разложены по корзинам SPARSE_BUCKET_TILES x SPARSE_BUCKET_TILES,
+    поэтому запрос по области смотрит только пересечённые корзины. Так
+    хранятся слои бесконечных карт (координаты могут быть отрицательными)
+    и почти пустые слои больших карт.
+    """
+
+    def __init__(self, name, width=0, height=0, layer_id=0, visible=True):
+        self.id = layer_id
+        self.name = name
+        self.width = width
+        self.height = height
+        self.visible = visible
+        self.properties = {}
+        # (bx, by) -> {(col, row): gid}
+        self._buckets = {}
+        self.tile_count = 0
+
+    @classmethod
+    def from_dense(cls, layer):
+        sparse = cls(layer.name, layer.width, layer.height, layer.id, layer.visible)
+        sparse.properties = layer.properties
+        for col, row, gid in layer.tiles():
+            sparse.set_gid(col, row, gid)
+        return sparse
+
+    def set_gid(self, col, row, gid):
+        size = SPARSE_BUCKET_TILES
+        key = (col // size, row // size)
+        bucket = self._buckets.get(key)
+        if gid:
+            if bucket is None:
+                bucket = self._buckets[key] = {}
+            if (col, row) not in bucket:
+                self.tile_count += 1
+            bucket[(col, row)] = gid
+        elif bucket is not None and bucket.pop((col, row), None) is not None:
+            self.tile_count -= 1
+            if not bucket:
+                del self._buckets[key]
+
+    def gid_at(self, col, row):
+        size = SPARSE_BUCKET_TILES
+        bucket = self._buckets.get((col // size, row // size))
+        return bucket.get((col, row), 0) if bucket else 0
+
+    def tiles(self):
+        """Непустые тайлы слоя: (col, row, gid) построчно."""
+        cells = [item for bucket in self._buckets.values() for item in bucket.items()]
+        cells.sort(key=lambda item: (item[0][1], item[0][0]))
+        for (col, row), gid in cells:
+            yield col, row, gid
+
+    def tiles_in_rect(self, left, top, right, bottom):
+        """Непустые тайлы в области клеток [left, right) x [top, bottom)."""
+        if right <= left or bottom <= top:
+            return
+        size = SPARSE_BUCKET_TILES
+        buckets = self._buckets
+        for by in range(top // size, (bottom - 1) // size + 1):
+            for bx in range(left // size, (right - 1) // size + 1):
+                bucket = buckets.get((bx, by))
+                if not bucket:
+                    continue
+                for (col, row), gid in bucket.items():
+                    if left <= col < right and top <= row < bottom:
+                        yield col, row, gid
+
+    def bounds(self):
+        """(left, top, right, bottom) непустых клеток или None для пустого слоя."""
+        cells = [cell for bucket in self._buckets.values() for cell in bucket]
+        if not cells:
+            return None
+        cols = [col for col, _ in cells]
+        rows = [row for _, row in cells]
+        return min(cols), min(rows), max(cols) + 1, max(rows) + 1
+
+
+def make_tile_layer(name, width, height, gids, layer_id=0, visible=True):
+    """Плотный слой или, если он почти пустой, разреженный."""
+    layer = TileLayer(name, width, height, gids, layer_id=layer_id, visible=visible)
+    cells = width * height
+    if cells and layer.tile_count <= cells * SPARSE_MAX_DENSITY:
+        return SparseTileLayer.from_dense(layer)
+    return layer
+
+
+class MapObject:
+    """Объект из objectgroup (враг, предмет, точка спавна и т.п.)."""
+
+    def __init__(self, object_id, name, obj_type, x, y, width=0.0, height=0.0, gid=0):
+        self.id = object_id
+        self.name = name
+        self.type = obj_type
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.gid = gid
+        self.properties = {}
+
+    @property
+    def top(self):
+        """Верх объекта: у тайловых объектов (с gid) Tiled хранит y нижнего края."""
+        return self.y - self.height if self.gid else self.y
+
+
+class ObjectGroup:
+    def __init__(self, name, group_id=0):
+        self.id = group_id
+        self.name = name
+        self.objects = []
+        self.properties = {}
+
+
+class TileMap:
+    """Разобранная карта TMX."""
+
+    def __init__(self, width, height, tilewidth, tileheight, path=None):
+        self.path = path
+        self.width = width
+        self.height = height
+        # Бесконечные карты: клетки могут начинаться не с (0, 0)
+        self.infinite = False
+        self.origin_col = 0
+        self.origin_row = 0
+        self.tilewidth = tilewidth
+        self.tileheight = tileheight
+        self.tilesets = []
+        self.layers = []
+        self.object_groups = []
+        self.properties = {}
+
+    def get_layer(self, name):
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        return None
+
+    def get_object_group(self, name):
+        for group in self.object_groups:
+            if group.name == name:
+                return group
+        return None
+
+
+def decode_tile_data(text, encoding=None, compression=None):
+    """
+    Декодирует содержимое <data> в array GID (флаги отражения снимаются).
+
+    Поддерживаются encoding="csv" и encoding="base64" без сжатия, с zlib
+    или gzip. Байты base64 попадают в array одним frombytes — без разбора
+    каждого числа в цикле на Python.
+    """
+    text = text or ""
+    if encoding == "csv":
+        parts = text.replace("\n", "").replace("\r", "").split(",")
+        gids = array(GID_TYPECODE, [int(part) for part in parts if part.strip()])
+    elif encoding == "base64":
+        raw = base64.b64decode(text.strip())
+        if compression == "zlib":
+            raw = zlib.decompress(raw)
+        elif compression == "gzip":
+            raw = gzip.decompress(raw)
+        elif compression:
+            raise TmxError(f"Неподдерживаемое сжатие слоя: {compression}")
+        if len(raw) % 4:
+            raise TmxError("Длина данных слоя не кратна 4 байтам")
+        gids = array(GID_TYPECODE)
+        gids.frombytes(raw)
+        # GID в TMX записаны little-endian
+        if sys.byteorder == "big":
+            gids.byteswap()
+    else:
+        raise TmxError(f"Неподдерживаемая кодировка слоя: {encoding}")
+
+    if gids and max(gids) > GID_MASK:
+        gids = array(GID_TYPECODE, [gid & GID_MASK for gid in gids])
+    return gids
+
+
+def _convert_property(value, prop_type):
+    if prop_type == "int":
+        return int(value)
+    if prop_type == "float":
+        return float(value)
+    if prop_type == "bool":
+        return value == "true"
+    return value
+
+
+def _int(attrib, key, default=0):
+    return int(attrib.get(key, default))
+
+
+def _float(attrib, key, default=0.0):
+    return float(attrib.get(key, default))
+
+
+def _load_external_tileset(tileset, source, base_dir):
+    """Дочитывает внешний .tsx (картинку и сетку) в уже созданный Tileset."""
+    root = ElementTree.parse(os.path.join(base_dir, source)).getroot()
+    attrib = root.attrib
+    tileset.name = attrib.get("name", tileset.name)
+    tileset.tilewidth = _int(attrib, "tilewidth", tileset.tilewidth)
+    tileset.tileheight = _int(attrib, "tileheight", tileset.tileheight)
+    tileset.tilecount = _int(attrib, "tilecount")
+    tileset.columns = _int(attrib, "columns")
+    tileset.margin = _int(attrib, "margin")
+    tileset.spacing = _int(attrib, "spacing")
+    image = root.find("image")
+    if image is not None:
+        tileset.image = image.get("source")
+        tileset.image_width = _int(image.attrib, "width")
+        tileset.image_height = _int(image.attrib, "height")
+
+
+def load_tmx(path):
+    """
+    Потоково разбирает .tmx через ElementTree.iterparse.
+
+    Уже обработанные элементы сразу очищаются, поэтому память не растёт
+    вместе с размером файла, а время загрузки линейно по числу тайлов.
+    """
+    base_dir = os.path.dirname(path)
+    tile_map = None
+    root = None
+    layer = None
+    chunked = None
+    data_attrib = None
+    xml_gids = None
+    group = None
+    # Стек словарей свойств для элементов, которые могут их иметь
+    properties_stack = []
+
+    for event, elem in ElementTree.iterparse(path, events=("start", "end")):
+        tag = elem.tag
+
+        if event == "start":
+            if tag in _PROPERTY_OWNERS:
+                properties_stack.append({})
+            if tag == "map":
+                root = elem
+                attrib = elem.attrib
+                tile_map = TileMap(
+                    _int(attrib, "width"),
+                    _int(attrib, "height"),
+                    _int(attrib, "tilewidth"),
+                    _int(attrib, "tileheight"),
+                    path=path,
+                )
+                tile_map.infinite = attrib.get("infinite") == "1"
+            elif tag == "layer":
+                layer = elem.attrib
+                chunked = None
+            elif tag == "data":
+                data_attrib = elem.attrib
+                xml_gids = array(GID_TYPECODE)
+            elif tag == "chunk":
+                xml_gids = array(GID_TYPECODE)
+            elif tag == "objectgroup":
+                group = ObjectGroup(elem.get("name", ""), _int(elem.attrib, "id"))
+            continue
+
+        # ---------- event == "end" ----------
+        if tag == "property":
+            value = elem.get("value")
+            if value is None:
+                value = elem.text or ""
+            properties_stack[-1][elem.get("name")] = _convert_property(value, elem.get("type"))
+            continue
+
+        properties = properties_stack.pop() if tag in _PROPERTY_OWNERS else None
+
+        if tag == "tile" and xml_gids is not None and data_attrib is not None:
+            # <data> без encoding: по элементу <tile gid="..."/> на клетку
+            xml_gids.append(_int(elem.attrib, "gid") & GID_MASK)
+        elif tag == "chunk":
+            # Бесконечная карта: слой приходит кусками со своими координатами
+            if chunked is None:
+                chunked = SparseTileLayer(layer.get("name", ""))
+            chunk_x, chunk_y = _int(elem.attrib, "x"), _int(elem.attrib, "y")
+            chunk_w = _int(elem.attrib, "width")
+            if data_attrib.get("encoding"):
+                gids = decode_tile_data(
+                    elem.text, data_attrib.get("encoding"), data_attrib.get("compression")
+                )
+            else:
+                gids = xml_gids
+            for index, gid in enumerate(gids):
+                if gid:
+                    chunked.set_gid(chunk_x + index % chunk_w, chunk_y + index // chunk_w, gid)
+            xml_gids = array(GID_TYPECODE)
+            elem.clear()
+        elif tag == "data" and chunked is not None:
+            data_attrib = None
+            xml_gids = None
+        elif tag == "data":
+            if data_attrib.get("encoding"):
+                gids = decode_tile_data(
+                    elem.text, data_attrib.get("encoding"), data_attrib.get("compression")
+                )
+            else:
+                gids = xml_gids
+            layer = dict(layer, _gids=gids)
+            data_attrib = None
+            xml_gids = None
+        elif tag == "layer" and chunked is not None:
+            chunked.id = _int(layer, "id")
+            chunked.visible = layer.get("visible", "1") != "0"
+            chunked.properties = properties
+            bounds = chunked.bounds()
+            if bounds:
+                chunked.width = bounds[2] - bounds[0]
+                chunked.height = bounds[3] - bounds[1]
+            tile_map.layers.append(chunked)
+            layer = chunked = None
+        elif tag == "layer":
+            width = _int(layer, "width", tile_map.width)
+            height = _int(layer, "height", tile_map.height)
+            gids = layer.get("_gids") or array(GID_TYPECODE, bytes(4 * width * height))
+            if len(gids) != width * height:
+                raise TmxError(
+                    f"Слой '{layer.get('name')}': {len(gids)} тайлов вместо {width * height}"
+                )
+            tile_layer = make_tile_layer(
+                layer.get("name", ""),
+                width,
+                height,
+                gids,
+                layer_id=_int(layer, "id"),
+                visible=layer.get("visible", "1") != "0",
+            )
+            tile_layer.properties = properties
+            tile_map.layers.append(tile_layer)
+            layer = None
+        elif tag == "tileset":
+            attrib = elem.attrib
+            tileset = Tileset(
+                _int(attrib, "firstgid", 1),
+                attrib.get("name", ""),
+                _int(attrib, "tilewidth", tile_map.tilewidth),
+                _int(attrib, "tileheight", tile_map.tileheight),
+                tilecount=_int(attrib, "tilecount"),
+                columns=_int(attrib, "columns"),
+                margin=_int(attrib, "margin"),
+                spacing=_int(attrib, "spacing"),
+            )
+            image = elem.find("image")
+            if image is not None:
+                tileset.image = image.get("source")
+                tileset.image_width = _int(image.attrib, "width")
+                tileset.image_height = _int(image.attrib, "height")
+            if attrib.get("source"):
+                _load_external_tileset(tileset, attrib["source"], base_dir)
+            tileset.properties = properties
+            tile_map.tilesets.append(tileset)
+        elif tag == "object" and group is not None:
+            attrib = elem.attrib
+            obj = MapObject(
+                _int(attrib, "id"),
+                attrib.get("name", ""),
+                # Tiled < 1.9 пишет type, новые версии — class
+                attrib.get("type") or attrib.get("class", ""),
+                _float(attrib, "x"),
+                _float(attrib, "y"),
+                _float(attrib, "width"),
+                _float(attrib, "height"),
+                gid=_int(attrib, "gid") & GID_MASK,
+            )
+            obj.properties = properties
+            group.objects.append(obj)
+        elif tag == "objectgroup":
+            group.properties = properties
+            tile_map.object_groups.append(group)
+            group = None
+        elif tag == "map":
+            tile_map.properties = properties
+
+        # Освобождаем разобранные дочерние элементы корня, чтобы не держать всё дерево
+        if root is not None and tag in ("layer", "objectgroup", "tileset"):
+            root.clear()
+
+    if tile_map is None:
+        raise TmxError(f"В файле нет элемента <map>: {path}")
+    if tile_map.infinite:
+        _fit_infinite_bounds(tile_map)
+    return tile_map
+
+
+def _fit_infinite_bounds(tile_map):
+    """Размер и начало бесконечной карты — по фактически заполненным клеткам."""
+    bounds = [b for b in (layer.bounds() for layer in tile_map.layers) if b]
+    if not bounds:
+        tile_map.width = tile_map.height = 0
+        return
+    left = min(b[0] for b in bounds)
+    top = min(b[1] for b in bounds)
+    tile_map.origin_col = left
+    tile_map.origin_row = top
+    tile_map.width = max(b[2] for b in bounds) - left
+    tile_map.height = max(b[3] for b in bounds) - top
@@ -1,29 +1,41 @@
 # game/enemies/saw.py
 import pygame
 from ..asset_loader import asset_loader
+from ..log import get_logger
+from ..sprite_sets import sprite_sets
+
+log = get_logger("traps")
+
+
+def draw_saw_placeholder(surface):
+    pygame.draw.circle(surface, (200, 200, 200), (25, 25), 20)
+
+
+def load_saw_frames():
+    """Кадры анимации пилы (один раз на все пилы)"""
+    try:
+        # Загружаем оба кадра анимации
+        frames = [
+            asset_loader.load_image("enemies/sawHalf.png", 1),
+            asset_loader.load_image("enemies/sawHalf_move.png", 1),
+        ]
+        log.info("✅ Загружено %s кадров анимации пилы", len(frames))
+    except FileNotFoundError as e:
+        log.error("❌ Ошибка загрузки спрайтов пилы: %s", e)
+        # Заглушка если спрайты не загрузились
+        fallback_surface = sprite_sets.placeholder(
+            (50, 50), (100, 100, 100), kind="saw", draw=draw_saw_placeholder
+        )
+        frames = [fallback_surface, fallback_surface]
+    return {"spin": frames}
 
 
 class Saw(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
 
-        # Загрузка анимации
-        self.animation_frames = []
-        try:
-            # Загружаем оба кадра анимации
-            frame1 = asset_loader.load_image("enemies/sawHalf.png", 1)
-            frame2 = asset_loader.load_image("enemies/sawHalf_move.png", 1)
-            self.animation_frames.append(frame1)
-            self.animation_frames.append(frame2)
-            print(f"✅ Загружено {len(self.animation_frames)} кадров анимации пилы")
-        except FileNotFoundError as e:
-            print(f"❌ Ошибка загрузки спрайтов пилы: {e}")
-            # Заглушка если спрайты не загрузились
-            fallback_surface = pygame.Surface((50, 50))
-            fallback_surface.fill((100, 100, 100))
-            pygame.draw.circle(fallback_surface, (200, 200, 200), (25, 25), 20)
-            self.animation_frames.append(fallback_surface)
-            self.animation_frames.append(fallback_surface)
+        # Общие на все пилы кадры анимации
+        self.animation_frames = sprite_sets.animation("saw", load_saw_frames).frames("spin")
 
         self.current_frame = 0
         self.image = self.animation_frames[self.current_frame]
@@ -55,7 +67,7 @@ class Saw(pygame.sprite.Sprite):
         # Хитбокс
         self.hitbox = pygame.Rect(10, 40, 30, 30)
         self.show_hitbox = True
-        print(f"🔄 Пила создана на позиции ({x}, {y})!")
+        log.debug("🔄 Пила создана на позиции (%s, %s)!", x, y)
 
     def update(self, dt, level):
         """Обновление пилы"""
@@ -70,7 +82,7 @@ class Saw(pygame.sprite.Sprite):
 
     def check_collision(self, player):
         """Проверка столкновения с игроком"""
-        if self.rect.colliderect(player.rect) and player.is_alive:
+        if self.rect.colliderect(player.world_hitbox) and player.is_alive:
             return True
         return False
 
@@ -1,6 +1,20 @@
 # game/traps/spikes.py
 import pygame
-from ..asset_loader import asset_loader
+from ..sprite_sets import sprite_sets
+
+
+def draw_spikes(surface):
+    """Рисует шипы на заглушке"""
+    width, height = surface.get_size()
+    spike_height = height // 2
+    for i in range(0, width, width // 4):
+        points = [
+            (i, height),
+            (i + width // 8, height - spike_height),
+            (i + width // 4, height)
+        ]
+        pygame.draw.polygon(surface, (200, 30, 30), points)
+
 
 class Spikes(pygame.sprite.Sprite):
     def __init__(self, x, y, width=128, height=128):
@@ -18,28 +32,19 @@ class Spikes(pygame.sprite.Sprite):
             height * spike_height_ratio  # Only bottom half
         )
 
-        # Загрузка спрайта
+        # Загрузка спрайта (одна картинка на все шипы этого размера)
         try:
-            self.image = asset_loader.load_image("tiles/spikes.png", scale=1)
-            self.image = pygame.transform.scale(self.image, (width, height))
+            self.image = sprite_sets.image("tiles/spikes.png", size=(width, height))
         except:
             # Заглушка
-            self.image = pygame.Surface((width, height))
-            self.image.fill((255, 50, 50))
-            # Рисуем шипы на заглушке
-            spike_height = height // 2
-            for i in range(0, width, width // 4):
-                points = [
-                    (i, height),
-                    (i + width // 8, height - spike_height),
-                    (i + width // 4, height)
-                ]
-                pygame.draw.polygon(self.image, (200, 30, 30), points)
+            self.image = sprite_sets.placeholder(
+                (width, height), (255, 50, 50), kind="spikes", draw=draw_spikes
+            )
 
     def check_collision(self, player):
         """Проверка столкновения с игроком"""
         # Use the more accurate collision rect
-        if self.collision_rect.colliderect(player.get_actual_hitbox()) and player.is_alive:
+        if self.collision_rect.colliderect(player.world_hitbox) and player.is_alive:
             return True
         return False
 
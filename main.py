@@ -13,7 +13,13 @@ from ui.hud import HUD
 from ui.credits import Credits
 from game.assets.audio import AudioManager
 from game.config import load_config
+from game.asset_loader import asset_loader
+from game.sprite_sets import sprite_sets
+from game.level_cache import DEFAULT_CACHE_DIR
 from game.path_utils import resource_path
+from game.timestep import FixedTimestep
+from game.profiling import profiler
+from game.log import setup_logging
 
 
 class RPGPlatformer:
@@ -21,6 +27,9 @@ class RPGPlatformer:
         pygame.init()
         # Настройки экрана
         self.config = load_config()
+        log_config = self.config.logging
+        setup_logging(log_config.level, log_config.levels, log_config.file, log_config.console)
+        asset_loader.set_cache_budget(self.config.assets.image_cache_mb * 1024 * 1024)
         self.SCREEN_WIDTH = self.config.video.width
         self.SCREEN_HEIGHT = self.config.video.height
         flags = 0
@@ -32,6 +41,12 @@ class RPGPlatformer:
         pygame.display.set_caption("2D PLATFORMER")
 
         self.clock = pygame.time.Clock()
+        # Фиксированный шаг симуляции: физика не зависит от частоты отрисовки
+        simulation = self.config.simulation
+        self.timestep = FixedTimestep(simulation.tick_rate, simulation.max_frame_time)
+        self.fps_limit = simulation.fps_limit
+        # Замеры фаз кадра нужны только отладочному оверлею
+        profiler.set_enabled(self.config.ui.debug_overlay)
         self.running = True
         self.state = "menu"  # menu, game, settings, credits
 
@@ -51,6 +66,8 @@ class RPGPlatformer:
 
         # ⏰ ДОБАВЛЕНО: Переменная для отслеживания времени игры
         self.game_start_time = 0
+        # Время симуляции с начала игры (сумма dt тиков)
+        self.game_time = 0.0
 
         # 🔄 НОВОЕ: Флаг для отслеживания активной игровой сессии
         self.has_active_game = False
@@ -66,10 +83,22 @@ class RPGPlatformer:
         # Музыка для игрового уровня
         self.audio.on_game_start("level1")
         self.game_start_time = pygame.time.get_ticks()
+        self.game_time = 0.0
 
         try:
             # 🔥 Сначала создаем уровень, потом игрока
-            self.level = Level("level1")
+            level_config = self.config.level
+            # Картинки прошлого уровня больше не нужны реестру
+            self.level = None
+            sprite_sets.clear()
+            self.level = Level(
+                "level1",
+                stream_radius=level_config.stream_radius,
+                stream_hysteresis=level_config.stream_hysteresis,
+                stream_min_tiles=level_config.stream_min_tiles,
+                batch_min_enemies=level_config.batch_min_enemies,
+                cache_dir=level_config.cache_dir or DEFAULT_CACHE_DIR,
+            )
 
             # Игрок создаётся и затем привязывается к уровню
             self.player = Player(0, 0)
@@ -102,6 +131,7 @@ class RPGPlatformer:
 
             # Reset clock to avoid huge dt on first frame after loading
             self.clock.tick()
+            self.timestep.reset()
 
             print("✅ Игра запущена!")
 
@@ -157,64 +187,79 @@ class RPGPlatformer:
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.go_to_menu()
 
-    def update(self):
-        dt = self.clock.get_time() / 1000.0  # Delta time в секундах
-        # Cap dt to prevent tunneling on lag spikes (e.g. asset loading)
-        dt = min(dt, 0.1)
+                # F3 → отладочный оверлей с профайлером
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.toggle_debug_overlay()
+
+    def toggle_debug_overlay(self):
+        """Включает/выключает оверлей и вместе с ним замеры фаз кадра"""
+        enabled = not profiler.enabled
+        profiler.set_enabled(enabled)
+        profiler.reset()
+        if self.hud:
+            self.hud.ui_config.debug_overlay = enabled
 
+    def update(self, dt):
+        """Один тик симуляции длиной dt (секунды)"""
         # Обновление в зависимости от состояния
         if self.state == "game" and self.player and self.level:
             # ⏰ ДОБАВЛЕНО: Получаем текущее время игры
-            current_time = (pygame.time.get_ticks() - self.game_start_time) / 1000.0
+            self.game_time += dt
+            current_time = self.game_time
 
             # 🔧 ВАЖНО: Обрабатываем непрерывный ввод клавиш
             keys = pygame.key.get_pressed()
-            # 🔥 ИСПРАВЛЕНИЕ: Передаем platforms в handle_keys
-            self.player.handle_keys(
-                keys, self.level.platforms
-            )  # 🔥 ДОБАВЛЕНО platforms
-
-            # 🔧 Обновляем игрока
-            self.player.update(
-                platforms=self.level.platforms,
-                enemies=self.level.enemies,
-                current_time=current_time,
-                traps=self.level.traps,
-            )
 
-            # Обновление уровня
-            self.level.update(dt)
+            # Игрок и уровень — одним тиком (тот же шаг, что в headless-режиме)
+            self.level.tick(keys, dt, current_time)
 
             # Обновление камеры
-            self.camera.update()
+            self.camera.update(dt)
 
-    def draw(self):
+    def draw(self, alpha=1.0):
         # Отрисовка в зависимости от состояния
         if self.state == "menu":
             self.menu.draw(self.screen)
         elif self.state == "credits":
             self.credits.draw(self.screen)
         elif self.state == "game":
-            # Отрисовка игры
-            self.level.draw(self.screen, self.camera)
-            self.player.draw(self.screen, self.camera)
-            self.hud.draw(self.screen)
-
-        pygame.display.flip()
+            # Отрисовка игры между прошлым и текущим тиком
+            self.camera.interpolate(alpha)
+            with profiler.section("level.draw"):
+                self.level.draw(self.screen, self.camera, alpha)
+            with profiler.section("player.draw"):
+                self.player.draw(self.screen, self.camera, alpha)
+            with profiler.section("hud.draw"):
+                self.hud.draw(self.screen)
+
+        with profiler.section("display.flip"):
+            pygame.display.flip()
 
     def run(self):
         # Сброс первого dt, чтобы избежать гигантского шага физики
-        self.clock.tick(60)
+        self.clock.tick(self.fps_limit)
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(60)
+            frame_time = self.clock.tick(self.fps_limit) / 1000.0
+            profiler.begin_frame()
+            with profiler.section("handle_events"):
+                self.handle_events()
+            if not self.running:
+                break
+            for _ in range(self.timestep.advance(frame_time)):
+                self.update(self.timestep.dt)
+            self.draw(self.timestep.alpha)
+            profiler.end_frame()
 
         pygame.quit()
         sys.exit()
 
 
 if __name__ == "__main__":
+    if "--headless" in sys.argv[1:]:
+        # Без окна и отрисовки: см. game/headless.py
+        from game.headless import main as headless_main
+
+        sys.exit(headless_main(sys.argv[1:]))
+
     game = RPGPlatformer()
     game.run()
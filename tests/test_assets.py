@@ -5,7 +5,7 @@ import pygame
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from game.asset_loader import asset_loader
+from game.asset_loader import AssetLoader, asset_loader, get_flipped
 
 class TestAssets(unittest.TestCase):
     def setUp(self):
@@ -42,5 +42,117 @@ class TestAssets(unittest.TestCase):
             print(f"{asset}: {'✅' if exists else '❌'} {full_path}")
             self.assertTrue(exists, f"Asset file should exist: {asset}")
 
+
+class TestTileLookup(unittest.TestCase):
+    """GID -> тайл: бинарный поиск по firstgid и общие subsurface без копий"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.loader = AssetLoader()
+        self.loader.load_tileset("Spritesheets/spritesheet_tiles.png", 289, 128, 128)
+        self.loader.load_tileset("Spritesheets/spritesheet_ground.png", 1, 128, 128)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_tile_is_shared_subsurface(self):
+        tile = self.loader.get_tile_image(25)
+        self.assertIs(tile, self.loader.get_tile_image(25))
+        self.assertEqual(tile.get_size(), (128, 128))
+
+        ground = self.loader.tilesets["Spritesheets/spritesheet_ground.png"]
+        self.assertIs(tile.get_parent(), ground["image"])
+        self.assertEqual(tile.get_offset(), (0, 3 * 128))
+
+    def test_gid_resolves_to_correct_tileset(self):
+        tiles = self.loader.tilesets["Spritesheets/spritesheet_tiles.png"]
+        tile = self.loader.get_tile_image(341)  # box: 289 + 52
+        self.assertIs(tile.get_parent(), tiles["image"])
+        self.assertEqual(tile.get_offset(), ((52 % 8) * 128, (52 // 8) * 128))
+
+    def test_missing_gid_returns_shared_stub(self):
+        stub = self.loader.get_tile_image(100000)
+        self.assertIs(stub, self.loader.get_tile_image(100001))
+
+
+class TestImageCache(unittest.TestCase):
+    """Кэш изображений: ключ с масштабом, LRU-бюджет и статистика"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.loader = AssetLoader()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_scale_is_part_of_cache_key(self):
+        small = self.loader.load_image("player/alienPink_stand.png", 0.5)
+        normal = self.loader.load_image("player/alienPink_stand.png", 1)
+        self.assertNotEqual(small.get_size(), normal.get_size())
+        self.assertIs(normal, self.loader.load_image("player/alienPink_stand.png", 1))
+
+    def test_flipped_variant_comes_from_get_flipped(self):
+        normal = self.loader.load_image("player/alienPink_stand.png")
+        flipped = get_flipped(normal)
+        self.assertIsNot(normal, flipped)
+        self.assertEqual(normal.get_size(), flipped.get_size())
+        self.assertIs(flipped, get_flipped(self.loader.load_image("player/alienPink_stand.png")))
+        # В бюджетном кэше только сама картинка
+        self.assertEqual(list(self.loader.assets), [("player/alienPink_stand.png", 1)])
+
+    def test_lru_eviction_respects_budget(self):
+        first = self.loader.load_image("player/alienPink_stand.png")
+        budget = int(self.loader.cache_bytes * 1.5)
+        self.loader.set_cache_budget(budget)
+
+        self.loader.load_image("player/alienPink_walk1.png")
+        self.assertLessEqual(self.loader.cache_bytes, budget)
+        self.assertEqual(self.loader.cache_evictions, 1)
+        self.assertNotIn(("player/alienPink_stand.png", 1), self.loader.assets)
+        # Выданная ранее поверхность остаётся рабочей
+        self.assertGreater(first.get_width(), 0)
+
+    def test_cache_stats(self):
+        self.loader.load_image("player/alienPink_stand.png")
+        self.loader.load_image("player/alienPink_stand.png")
+        stats = self.loader.cache_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(self.loader.resident_assets()[0][0], "player/alienPink_stand.png")
+
+    def test_clear_cache_resets_stats(self):
+        self.loader.set_cache_budget(1)
+        self.loader.load_image("player/alienPink_stand.png")
+        self.loader.load_image("player/alienPink_walk1.png")
+        self.loader.load_image("player/alienPink_walk1.png")
+        self.loader.clear_cache()
+
+        stats = self.loader.cache_stats()
+        self.assertEqual(
+            (stats["hits"], stats["misses"], stats["evictions"], stats["entries"], stats["resident_bytes"]),
+            (0, 0, 0, 0, 0),
+        )
+
+
+class TestFlippedVariants(unittest.TestCase):
+    """Отражённые спрайты строятся один раз и переиспользуются"""
+
+    def test_flipped_variant_is_shared(self):
+        sprite = pygame.Surface((4, 2))
+        sprite.fill((0, 0, 0))
+        sprite.set_at((0, 0), (255, 0, 0))
+
+        flipped = get_flipped(sprite)
+        self.assertIs(flipped, get_flipped(sprite))
+        self.assertEqual(flipped.get_at((3, 0))[:3], (255, 0, 0))
+        self.assertIsNot(get_flipped(sprite, False, True), flipped)
+        self.assertIs(get_flipped(sprite, False, False), sprite)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,153 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.chunk_streaming import ChunkStreamer
+from game.collision_map import SOLID
+from game.levels.level1 import Level
+
+
+class TestChunkStreamer(unittest.TestCase):
+    """Подгрузка чанков вокруг игрока с гистерезисом"""
+
+    def setUp(self):
+        self.events = []
+        self.streamer = ChunkStreamer(
+            100,
+            radius=1,
+            hysteresis=1,
+            on_load=lambda key: self.events.append(("load", key)),
+            on_unload=lambda key: self.events.append(("unload", key)),
+        )
+
+    def test_loads_square_around_player(self):
+        loaded, unloaded = self.streamer.update(150, 150)
+        self.assertEqual(len(loaded), 9)
+        self.assertEqual(unloaded, [])
+        self.assertIn((0, 0), self.streamer.loaded)
+        self.assertIn((2, 2), self.streamer.loaded)
+
+    def test_same_chunk_does_nothing(self):
+        self.streamer.update(150, 150)
+        self.events.clear()
+        self.assertEqual(self.streamer.update(199, 101), ([], []))
+        self.assertEqual(self.events, [])
+
+    def test_hysteresis_keeps_chunks_near_border(self):
+        self.streamer.update(150, 150)  # центр (1, 1)
+        self.streamer.update(250, 150)  # центр (2, 1): колонка 0 ещё в запасе
+        self.assertIn((0, 1), self.streamer.loaded)
+        self.assertFalse(any(event == "unload" for event, _ in self.events))
+
+        self.streamer.update(350, 150)  # центр (3, 1): колонка 0 дальше radius + hysteresis
+        self.assertNotIn((0, 1), self.streamer.loaded)
+        self.assertIn(("unload", (0, 1)), self.events)
+
+        # Обратно на шаг — колонка 1 всё ещё загружена, повторной загрузки нет
+        self.events.clear()
+        self.streamer.update(250, 150)
+        self.assertNotIn(("load", (1, 1)), self.events)
+
+    def test_bounds_limit_loaded_chunks(self):
+        self.streamer.bounds = (0, 0, 5, 5)
+        loaded, _ = self.streamer.update(10, 10)
+        self.assertEqual(sorted(loaded), [(0, 0), (0, 1), (1, 0), (1, 1)])
+
+
+class TestLevelStreaming(unittest.TestCase):
+    """Уровень в потоковом режиме создаёт спрайты только рядом с игроком"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        pygame.quit()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def make_player(self, x, y):
+        player = pygame.sprite.Sprite()
+        player.rect = pygame.Rect(x, y, 80, 100)
+        return player
+
+    def test_level1_streams_chunks_around_spawn(self):
+        full = Level("level1", cache_dir=None)
+        level = Level(
+            "level1", cache_dir=None, streaming=True, stream_radius=0, stream_hysteresis=0
+        )
+
+        # Спавн (0, 1152) — чанк (0, 1): колонки 0-7, строки 8-15
+        self.assertEqual(level.streamer.loaded, {(0, 1)})
+        in_chunk = [p for p in full.platforms if p.rect.x < 1024 and 1024 <= p.rect.y < 2048]
+        self.assertEqual(len(level.platforms), len(in_chunk))
+        self.assertLess(len(level.platforms), len(full.platforms))
+        # Карта коллизий заполнена целиком, а не только для загруженного чанка
+        self.assertEqual(bytes(level.collision_map.kinds), bytes(full.collision_map.kinds))
+
+        # Игрок уходит в правую часть карты: старый чанк выгружается
+        level.player = self.make_player(3000, 1200)
+        level.update(0)
+        self.assertEqual(level.streamer.loaded, {(2, 1)})
+        self.assertTrue(all(p.rect.x >= 2048 for p in level.platforms))
+
+    def test_collected_item_stays_collected_after_reload(self):
+        level = Level(
+            "level1", cache_dir=None, streaming=True, stream_radius=0, stream_hysteresis=0
+        )
+        level.player = self.make_player(100, 900)
+        level.update(0)
+        coins = [item for item in level.items if item.rect.y == 1024 - 128]
+        self.assertEqual(len(coins), 3)
+        coins[0].collect()
+
+        level.streamer.update(3000, 1200)
+        level.streamer.update(100, 900)
+
+        reloaded = [item for item in level.items if item.rect.y == 1024 - 128]
+        self.assertEqual(len(reloaded), 2)
+
+    def test_infinite_map_with_negative_coordinates(self):
+        path = os.path.join(self.tmp, "infinite.tmx")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(
+                """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" width="30" height="20" tilewidth="128" tileheight="128" infinite="1">
+ <tileset firstgid="1" name="spritesheet_ground" tilewidth="128" tileheight="128" tilecount="128" columns="8">
+  <image source="Spritesheets/spritesheet_ground.png" width="1024" height="2048"/>
+ </tileset>
+ <layer id="1" name="ground" width="30" height="20">
+  <data encoding="csv">
+   <chunk x="-16" y="0" width="16" height="1">
+1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1
+</chunk>
+   <chunk x="160" y="0" width="16" height="1">
+1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0
+</chunk>
+  </data>
+ </layer>
+ <objectgroup id="2" name="spawn">
+  <object id="1" type="player" gid="1" x="-512" y="0" width="128" height="128"/>
+ </objectgroup>
+</map>
+"""
+            )
+
+        level = Level("infinite", tmx_path=path, cache_dir=None, stream_radius=1)
+
+        self.assertTrue(level.streaming)
+        self.assertEqual(level.player_spawn_point, (-512, -128))
+        # Далёкий тайл в колонке 160 не создан, пока игрок рядом со спавном
+        self.assertEqual(len(level.platforms), 16)
+        self.assertEqual(level.collision_map.kind_at(-16, 0), SOLID)
+        self.assertEqual(level.collision_map.kind_at(160, 0), SOLID)
+
+
+if __name__ == "__main__":
+    unittest.main()
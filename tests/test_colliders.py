@@ -0,0 +1,173 @@
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.collision_map import BOX, HALF, SLOPE, SOLID, TileCollisionMap
+from game.colliders import Collider, merge_cells, sweep_step, sweep_y
+
+
+def areas(colliders):
+    return sorted((c.collision_kind, c.area) for c in colliders)
+
+
+class TestMergeCells(unittest.TestCase):
+    """Жадное слияние клеток карты коллизий в прямоугольники"""
+
+    def test_flat_floor_is_one_rectangle(self):
+        grid = TileCollisionMap(40, 10, 128)
+        for col in range(30):
+            grid.set_kind(col, 8, SOLID)
+            grid.set_kind(col, 9, SOLID)
+
+        colliders = merge_cells(grid)
+        self.assertEqual(areas(colliders), [(SOLID, (0, 8, 30, 2))])
+        self.assertEqual(colliders[0].rect, pygame.Rect(0, 1024, 30 * 128, 256))
+
+    def test_kinds_do_not_mix_and_half_rows_stay_separate(self):
+        grid = TileCollisionMap(10, 10, 128)
+        for col in range(4):
+            grid.set_kind(col, 2, HALF)
+            grid.set_kind(col, 3, HALF)
+        grid.set_kind(4, 2, SOLID)
+        grid.set_kind(5, 2, SLOPE)
+        grid.set_kind(6, 2, BOX)
+
+        colliders = merge_cells(grid)
+        self.assertEqual(
+            areas(colliders),
+            [(SOLID, (4, 2, 1, 1)), (HALF, (0, 2, 4, 1)), (HALF, (0, 3, 4, 1))],
+        )
+        half = next(c for c in colliders if c.area == (0, 2, 4, 1))
+        self.assertEqual(half.collision_rect, pygame.Rect(0, 256, 512, 64))
+        self.assertFalse(half.check_collision(pygame.Rect(10, 256 + 70, 20, 20)))
+
+    def test_cells_are_covered_exactly_once(self):
+        grid = TileCollisionMap(12, 8, 128, origin_col=-3, origin_row=2)
+        cells = {(-3, 5), (-2, 5), (-1, 5), (-2, 6), (-1, 6), (0, 6), (4, 2), (4, 3), (5, 9)}
+        for col, row in cells:
+            grid.set_kind(col, row, SOLID)
+
+        covered = []
+        for collider in merge_cells(grid):
+            col, row, cols, rows = collider.area
+            covered += [(c, r) for c in range(col, col + cols) for r in range(row, row + rows)]
+        self.assertEqual(sorted(covered), sorted(cells))
+
+    def test_area_limits_merge(self):
+        grid = TileCollisionMap(10, 4, 128)
+        for col in range(10):
+            grid.set_kind(col, 1, SOLID)
+
+        self.assertEqual(areas(merge_cells(grid, (2, 0, 3, 4))), [(SOLID, (2, 1, 3, 1))])
+        self.assertEqual(merge_cells(grid, (20, 0, 3, 4)), [])
+
+
+class TestSweep(unittest.TestCase):
+    """Непрерывная проверка вертикального шага"""
+
+    def setUp(self):
+        grid = TileCollisionMap(10, 10, 128)
+        for col in range(4):
+            grid.set_kind(col, 5, HALF)
+        grid.set_kind(6, 4, SLOPE)
+        self.half = merge_cells(grid)
+        self.box = pygame.Rect(100, 400, 60, 90)
+
+    def test_fall_stops_at_first_platform(self):
+        contact, hit = sweep_y(self.half, self.box, 500)
+        self.assertIs(hit, self.half[0])
+        self.assertEqual(contact, 640 - 490)
+        # Заход на пиксель внутрь: обычная проверка перекрытий поставит тело сверху
+        self.assertEqual(sweep_step(self.half, self.box, 500), 151)
+        self.assertEqual(sweep_step(self.half, self.box, 20), 20)
+
+    def test_rise_stops_under_half_tile(self):
+        box = pygame.Rect(100, 800, 60, 90)
+        contact, hit = sweep_y(self.half, box, -300)
+        self.assertIs(hit, self.half[0])
+        self.assertEqual(contact, 640 + 64 - 800)
+
+    def test_overlapped_and_side_platforms_are_ignored(self):
+        inside = pygame.Rect(100, 600, 60, 90)
+        self.assertEqual(sweep_y(self.half, inside, 500), (500, None))
+        beside = pygame.Rect(600, 400, 60, 90)
+        self.assertEqual(sweep_y(self.half, beside, 500), (500, None))
+
+    def test_spatial_group_and_slopes(self):
+        from game.spatial_hash import SpatialGroup
+
+        pygame.init()
+        try:
+            from game.platform import Platform
+
+            slope = Platform(6 * 128, 4 * 128, 128, 128, "triangle")
+        finally:
+            pygame.quit()
+        group = SpatialGroup(*self.half, slope, cell_size=128)
+
+        box = pygame.Rect(6 * 128, 0, 64, 90)
+        contact, hit = sweep_y(group, box, 1000)
+        self.assertIs(hit, slope)
+        # Склон под правым краем box на середине высоты тайла
+        self.assertEqual(contact, 5 * 128 - 64 - 90)
+        self.assertEqual(sweep_y(group, box.move(0, 700), -600), (-600, None))
+
+
+class TestLevelColliders(unittest.TestCase):
+    """Уровень проверяет коллизии по объединённым прямоугольникам"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_level1_has_fewer_colliders_than_tiles(self):
+        from game.levels.level1 import Level
+
+        level = Level("level1", cache_dir=None)
+        self.assertEqual(len(level.platforms), 76)
+        self.assertLess(len(level.colliders), 30)
+
+        # Склоны и ящики остаются отдельными платформами
+        for platform in level.platforms:
+            if platform.collision_kind in (SLOPE, BOX):
+                self.assertIn(platform, level.colliders)
+
+        # Каждая твёрдая точка платформы закрыта каким-нибудь коллайдером
+        for platform in level.platforms:
+            probe = pygame.Rect(platform.collision_rect.center, (2, 2))
+            self.assertTrue(
+                any(c.check_collision(probe) for c in level.colliders.query(probe)), platform.rect
+            )
+
+    def test_removed_tile_rebuilds_only_its_rectangle(self):
+        from game.levels.level1 import Level
+        from game.platform import Platform
+
+        level = Level("level1", cache_dir=None)
+        merged = max(
+            (c for c in level.colliders if isinstance(c, Collider)),
+            key=lambda c: c.area[2] * c.area[3],
+        )
+        others = set(level.colliders) - {merged}
+        col, row, cols, rows = merged.area
+        tile = next(p for p in level.platforms if p.rect.topleft == (col * 128 + 128, row * 128))
+        self.assertIsInstance(tile, Platform)
+
+        level.remove_platform(tile)
+
+        self.assertNotIn(merged, level.colliders)
+        self.assertTrue(others <= set(level.colliders))
+        rebuilt = set(level.colliders) - others
+        self.assertEqual(sum(c.area[2] * c.area[3] for c in rebuilt), cols * rows - 1)
+        self.assertFalse(any(c.contains_cell(col + 1, row) for c in rebuilt))
+
+
+if __name__ == "__main__":
+    unittest.main()
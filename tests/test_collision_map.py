@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.collision_map import (
+    BOX,
+    EMPTY,
+    HALF,
+    SLOPE,
+    SOLID,
+    TileCollisionMap,
+    collision_kind_for_type,
+)
+
+
+class TestCollisionKinds(unittest.TestCase):
+    def test_platform_types_map_to_kinds(self):
+        self.assertEqual(collision_kind_for_type("grass1"), SOLID)
+        self.assertEqual(collision_kind_for_type("grass_half"), SOLID)
+        self.assertEqual(collision_kind_for_type("semitype2"), HALF)
+        self.assertEqual(collision_kind_for_type("triangle"), SLOPE)
+        self.assertEqual(collision_kind_for_type("box"), BOX)
+
+
+class TestTileCollisionMap(unittest.TestCase):
+    """Тесты плотной карты коллизий"""
+
+    def setUp(self):
+        self.grid = TileCollisionMap(10, 8, tile_size=128)
+
+    def test_cell_queries(self):
+        self.grid.set_kind(2, 5, SOLID)
+        self.grid.set_kind(3, 5, HALF)
+
+        self.assertTrue(self.grid.is_solid(2, 5))
+        self.assertFalse(self.grid.is_solid(3, 5))
+        self.assertTrue(self.grid.is_collidable(3, 5))
+        self.assertEqual(self.grid.kind_at_point(2 * 128 + 5, 5 * 128 + 5), SOLID)
+        # За пределами карты — пусто
+        self.assertEqual(self.grid.kind_at(-1, 0), EMPTY)
+        self.assertEqual(self.grid.kind_at(100, 100), EMPTY)
+
+    def test_column_top_tracks_changes(self):
+        self.assertIsNone(self.grid.column_top(4))
+        self.grid.set_kind(4, 6, SOLID)
+        self.grid.set_kind(4, 3, BOX)
+        self.assertEqual(self.grid.column_top(4), 3 * 128)
+
+        self.grid.clear(4, 3)
+        self.assertEqual(self.grid.column_top(4), 6 * 128)
+
+    def test_ground_below(self):
+        self.grid.set_kind(1, 2, BOX)
+        self.grid.set_kind(1, 6, SOLID)
+
+        # Из-под ящика — ближайшая земля ниже
+        self.assertEqual(self.grid.ground_below(1 * 128 + 64, 3 * 128), 6 * 128)
+        # Сверху — сам ящик
+        self.assertEqual(self.grid.ground_below(1 * 128 + 64, 0), 2 * 128)
+        self.assertIsNone(self.grid.ground_below(5 * 128, 0))
+
+    def test_merge_keeps_more_solid_kind(self):
+        self.grid.merge_kind(0, 0, SOLID)
+        self.grid.merge_kind(0, 0, SLOPE)
+        self.assertEqual(self.grid.kind_at(0, 0), SOLID)
+
+    def test_cells_in_rect(self):
+        import pygame
+
+        self.grid.set_kind(0, 0, SOLID)
+        self.grid.set_kind(1, 0, SLOPE)
+        self.grid.set_kind(5, 5, SOLID)
+
+        cells = list(self.grid.cells_in_rect(pygame.Rect(0, 0, 256, 128)))
+        self.assertEqual(cells, [(0, 0, SOLID), (1, 0, SLOPE)])
+
+    def test_origin_offset_for_negative_cells(self):
+        """Сетка бесконечной карты может начинаться с отрицательной клетки"""
+        import pygame
+
+        grid = TileCollisionMap(4, 4, 128, origin_col=-2, origin_row=-1)
+        grid.set_kind(-2, 1, SOLID)
+        grid.set_kind(-2, -1, HALF)
+
+        self.assertEqual(grid.kind_at(-2, 1), SOLID)
+        self.assertEqual(grid.kind_at(-3, 1), EMPTY)
+        self.assertEqual(grid.column_top(-2), -128)
+        self.assertEqual(grid.ground_below(-2 * 128 + 10, -100), 128)
+        cells = list(grid.cells_in_rect(pygame.Rect(-256, -128, 128, 512)))
+        self.assertEqual(cells, [(-2, -1, HALF), (-2, 1, SOLID)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+import unittest
+import sys
+import os
+from collections import defaultdict
+from unittest import mock
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.collision_map import SOLID, TileCollisionMap
+from game.enemies import batch as batch_module
+from game.enemies.batch import NUMPY_AVAILABLE, EnemyBatch, EnemyGroup
+
+
+class FakeEnemy(pygame.sprite.Sprite):
+    """Минимальный патрулирующий враг: только то, что читает EnemyBatch."""
+
+    def __init__(self, x, y, speed=40, gravity=1500, patrol_mode="clamp", patrol=200):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, 40, 30)
+        self.velocity = pygame.math.Vector2(0, 0)
+        self.direction = 1
+        self.speed = speed
+        self.gravity = gravity
+        self.patrol_mode = patrol_mode
+        self.patrol_left = x - patrol
+        self.patrol_right = x + patrol
+        self.start_y = y
+        self.facing_right = False
+        self.is_dead = False
+
+
+class FakeLevel:
+    def __init__(self, width=40, height=10, ground_row=8):
+        self.collision_map = TileCollisionMap(width, height, 128)
+        for col in range(width):
+            self.collision_map.set_kind(col, ground_row, SOLID)
+        self.width = width * 128
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy не установлен")
+class TestEnemyBatch(unittest.TestCase):
+    """Векторная симуляция патруля"""
+
+    def setUp(self):
+        self.level = FakeLevel()
+        self.batch = EnemyBatch(capacity=2)
+        self.group = EnemyGroup(batch=self.batch)
+        self.everything = pygame.Rect(-10000, -10000, 20000, 20000)
+
+    def run_ticks(self, ticks, dt=1 / 60):
+        for _ in range(ticks):
+            self.batch.step(dt, self.level)
+        return self.batch.sync(self.everything)
+
+    def test_group_keeps_rows_in_sync(self):
+        enemies = [FakeEnemy(1000 + i * 100, 900) for i in range(5)]
+        self.group.add(*enemies)
+        self.assertEqual(len(self.batch), 5)
+
+        enemies[1].kill()
+        self.assertEqual(len(self.batch), 4)
+        self.assertNotIn(enemies[1], self.batch)
+        # На место удалённой строки переехала последняя — и осталась своей
+        self.assertEqual(self.batch.position(enemies[4]), (1400.0, 900.0))
+
+        self.group.empty()
+        self.assertEqual(len(self.batch), 0)
+
+    def test_enemy_lands_on_ground(self):
+        enemy = FakeEnemy(1000, 700)
+        self.group.add(enemy)
+        self.run_ticks(120)
+
+        self.assertEqual(enemy.rect.bottom, 8 * 128)
+        self.assertEqual(enemy.velocity.y, 0)
+
+    def test_fast_fall_does_not_skip_thin_ground(self):
+        # За тик враг пролетает больше клетки: дискретная проверка под низом
+        # увидела бы пустоту уже под землёй
+        self.level = FakeLevel(ground_row=8)
+        enemy = FakeEnemy(1000, 200)
+        self.group.add(enemy)
+        self.run_ticks(12, dt=0.25)
+
+        self.assertEqual(enemy.rect.bottom, 8 * 128)
+        self.assertEqual(enemy.velocity.y, 0)
+
+    def test_slow_enemy_is_not_truncated(self):
+        # 10 px/с при 240 тиках/с — меньше половины пикселя за тик
+        enemy = FakeEnemy(1000, 8 * 128 - 30, speed=10)
+        self.group.add(enemy)
+        self.run_ticks(240, dt=1 / 240)
+
+        x, _ = self.batch.position(enemy)
+        self.assertAlmostEqual(x, 1010.0, places=6)
+        self.assertEqual(enemy.rect.x, 1010)
+        self.assertTrue(enemy.facing_right)
+
+    def test_clamp_patrol_turns_at_bounds(self):
+        enemy = FakeEnemy(1000, 8 * 128 - 30, speed=60, patrol=30)
+        self.group.add(enemy)
+        self.run_ticks(40)
+
+        self.assertEqual(enemy.direction, -1)
+        self.assertLessEqual(enemy.rect.x, 1030)
+
+    def test_bounce_patrol_without_gravity(self):
+        enemy = FakeEnemy(1000, 300, speed=120, gravity=0, patrol_mode="bounce", patrol=50)
+        self.group.add(enemy)
+        self.run_ticks(30)
+
+        self.assertEqual(enemy.direction, -1)
+        self.assertEqual(enemy.rect.y, 300)
+
+    def test_wall_turns_enemy(self):
+        self.level.collision_map.set_kind(10, 7, SOLID)
+        enemy = FakeEnemy(10 * 128 - 60, 8 * 128 - 30, speed=120, patrol=500)
+        self.group.add(enemy)
+        self.run_ticks(30)
+
+        self.assertEqual(enemy.direction, -1)
+        self.assertLess(enemy.rect.right, 10 * 128 + 5)
+
+    def test_deactivated_enemy_stays_put(self):
+        enemy = FakeEnemy(1000, 8 * 128 - 30)
+        self.group.add(enemy)
+        self.batch.deactivate(enemy)
+        self.run_ticks(30)
+
+        self.assertEqual(enemy.rect.topleft, (1000, 8 * 128 - 30))
+
+    def test_sync_only_touches_enemies_in_rect(self):
+        near = FakeEnemy(1000, 8 * 128 - 30)
+        far = FakeEnemy(4000, 8 * 128 - 30)
+        self.group.add(near, far)
+        previous = {}
+        for _ in range(30):
+            self.batch.step(1 / 60, self.level)
+        synced = self.batch.sync(pygame.Rect(0, 0, 2000, 2000), previous)
+
+        self.assertEqual(synced, [near])
+        self.assertIn(near, previous)
+        self.assertEqual(far.rect.x, 4000)
+        self.assertGreater(self.batch.position(far)[0], 4000)
+
+    def test_level_steps_batched_enemies(self):
+        from game.levels.level1 import Level
+        from game.levels.synthetic import write_synthetic_level
+        from game.player import Player
+        import shutil
+        import tempfile
+
+        tmp = tempfile.mkdtemp()
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        try:
+            path = write_synthetic_level(
+                os.path.join(tmp, "patrol.tmx"), width=120, height=30,
+                slimes=40, snails=40, flies=40, saws=0, seed=4,
+            )
+            level = Level("patrol", tmx_path=path, cache_dir=None, batch_enemies=True)
+            player = Player(0, 0)
+            level.set_player(player)
+            for _ in range(120):
+                level.tick(defaultdict(bool), 1 / 60)
+        finally:
+            pygame.quit()
+            shutil.rmtree(tmp, ignore_errors=True)
+
+        self.assertEqual(len(level.enemies.batch), len(level.enemies))
+        self.assertEqual(len(level.enemies), 120)
+        # Все слаймы и улитки (и дальние, без синхронизации спрайта) стоят на земле
+        batch = level.enemies.batch
+        for enemy in level.enemies:
+            if getattr(enemy, "gravity", 0):
+                _, y = batch.position(enemy)
+                self.assertEqual((y + enemy.rect.height) % 128, 0)
+
+
+class TestEnemyBatchFallback(unittest.TestCase):
+    def test_level_falls_back_without_numpy(self):
+        from game.levels.level1 import Level
+
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        try:
+            with mock.patch("game.levels.level1.NUMPY_AVAILABLE", False):
+                level = Level("level1", cache_dir=None, batch_enemies=True)
+        finally:
+            pygame.quit()
+
+        self.assertIsNone(level.enemies.batch)
+        self.assertEqual(len(level.enemies), 3)
+
+    @unittest.skipIf(NUMPY_AVAILABLE, "numpy установлен")
+    def test_batch_requires_numpy(self):
+        self.assertIsNone(batch_module.np)
+        with self.assertRaises(ImportError):
+            EnemyBatch()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.headless import ScriptedInput, run_headless
+
+
+class TestScriptedInput(unittest.TestCase):
+    """Сценарий ввода для headless-режима"""
+
+    def test_parse_segments(self):
+        script = ScriptedInput.parse("right:3, right+jump:1, idle:2")
+        self.assertEqual(script.total_ticks, 6)
+        self.assertEqual(script.actions_at(0), {"right"})
+        self.assertEqual(script.actions_at(3), {"right", "jump"})
+        self.assertEqual(script.actions_at(4), set())
+        self.assertEqual(script.actions_at(100), set())
+
+    def test_keys_and_presses(self):
+        script = ScriptedInput.parse("left:2,left+jump:2")
+        self.assertTrue(script.keys_at(0)[pygame.K_LEFT])
+        self.assertFalse(script.keys_at(0)[pygame.K_RIGHT])
+        self.assertEqual(script.pressed_at(2), {"jump"})
+        self.assertEqual(script.pressed_at(3), set())
+
+    def test_loop(self):
+        script = ScriptedInput.parse("right:2,left:2", loop=True)
+        self.assertEqual(script.actions_at(5), {"right"})
+        self.assertEqual(script.actions_at(6), {"left"})
+
+    def test_unknown_action(self):
+        with self.assertRaises(ValueError):
+            ScriptedInput.parse("dash:10")
+
+
+class TestRunHeadless(unittest.TestCase):
+    """Полный цикл уровня без окна"""
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_scripted_run_is_deterministic(self):
+        script = ScriptedInput.parse("idle:30,right:120")
+        first = run_headless(ticks=150, script=script, level_kwargs={"cache_dir": None})
+        second = run_headless(ticks=150, script=script, level_kwargs={"cache_dir": None})
+
+        self.assertEqual(first["ticks"], 150)
+        self.assertGreater(first["ticks_per_second"], 0)
+        self.assertEqual(first["player"], second["player"])
+        # Игрок стартует в (0, 1152) и идёт вправо
+        self.assertGreater(first["player"][0], 0)
+        self.assertTrue(first["alive"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.collision_map import SOLID, TileCollisionMap
+from game.level_cache import (
+    DEFAULT_CACHE_DIR,
+    cache_path_for,
+    load_compiled,
+    source_digest,
+    write_compiled,
+)
+from game.levels.level1 import Level
+from game.tmx_loader import load_tmx
+
+LEVEL1_TMX = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "game", "assets", "levels", "level1.tmx"
+)
+
+
+class TestLevelCache(unittest.TestCase):
+    """Скомпилированный кэш уровня (.lvlc)"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.tmx_path = os.path.join(self.tmp, "level1.tmx")
+        shutil.copy(LEVEL1_TMX, self.tmx_path)
+        self.cache_dir = os.path.join(self.tmp, "cache")
+        self.tile_map = load_tmx(self.tmx_path)
+        self.collision_map = TileCollisionMap(self.tile_map.width, self.tile_map.height)
+        self.collision_map.set_kind(3, 10, SOLID)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_round_trip(self):
+        path = write_compiled(self.tmx_path, self.tile_map, self.collision_map, self.cache_dir)
+        self.assertTrue(os.path.exists(path))
+
+        compiled = load_compiled(self.tmx_path, self.cache_dir)
+        self.assertIsNotNone(compiled)
+        tile_map = compiled.tile_map
+
+        self.assertEqual((tile_map.width, tile_map.height), (30, 20))
+        self.assertEqual(
+            [(t.firstgid, t.image, t.margin) for t in tile_map.tilesets],
+            [(t.firstgid, t.image, t.margin) for t in self.tile_map.tilesets],
+        )
+        for cached, source in zip(tile_map.layers, self.tile_map.layers):
+            self.assertEqual(cached.name, source.name)
+            self.assertIs(type(cached), type(source))
+            self.assertEqual(list(cached.tiles()), list(source.tiles()))
+
+        objects = [(o.type, o.x, o.y, o.gid) for g in tile_map.object_groups for o in g.objects]
+        expected = [(o.type, o.x, o.y, o.gid) for g in self.tile_map.object_groups for o in g.objects]
+        self.assertEqual(objects, expected)
+
+        collision_map = TileCollisionMap(30, 20)
+        collision_map.load_kinds(compiled.collision_kinds)
+        self.assertEqual(collision_map.kind_at(3, 10), SOLID)
+        self.assertEqual(collision_map.column_top(3), 10 * 128)
+
+    def test_changed_tmx_invalidates_cache(self):
+        write_compiled(self.tmx_path, self.tile_map, self.collision_map, self.cache_dir)
+        with open(self.tmx_path, "a", encoding="utf-8") as f:
+            f.write("\n<!-- edited -->\n")
+
+        self.assertIsNone(load_compiled(self.tmx_path, self.cache_dir))
+
+    def test_changed_collision_mapping_invalidates_cache(self):
+        write_compiled(self.tmx_path, self.tile_map, self.collision_map, self.cache_dir, b"kinds-v1")
+
+        self.assertIsNotNone(load_compiled(self.tmx_path, self.cache_dir, b"kinds-v1"))
+        self.assertIsNone(load_compiled(self.tmx_path, self.cache_dir, b"kinds-v2"))
+
+    def test_rewrite_removes_only_own_stale_versions(self):
+        other_tmx = os.path.join(self.tmp, "level1.v2.tmx")
+        shutil.copy(self.tmx_path, other_tmx)
+        other = write_compiled(other_tmx, self.tile_map, self.collision_map, self.cache_dir)
+        old = write_compiled(self.tmx_path, self.tile_map, self.collision_map, self.cache_dir, b"kinds-v1")
+        new = write_compiled(self.tmx_path, self.tile_map, self.collision_map, self.cache_dir, b"kinds-v2")
+
+        self.assertFalse(os.path.exists(old))
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), sorted(map(os.path.basename, (new, other))))
+        self.assertIsNotNone(load_compiled(other_tmx, self.cache_dir))
+
+        # Перезапись level1.v2.tmx тоже не трогает кэш level1.tmx
+        write_compiled(other_tmx, self.tile_map, self.collision_map, self.cache_dir, b"kinds-v1")
+        self.assertTrue(os.path.exists(new))
+
+    def test_default_cache_dir_is_outside_source_tree(self):
+        # В сборке PyInstaller дерево исходников — временная папка распаковки
+        source_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.assertFalse(os.path.abspath(DEFAULT_CACHE_DIR).startswith(source_root + os.sep))
+        self.assertEqual(os.path.basename(DEFAULT_CACHE_DIR), "level_cache")
+
+    def test_corrupt_cache_is_ignored(self):
+        path = write_compiled(self.tmx_path, self.tile_map, self.collision_map, self.cache_dir)
+        with open(path, "r+b") as f:
+            f.truncate(100)
+
+        self.assertIsNone(load_compiled(self.tmx_path, self.cache_dir))
+
+    def test_level_uses_cache_on_second_load(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        try:
+            first = Level("level1", tmx_path=self.tmx_path, cache_dir=self.cache_dir)
+            second = Level("level1", tmx_path=self.tmx_path, cache_dir=self.cache_dir)
+        finally:
+            pygame.quit()
+
+        self.assertFalse(first.loaded_from_cache)
+        self.assertTrue(second.loaded_from_cache)
+        digest = source_digest(self.tmx_path, first.collision_fingerprint())
+        self.assertTrue(os.path.exists(cache_path_for(self.tmx_path, digest, self.cache_dir)))
+        self.assertEqual(len(second.platforms), len(first.platforms))
+        self.assertEqual(len(second.items), len(first.items))
+        self.assertEqual(second.player_spawn_point, first.player_spawn_point)
+        self.assertEqual(bytes(second.collision_map.kinds), bytes(first.collision_map.kinds))
+
+    def test_level_fingerprint_follows_gid_table(self):
+        class RetypedLevel(Level):
+            PLATFORM_TYPES_BY_GID = {**Level.PLATFORM_TYPES_BY_GID, 1: "semitype1"}
+
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        try:
+            Level("level1", tmx_path=self.tmx_path, cache_dir=self.cache_dir)
+            # Тот же TMX, но GID 1 теперь полублок: старые коллизии не годятся
+            retyped = RetypedLevel("level1", tmx_path=self.tmx_path, cache_dir=self.cache_dir)
+        finally:
+            pygame.quit()
+
+        self.assertFalse(retyped.loaded_from_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import contextlib
+import io
+import logging
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.log import get_logger, parse_level, setup_logging, shutdown_logging
+
+
+class Counted:
+    """Аргумент сообщения, считающий, сколько раз его превратили в строку."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "counted"
+
+
+class ThreadRecorder(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def emit(self, record):
+        self.threads.append(threading.current_thread())
+
+
+class TestGameLog(unittest.TestCase):
+    """Журнал с уровнями по подсистемам и фоновой записью"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "game.log")
+
+    def tearDown(self):
+        shutdown_logging()
+        logging.getLogger("game").setLevel(logging.NOTSET)
+        for name in ("enemies", "level"):
+            get_logger(name).setLevel(logging.NOTSET)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_disabled_messages_are_not_formatted(self):
+        setup_logging("WARNING", file=self.path, console=False)
+        arg = Counted()
+        get_logger("enemies").debug("💀 %s", arg)
+        shutdown_logging()
+
+        self.assertEqual(arg.formatted, 0)
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "")
+
+    def test_subsystem_levels_and_file_output(self):
+        setup_logging("WARNING", levels={"enemies": "debug"}, file=self.path, console=False)
+        get_logger("enemies").debug("слайм %s", 1)
+        get_logger("level").info("уровень %s", 2)
+        get_logger("level").warning("кэш %s", 3)
+        shutdown_logging()
+
+        with open(self.path, encoding="utf-8") as f:
+            text = f.read()
+        self.assertIn("game.enemies: слайм 1", text)
+        self.assertNotIn("уровень 2", text)
+        self.assertIn("WARNING game.level: кэш 3", text)
+
+    def test_records_are_written_by_background_thread(self):
+        listener = setup_logging("DEBUG", file=self.path, console=False)
+        recorder = ThreadRecorder()
+        listener.handlers = listener.handlers + (recorder,)
+        get_logger("enemies").debug("из игрового цикла")
+        shutdown_logging()
+
+        self.assertEqual(len(recorder.threads), 1)
+        self.assertIsNot(recorder.threads[0], threading.main_thread())
+
+    def test_parse_level(self):
+        self.assertEqual(parse_level("debug"), logging.DEBUG)
+        self.assertEqual(parse_level(logging.ERROR), logging.ERROR)
+        with self.assertRaises(ValueError):
+            parse_level("loud")
+
+    def test_dying_slime_does_not_print(self):
+        from game.enemies.slime import Slime
+
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        try:
+            slime = Slime(0, 0)
+            slime.die()
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                for _ in range(30):
+                    slime.update_state(1 / 60)
+        finally:
+            pygame.quit()
+
+        self.assertEqual(output.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
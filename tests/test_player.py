@@ -8,6 +8,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from game.player import Player
 from game.platform import Platform
+from game.spatial_hash import SpatialGroup
 
 
 class TestPlayer(unittest.TestCase):
@@ -72,6 +73,110 @@ class TestPlayer(unittest.TestCase):
         self.assertTrue(self.player.on_ground)
         self.assertEqual(self.player.velocity_y, 0)
 
+    def test_player_collision_with_spatial_group(self):
+        """Коллизии через пространственный индекс уровня работают как с полным списком"""
+        far_platforms = [Platform(5000 + i * 128, 360, 128, 128) for i in range(20)]
+        platforms = SpatialGroup(Platform(95, 360, 50, 20), *far_platforms, cell_size=128)
+
+        nearby = self.player.get_nearby_platforms(platforms)
+        self.assertEqual(len(nearby), 1)
+
+        self.player.rect.y = 300
+        for _ in range(10):
+            self.player.update(platforms, [], 0)
+
+        self.assertTrue(self.player.on_ground)
+        self.assertEqual(self.player.velocity_y, 0)
+
+    def test_world_hitbox_is_one_rect_moved_in_place(self):
+        """Хитбокс в мировых координатах не пересоздаётся на каждую проверку"""
+        hitbox = self.player.world_hitbox
+        self.assertEqual(hitbox, pygame.Rect(110, 310, 60, 90))
+
+        self.player.rect.x += 7
+        self.player.rect.bottom = 500
+        self.assertIs(self.player.world_hitbox, hitbox)
+        self.assertEqual(hitbox, pygame.Rect(117, 410, 60, 90))
+
+        # Внешним вызовам — копия: её изменение не трогает коллизии игрока
+        copy = self.player.get_actual_hitbox()
+        self.assertEqual(copy, hitbox)
+        copy.x += 500
+        self.assertEqual(self.player.world_hitbox, pygame.Rect(117, 410, 60, 90))
+
+        platforms = SpatialGroup(Platform(95, 520, 200, 20), cell_size=128)
+        area = self.player._query_area
+        for _ in range(10):
+            self.player.update(platforms, [], 0)
+        self.assertTrue(self.player.on_ground)
+        self.assertIs(self.player.world_hitbox, hitbox)
+        self.assertIs(self.player._query_area, area)
+        self.assertEqual(hitbox.bottom, 520)
+
+    def test_saw_hits_hitbox_not_sprite_rect(self):
+        """Пила, как и шипы, проверяет хитбокс игрока, а не его картинку"""
+        from game.traps.saw import Saw
+
+        saw = Saw(0, 0)
+        # Пила задевает только левый край rect (10 px вне хитбокса)
+        self.player.rect.x = saw.rect.right - 5
+        self.player.rect.y = saw.rect.y
+        self.assertTrue(saw.rect.colliderect(self.player.rect))
+        self.assertFalse(saw.check_collision(self.player))
+
+        self.player.rect.x = saw.rect.right - 15
+        self.assertTrue(saw.check_collision(self.player))
+
+    def test_trap_broadphase_uses_hitbox(self):
+        """Широкая фаза ловушек берёт тот же хитбокс, что проверяет пила"""
+        from game.traps.saw import Saw
+
+        saw = Saw(0, 0)
+        traps = SpatialGroup(saw, cell_size=128)
+        self.player.rect.topleft = (saw.rect.right - 5, saw.rect.y)
+        self.player.check_trap_collisions(traps, 0)
+        self.assertFalse(self.player.is_invincible)
+
+        self.player.rect.x = saw.rect.right - 15
+        self.player.check_trap_collisions(traps, 0)
+        self.assertTrue(self.player.is_invincible)
+        self.assertLess(self.player.health_component.current_health, self.player.health_component.max_health)
+
+    def test_fast_fall_lands_on_half_tile(self):
+        """При большом dt падение не проскакивает полублок"""
+        platforms = SpatialGroup(Platform(0, 1024, 512, 128, "semitype1"), cell_size=128)
+        self.player.rect.y = -2000
+        for _ in range(24):
+            self.player.update(platforms, [], 0, dt=0.25)
+
+        self.assertTrue(self.player.on_ground)
+        self.assertEqual(self.player.world_hitbox.bottom, 1024)
+
+    def test_walk_over_slope_to_ground_seam_never_drops(self):
+        """На стыке склона и земли игрок не проваливается (порядок кандидатов как у группы)"""
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.set_mode((1, 1))
+        from game.levels.level1 import Level
+
+        level = Level("level1", cache_dir=None)
+        level.set_player(self.player)
+        self.player.rect.topleft = (910, 1000)
+        keys = defaultdict(int)
+        keys[pygame.K_RIGHT] = 1
+
+        # Склон в клетке (9, 9), справа от него земля в строке 9
+        bottoms = []
+        for tick in range(100):
+            level.tick(keys, 1 / 60, tick / 60)
+            hitbox = self.player.world_hitbox
+            if 1150 <= hitbox.centerx <= 1430:
+                self.assertTrue(self.player.on_ground, hitbox)
+                bottoms.append(hitbox.bottom)
+
+        self.assertEqual(bottoms[-1], 9 * 128)
+        # Подъём по склону и шаг на землю — только вверх, без провалов
+        self.assertEqual(bottoms, sorted(bottoms, reverse=True))
+
     def test_player_input_handling(self):
         """Тест обработки ввода игрока"""
         # Создаем mock для keys, который ведёт себя как возврат pygame.key.get_pressed()
@@ -0,0 +1,155 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.pooling import ObjectPool, PoolRegistry
+
+
+class Thing:
+    def __init__(self, value):
+        self.value = value
+        self.resets = 0
+
+    def reset(self, value):
+        self.value = value
+        self.resets += 1
+
+
+class TestObjectPool(unittest.TestCase):
+    """Пулы объектов"""
+
+    def test_acquire_reuses_released_objects(self):
+        pool = ObjectPool(Thing)
+        first = pool.acquire(1)
+        self.assertTrue(pool.release(first))
+
+        again = pool.acquire(2)
+        self.assertIs(again, first)
+        self.assertEqual(again.value, 2)
+        self.assertEqual(again.resets, 1)
+        self.assertEqual((pool.created, pool.reused), (1, 1))
+
+    def test_double_release_is_ignored(self):
+        pool = ObjectPool(Thing)
+        thing = pool.acquire(1)
+        pool.release(thing)
+        self.assertFalse(pool.release(thing))
+        self.assertEqual(len(pool), 1)
+
+    def test_max_size_and_custom_reset(self):
+        pool = ObjectPool(Thing, reset=lambda obj, value: setattr(obj, "value", -value), max_size=1)
+        a, b = pool.acquire(1), pool.acquire(2)
+        self.assertTrue(pool.release(a))
+        self.assertFalse(pool.release(b))
+        self.assertEqual(pool.acquire(5).value, -5)
+
+    def test_prefill(self):
+        pool = ObjectPool(Thing)
+        pool.prefill(3, 0)
+        self.assertEqual(len(pool), 3)
+        pool.acquire(1)
+        self.assertEqual((pool.created, pool.reused), (3, 1))
+
+    def test_registry_routes_by_key(self):
+        pools = PoolRegistry()
+        pools.register("thing", Thing)
+        thing = pools.acquire("thing", 1)
+        self.assertEqual(thing.pool_key, "thing")
+        self.assertTrue(pools.release(thing))
+        self.assertFalse(pools.release(Thing(3)))
+        self.assertEqual(pools.stats()["thing"], (1, 0, 1))
+
+
+class TestLevelPools(unittest.TestCase):
+    """Респавн врагов и монеты из ящиков через пулы уровня"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        pygame.quit()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def kill_all(self, level):
+        for enemy in level.enemies:
+            enemy.is_dead = True
+            enemy.death_timer = 0
+        level.update(1 / 60)
+
+    def test_respawn_reuses_killed_enemies(self):
+        from game.levels.level1 import Level
+        from game.levels.synthetic import write_synthetic_level
+
+        path = write_synthetic_level(
+            os.path.join(self.tmp, "crowd.tmx"), width=200, height=30,
+            slimes=80, snails=60, flies=60, saws=0, seed=2,
+        )
+        level = Level("crowd", tmx_path=path, cache_dir=None, streaming=False,
+                      batch_enemies=False)
+        enemies = set(level.enemies)
+        self.assertEqual(len(enemies), 200)
+
+        # Без игрока уровень обновляет всех врагов — все доигрывают смерть
+        self.kill_all(level)
+        self.assertEqual(len(level.enemies), 0)
+        self.assertEqual(sum(free for _, _, free in level.pools.stats().values()), 200)
+
+        level.respawn_killed_enemies()
+        stats = level.pools.stats()
+        self.assertEqual(len(level.enemies), 200)
+        self.assertEqual(set(level.enemies), enemies)
+        self.assertEqual(sum(created for created, _, _ in stats.values()), 200)
+        self.assertEqual(sum(reused for _, reused, _ in stats.values()), 200)
+        for enemy in level.enemies:
+            self.assertFalse(enemy.is_dead)
+            self.assertEqual(enemy.health_component.current_health,
+                             enemy.health_component.max_health)
+
+    def test_streamed_enemy_respawns_from_pool(self):
+        from game.levels.level1 import Level
+
+        level = Level("level1", cache_dir=None, streaming=True)
+        self.assertEqual(len(level.enemies), 3)
+        self.kill_all(level)
+        self.assertEqual(len(level.enemies), 0)
+
+        level.respawn_killed_enemies()
+        self.assertEqual(len(level.enemies), 3)
+        self.assertEqual(level.pools.stats()["slime"][1], 1)
+        ids = {enemy.map_object_id for enemy in level.enemies}
+        self.assertEqual(len(ids), 3)
+
+    def test_box_coin_returns_to_pool_after_collection(self):
+        from game.collision_map import BOX
+        from game.levels.level1 import Level
+        from game.player import Player
+
+        level = Level("level1", cache_dir=None)
+        player = Player(0, 0)
+        level.set_player(player)
+        boxes = [p for p in level.platforms if p.collision_kind == BOX]
+        self.assertGreaterEqual(len(boxes), 2)
+
+        level.spawn_coin_from_box(boxes[0])
+        coin = next(i for i in level.items if getattr(i, "pool_key", None) == "coin")
+        player.rect.center = coin.rect.center
+        level.check_item_collection()
+        self.assertFalse(coin.alive())
+        self.assertEqual(player.coins, 1)
+
+        level.spawn_coin_from_box(boxes[1])
+        self.assertTrue(coin.alive())
+        self.assertFalse(coin.collected)
+        self.assertEqual(level.pools.stats()["coin"], (1, 1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import sys
+import os
+import time
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.profiling import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+    """Покадровые замеры фаз"""
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = Profiler(enabled=False)
+        profiler.begin_frame()
+        with profiler.section("level.draw"):
+            pass
+        profiler.count("blits", 5)
+        profiler.end_frame()
+
+        self.assertIs(profiler.section("a"), profiler.section("b"))
+        self.assertEqual(len(profiler.frame_times), 0)
+        self.assertEqual(profiler.phase_times, {})
+
+    def test_sections_sum_within_frame(self):
+        profiler = Profiler(enabled=True)
+        profiler.begin_frame()
+        for _ in range(2):
+            with profiler.section("level.update"):
+                time.sleep(0.002)
+        profiler.count("entities", 3)
+        profiler.count("entities", 4)
+        profiler.end_frame()
+
+        self.assertGreaterEqual(profiler.phase_times["level.update"][-1], 0.004)
+        self.assertGreaterEqual(profiler.frame_times[-1], profiler.phase_times["level.update"][-1])
+        self.assertEqual(profiler.last_count("entities"), 7)
+
+    def test_ring_buffer_keeps_history(self):
+        profiler = Profiler(history=5, enabled=True)
+        for frame in range(8):
+            profiler.begin_frame()
+            if frame == 7:
+                with profiler.section("hud.draw"):
+                    pass
+            profiler.end_frame()
+
+        self.assertEqual(len(profiler.frame_times), 5)
+        # Новая фаза появилась только в последнем кадре
+        self.assertEqual(len(profiler.phase_times["hud.draw"]), 1)
+
+    def test_timed_decorator(self):
+        profiler = Profiler(enabled=True)
+
+        @profiler.timed("work")
+        def work(value):
+            return value * 2
+
+        profiler.begin_frame()
+        self.assertEqual(work(21), 42)
+        profiler.end_frame()
+        self.assertIn("work", profiler.phase_times)
+
+        profiler.set_enabled(False)
+        self.assertEqual(work(1), 2)
+
+
+class TestProfilerOverlay(unittest.TestCase):
+    """График времени кадра в отладочном оверлее HUD"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        import game.profiling
+
+        game.profiling.profiler.set_enabled(False)
+        game.profiling.profiler.reset()
+        pygame.quit()
+
+    def test_overlay_draws_graph(self):
+        import game.profiling
+        from game.player import Player
+        from ui.hud import HUD
+
+        profiler = game.profiling.profiler
+        profiler.set_enabled(True)
+        for _ in range(10):
+            profiler.begin_frame()
+            with profiler.section("level.draw"):
+                pass
+            profiler.end_frame()
+
+        hud = HUD(Player(0, 0))
+        screen = pygame.Surface((800, 600))
+        hud._draw_debug_overlay(screen)
+
+        # График в правом нижнем углу: последние кадры — зелёная линия
+        graph = [screen.get_at((x, y)) for x in range(800 - 20, 800 - 10) for y in range(530, 590)]
+        self.assertTrue(any(color.g == 255 and color.r == 0 for color in graph))
+
+
+if __name__ == "__main__":
+    unittest.main()
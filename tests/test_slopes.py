@@ -0,0 +1,122 @@
+import random
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.collision_map import SLOPE, SOLID, TileCollisionMap
+from game.platform import Platform
+from game.slopes import SlopeHeightfield
+
+
+class TestSlopeHeightfield(unittest.TestCase):
+    """Ломаные склонов по строкам тайлов"""
+
+    def setUp(self):
+        self.grid = TileCollisionMap(10, 6, 128)
+        for col in (2, 3, 4):
+            self.grid.set_kind(col, 3, SLOPE)
+        self.grid.set_kind(5, 3, SOLID)
+        self.grid.set_kind(6, 2, SLOPE)
+        self.slopes = SlopeHeightfield.from_collision_map(self.grid)
+
+    def test_adjacent_tiles_merge_into_one_run(self):
+        runs = self.slopes.runs()
+        self.assertEqual(len(runs), 2)
+        self.assertIs(self.slopes.run_at(2, 3), self.slopes.run_at(4, 3))
+        self.assertEqual((runs[1].first_col, runs[1].last_col), (2, 4))
+        self.assertEqual(runs[1].points()[:3], [(256, 512), (384, 384), (384, 512)])
+
+    def test_surface_y_at_world_x(self):
+        self.assertEqual(self.slopes.surface_y(256, 3), 512)
+        self.assertEqual(self.slopes.surface_y(256 + 32, 3), 512 - 32)
+        self.assertEqual(self.slopes.surface_y(3 * 128 + 64, 3), 512 - 64)
+        self.assertIsNone(self.slopes.surface_y(5 * 128 + 10, 3))
+        self.assertIsNone(self.slopes.surface_y(256, 2))
+
+    def test_next_slope_right(self):
+        self.assertEqual(self.slopes.next_slope_right(2, 3), (3, 3))
+        self.assertIsNone(self.slopes.next_slope_right(4, 3))
+        # Склон на строку выше тоже продолжает подъём
+        self.assertEqual(self.slopes.next_slope_right(5, 3), (6, 2))
+
+    def test_add_and_remove_split_runs(self):
+        self.slopes.remove(3, 3)
+        self.assertEqual((self.slopes.run_at(2, 3).first_col, self.slopes.run_at(2, 3).last_col), (2, 2))
+        self.assertEqual((self.slopes.run_at(4, 3).first_col, self.slopes.run_at(4, 3).last_col), (4, 4))
+
+        self.slopes.add(3, 3)
+        self.assertIs(self.slopes.run_at(2, 3), self.slopes.run_at(4, 3))
+
+    def test_from_platforms_skips_unaligned_slopes(self):
+        pygame.init()
+        try:
+            platforms = [
+                Platform(0, 384, 128, 128, "triangle"),
+                Platform(128, 384, 128, 128, "triangle"),
+                Platform(300, 384, 128, 128, "triangle"),
+                Platform(512, 384, 128, 128, "grass1"),
+            ]
+        finally:
+            pygame.quit()
+        slopes = SlopeHeightfield.from_platforms(platforms)
+        self.assertEqual(len(slopes), 2)
+        self.assertIs(slopes.run_at(0, 3), slopes.run_at(1, 3))
+
+
+class TestTriangleCollision(unittest.TestCase):
+    def test_single_sample_matches_three_samples(self):
+        pygame.init()
+        try:
+            triangle = Platform(128, 384, 128, 128, "triangle")
+        finally:
+            pygame.quit()
+        tri = triangle.rect
+
+        def three_samples(rect):
+            if not tri.colliderect(rect):
+                return False
+            left = max(rect.left, tri.left - 1)
+            right = min(rect.right, tri.right + 1)
+            if left >= right:
+                return False
+            for x in (left, (left + right) * 0.5, right):
+                relative_x = max(0.0, min(1.0, (x - tri.left) / tri.width))
+                surface_y = tri.bottom - relative_x * tri.height
+                if rect.bottom >= surface_y - 2 and rect.top <= tri.bottom + 2:
+                    return True
+            return False
+
+        rng = random.Random(3)
+        for _ in range(2000):
+            rect = pygame.Rect(rng.randint(0, 300), rng.randint(250, 550),
+                               rng.randint(1, 90), rng.randint(1, 120))
+            self.assertEqual(triangle.check_collision(rect), three_samples(rect), rect)
+
+
+class TestLevelSlopes(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_level_shares_heightfield_with_player(self):
+        from game.levels.level1 import Level
+        from game.player import Player
+
+        level = Level("level1", cache_dir=None)
+        player = Player(0, 0)
+        level.set_player(player)
+
+        self.assertIs(player.slopes, level.slopes)
+        self.assertEqual(len(level.slopes), 1)
+        self.assertIsNotNone(level.slopes.run_at(9, 9))
+
+
+if __name__ == "__main__":
+    unittest.main()
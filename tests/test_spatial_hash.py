@@ -0,0 +1,385 @@
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.spatial_hash import ENEMY, ITEM, TRAP, TRIGGER, SpatialHash, SpatialGroup
+from game.camera import Camera
+
+
+def make_sprite(x, y, w=50, h=50):
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.Rect(x, y, w, h)
+    return sprite
+
+
+class TestSpatialHash(unittest.TestCase):
+    """Тесты пространственного индекса"""
+
+    def test_query_returns_only_nearby_objects(self):
+        index = SpatialHash(cell_size=128)
+        near = make_sprite(10, 10)
+        far = make_sprite(5000, 5000)
+        index.insert(near, near.rect)
+        index.insert(far, far.rect)
+
+        found = index.query(pygame.Rect(0, 0, 200, 200))
+        self.assertIn(near, found)
+        self.assertNotIn(far, found)
+
+    def test_object_spanning_cells_is_returned_once(self):
+        index = SpatialHash(cell_size=128)
+        wide = make_sprite(0, 0, 1000, 10)
+        index.insert(wide, wide.rect)
+
+        found = index.query(pygame.Rect(0, 0, 1000, 10))
+        self.assertEqual(found, [wide])
+
+    def test_update_moves_object_between_cells(self):
+        index = SpatialHash(cell_size=128)
+        sprite = make_sprite(0, 0)
+        index.insert(sprite, sprite.rect)
+
+        sprite.rect.x = 1000
+        index.update(sprite, sprite.rect)
+
+        self.assertEqual(index.query(pygame.Rect(0, 0, 100, 100)), [])
+        self.assertEqual(index.query(pygame.Rect(1000, 0, 100, 100)), [sprite])
+
+    def test_remove(self):
+        index = SpatialHash(cell_size=128)
+        sprite = make_sprite(0, 0)
+        index.insert(sprite, sprite.rect)
+        index.remove(sprite)
+        index.remove(sprite)  # повторное удаление не падает
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.query(pygame.Rect(0, 0, 100, 100)), [])
+
+    def test_ordered_query_follows_insertion_order(self):
+        index = SpatialHash(cell_size=128)
+        floor = make_sprite(0, 200, 400, 50)
+        wall = make_sprite(100, 0, 50, 250)
+        index.insert(floor, floor.rect)
+        index.insert(wall, wall.rect)
+
+        area = pygame.Rect(0, 0, 400, 400)
+        # Обход ячеек сверху вниз находит стену раньше пола
+        self.assertEqual(index.query(area), [wall, floor])
+        self.assertEqual(index.query(area, ordered=True), [floor, wall])
+
+        # Перемещение не меняет порядок добавления
+        wall.rect.y = 600
+        index.update(wall, wall.rect)
+        wall.rect.y = 0
+        index.update(wall, wall.rect)
+        self.assertEqual(index.query(area, ordered=True), [floor, wall])
+
+
+class TestSpatialGroup(unittest.TestCase):
+    """SpatialGroup должен синхронизировать индекс с группой"""
+
+    def test_kill_removes_sprite_from_index(self):
+        group = SpatialGroup()
+        sprite = make_sprite(0, 0)
+        group.add(sprite)
+        self.assertEqual(group.query(sprite.rect), [sprite])
+
+        sprite.kill()
+        self.assertEqual(group.query(sprite.rect), [])
+
+    def test_refresh_after_move(self):
+        group = SpatialGroup(make_sprite(0, 0))
+        sprite = group.sprites()[0]
+        sprite.rect.x = 2000
+        group.refresh(sprite)
+
+        self.assertEqual(group.query(pygame.Rect(2000, 0, 10, 10)), [sprite])
+
+
+class TestCategoryMasks(unittest.TestCase):
+    """Группы с общим индексом и запросы по маске категорий"""
+
+    def setUp(self):
+        self.index = SpatialHash(cell_size=128)
+        self.enemies = SpatialGroup(index=self.index, category=ENEMY)
+        self.items = SpatialGroup(index=self.index, category=ITEM)
+        self.traps = SpatialGroup(index=self.index, category=TRAP)
+        self.slime = make_sprite(10, 10)
+        self.coin = make_sprite(20, 20)
+        self.saw = make_sprite(30, 30)
+        self.enemies.add(self.slime)
+        self.items.add(self.coin)
+        self.traps.add(self.saw)
+        self.area = pygame.Rect(0, 0, 100, 100)
+
+    def test_group_query_sees_only_its_category(self):
+        self.assertEqual(self.enemies.query(self.area), [self.slime])
+        self.assertEqual(self.items.query(self.area), [self.coin])
+        self.assertEqual(len(self.index), 3)
+
+    def test_mask_query_combines_categories(self):
+        self.assertEqual(self.index.query(self.area, ENEMY | TRAP), [self.slime, self.saw])
+        self.assertEqual(self.index.query(self.area, TRIGGER), [])
+        self.assertEqual(len(self.index.query(self.area)), 3)
+
+    def test_moves_and_removal_keep_category(self):
+        self.slime.rect.x = 1000
+        self.enemies.refresh(self.slime)
+        self.assertEqual(self.index.query(pygame.Rect(1000, 0, 50, 50), ENEMY), [self.slime])
+
+        # Спрайт в двух группах общего индекса уходит из него только из последней
+        self.items.add(self.slime)
+        self.slime.remove(self.enemies)
+        self.assertEqual(self.items.query(pygame.Rect(1000, 0, 50, 50)), [self.slime])
+        self.assertEqual(self.enemies.query(pygame.Rect(1000, 0, 50, 50)), [])
+        self.slime.kill()
+        self.assertNotIn(self.slime, self.index)
+
+
+class TestCameraVisibleRect(unittest.TestCase):
+    def test_visible_rect_follows_offset(self):
+        class MockTarget:
+            def __init__(self):
+                self.rect = pygame.Rect(100, 100, 50, 50)
+
+        camera = Camera(MockTarget(), (800, 600))
+        camera.offset.x, camera.offset.y = 300, 200
+
+        self.assertEqual(camera.visible_rect(), pygame.Rect(300, 200, 800, 600))
+        self.assertEqual(camera.visible_rect(margin=10), pygame.Rect(290, 190, 820, 620))
+
+
+class TestEnemyBroadphase(unittest.TestCase):
+    """Level.check_enemy_collisions проверяет только платформы рядом с врагом"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_narrow_checks_only_near_enemy(self):
+        from game.levels.level1 import Level
+
+        level = Level("level1", cache_dir=None)
+        enemy = next(iter(level.enemies))
+        # Враг чуть провалился в платформу под собой
+        ground = next(p for p in level.platforms if p.has_collision and p.rect.width == 128)
+        enemy.rect.midbottom = (ground.rect.centerx, ground.rect.top + 5)
+        enemy.velocity.y = 100
+
+        self.assertTrue(level.check_enemy_collisions(enemy))
+        self.assertEqual(enemy.rect.bottom, ground.rect.top)
+        self.assertEqual(enemy.velocity.y, 0)
+        self.assertGreater(level.enemy_narrow_checks, 0)
+        self.assertLessEqual(level.enemy_narrow_checks, 4)
+        self.assertGreater(len(level.platforms), 50)
+
+    def test_enemy_in_open_air_skips_narrow_phase(self):
+        from game.levels.level1 import Level
+
+        level = Level("level1", cache_dir=None)
+        enemy = next(iter(level.enemies))
+        enemy.rect.topleft = (-1000, -1000)
+
+        self.assertFalse(level.check_enemy_collisions(enemy))
+        self.assertEqual(level.enemy_narrow_checks, 0)
+
+    def test_floor_and_wall_resolve_in_group_order(self):
+        from game.colliders import Collider
+        from game.collision_map import SOLID
+        from game.levels.level1 import Level
+        from game.platform import Platform
+
+        level = Level("level1", cache_dir=None)
+        enemy = next(iter(level.enemies))
+        level.colliders.empty()
+        floor = Collider(SOLID, 0, 8, 10, 1)
+        # Стена в строке ячеек выше пола: обход ячеек нашёл бы её первой
+        wall = Platform(400, 896, 128, 128)
+        level.colliders.add(floor, wall)
+
+        enemy.rect.bottomright = (410, floor.rect.top + 5)
+        enemy.velocity.update(40, 25)
+        enemy.direction = 1
+
+        # Как при полном обходе: первым разрешается пол, враг идёт дальше
+        self.assertTrue(level.check_enemy_collisions(enemy))
+        self.assertEqual(enemy.rect.bottom, floor.rect.top)
+        self.assertEqual(enemy.direction, 1)
+
+
+# Сценарии с фиксированным вводом и состояние на контрольных тиках,
+# записанное до перехода на широкую фазу (полный обход платформ):
+# (тик, позиция игрока, здоровье, позиции врагов). Позиции игрока в
+# свободном падении перезаписаны после перехода на точные pos_x/pos_y
+RECORDED_TRAJECTORIES = {
+    "right:300,left:200,right+jump:30,right:400,left:300,right:200": [
+        (300, (1405, 1054), 50, [("Fly", (2356, 1520)), ("Slime", (956, 1204)), ("Snail", (1960, 1204))]),
+        (600, (905, 1180), 30, [("Fly", (2387, 1520)), ("Slime", (739, 1204)), ("Snail", (1778, 1204))]),
+        (900, (1978, 1180), 20, [("Fly", (2619, 1520)), ("Slime", (1039, 1204)), ("Snail", (1701, 1204))]),
+    ],
+    "left:150,right:150,right+jump:20,left:100": [
+        (300, (490, 1180), 60, [("Fly", (2308, 1520)), ("Slime", (1037, 1204)), ("Snail", (1790, 1136))]),
+        (600, (-405, 3003), 0, [("Fly", (2308, 1520)), ("Slime", (940, 1204)), ("Snail", (1790, 1136))]),
+        (900, (-300, 2082), 60, [("Fly", (2308, 1520)), ("Slime", (714, 1204)), ("Snail", (1790, 1136))]),
+    ],
+}
+
+
+class TestEnemyTrajectory(unittest.TestCase):
+    """Широкая фаза не меняет, от какой платформы выталкивается враг"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def run_script(self, level, text, ticks, checkpoints=()):
+        from game.headless import ScriptedInput
+        from game.player import Player
+
+        script = ScriptedInput.parse(text, loop=True)
+        player = Player(0, 0)
+        level.set_player(player)
+        jump = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+        states = []
+        for tick in range(ticks):
+            if "jump" in script.pressed_at(tick):
+                player.handle_event(jump)
+            level.tick(script.keys_at(tick), 1 / 60, tick / 60)
+            if not checkpoints or tick + 1 in checkpoints:
+                enemies = sorted((type(e).__name__, e.rect.topleft) for e in level.enemies)
+                states.append((tick + 1, player.rect.topleft, player.health_component.current_health, enemies))
+        return states
+
+    def test_matches_recorded_trajectory(self):
+        from game.levels.level1 import Level
+
+        for text, expected in RECORDED_TRAJECTORIES.items():
+            with self.subTest(script=text):
+                level = Level("level1", cache_dir=None)
+                checkpoints = [state[0] for state in expected]
+                self.assertEqual(self.run_script(level, text, checkpoints[-1], checkpoints), expected)
+
+    def test_matches_full_scan(self):
+        from game.levels.level1 import Level
+
+        class FullScanLevel(Level):
+            # Прежняя проверка: обход всего набора коллизий в порядке группы
+            def check_enemy_collisions(self, enemy):
+                for platform in self.colliders:
+                    if platform.has_collision and self._resolve_enemy_platform(enemy, platform):
+                        return True
+                return False
+
+        for text in ("idle:1", *RECORDED_TRAJECTORIES):
+            with self.subTest(script=text):
+                expected = self.run_script(FullScanLevel("level1", cache_dir=None), text, 1500)
+                actual = self.run_script(Level("level1", cache_dir=None), text, 1500)
+                self.assertEqual(actual, expected)
+
+    def test_slime_patrol_on_flat_ground_unchanged_by_sweep(self):
+        from unittest import mock
+        from collections import defaultdict
+        from game.enemies.slime import Slime
+        from game.levels.level1 import Level
+        from game.player import Player
+
+        def patrol(level):
+            level.set_player(Player(0, 0))
+            slime = next(e for e in level.enemies if isinstance(e, Slime))
+            path = []
+            for tick in range(1500):
+                level.tick(defaultdict(bool), 1 / 60, tick / 60)
+                path.append((slime.rect.topleft, slime.direction))
+            return path
+
+        # Прежний шаг без свипа: move не видит коллизий уровня, слайм падает
+        # на полную скорость и выталкивается из пола в check_enemy_collisions
+        move = Slime.move
+        with mock.patch.object(Slime, "move", lambda slime, dt, level: move(slime, dt, None)):
+            expected = patrol(Level("level1", cache_dir=None))
+        actual = patrol(Level("level1", cache_dir=None))
+        self.assertEqual(actual, expected)
+        # После приземления слайм идёт по полу и разворачивается на краях патруля
+        landed = [pos[1] for pos, _ in actual].index(1204)
+        self.assertEqual({pos[1] for pos, _ in actual[landed:]}, {1204})
+        self.assertEqual({direction for _, direction in actual[landed:]}, {-1, 1})
+
+
+class TestLevelEntityIndex(unittest.TestCase):
+    """Враги, предметы, ловушки и триггеры уровня в одном индексе"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_level_groups_share_entity_index(self):
+        from game.levels.level1 import Level
+
+        level = Level("level1", cache_dir=None)
+        for group in (level.enemies, level.items, level.traps, level.triggers):
+            self.assertIs(group.index, level.entities)
+        self.assertEqual(
+            len(level.entities),
+            len(level.enemies) + len(level.items) + len(level.traps) + len(level.triggers),
+        )
+        lock = next(iter(level.triggers))
+        self.assertEqual(lock.decoration_type, "lock_yellow")
+        self.assertEqual(level.entities.query(lock.rect, TRIGGER), [lock])
+
+    def test_item_collection_visits_only_nearby_items(self):
+        from game.items.items import Item
+        from game.levels.level1 import Level
+        from game.player import Player
+
+        level = Level("level1", cache_dir=None)
+        player = Player(0, 0)
+        level.set_player(player)
+
+        level.items.add(*[Item(50000 + i * 128, 0, 64, 64, "coin") for i in range(2000)])
+        near = Item(player.rect.x, player.rect.y, 64, 64, "coin")
+        level.items.add(near)
+
+        coins = player.coins
+        level.check_item_collection()
+        self.assertTrue(near.collected)
+        self.assertEqual(player.coins, coins + 1)
+        # Широкая фаза отдаёт только монету рядом, а не 2000 дальних
+        self.assertEqual(level.items.query(player.rect), [near])
+
+    def test_falling_coin_outside_update_rect_keeps_falling(self):
+        from game.items.items import Item
+        from game.levels.level1 import Level
+        from game.player import Player
+
+        level = Level("level1", cache_dir=None)
+        level.set_player(Player(0, 0))
+        coin = Item(50000, 0, 64, 64, "coin", collectible_immediately=False)
+        coin.fall_to_ground_y = 1024
+        level.items.add(coin)
+        self.assertFalse(coin.rect.colliderect(level._compute_update_rect()))
+
+        for _ in range(120):
+            level.update(1 / 60)
+        self.assertEqual(coin.rect.bottom, 1024)
+        self.assertIsNone(coin.fall_to_ground_y)
+        # Индекс знает новое положение монеты
+        self.assertEqual(level.items.query(coin.rect), [coin])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.asset_loader import surface_bytes
+from game.sprite_sets import AnimationSet, SpriteSetRegistry, sprite_sets
+
+
+class FakeLoader:
+    """Загрузчик, считающий обращения: каждая загрузка — новая поверхность."""
+
+    def __init__(self):
+        self.loads = 0
+
+    def load_image(self, name, scale=1):
+        self.loads += 1
+        return pygame.Surface((64, 64), pygame.SRCALPHA)
+
+
+class TestSpriteSetRegistry(unittest.TestCase):
+    """Общие картинки и наборы анимаций"""
+
+    def setUp(self):
+        pygame.init()
+        self.loader = FakeLoader()
+        self.registry = SpriteSetRegistry(loader=self.loader)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_image_is_loaded_once_per_size(self):
+        first = self.registry.image("Hud/hudCoin.png", size=(128, 128))
+        again = self.registry.image("Hud/hudCoin.png", size=(128, 128))
+        small = self.registry.image("Hud/hudCoin.png", size=(32, 32))
+
+        self.assertIs(first, again)
+        self.assertEqual(first.get_size(), (128, 128))
+        self.assertEqual(small.get_size(), (32, 32))
+        self.assertEqual(self.loader.loads, 2)
+
+    def test_scaled_shares_copies_and_skips_same_size(self):
+        tile = pygame.Surface((128, 128))
+        self.assertIs(self.registry.scaled(tile, (128, 128)), tile)
+
+        half = self.registry.scaled(tile, (64, 64))
+        self.assertIs(self.registry.scaled(tile, (64, 64)), half)
+        self.assertEqual(half.get_size(), (64, 64))
+
+    def test_placeholder_is_shared_per_kind(self):
+        plain = self.registry.placeholder((40, 30), (1, 2, 3))
+        self.assertIs(self.registry.placeholder((40, 30), (1, 2, 3)), plain)
+        marked = self.registry.placeholder(
+            (40, 30), (1, 2, 3), kind="dot", draw=lambda s: s.set_at((0, 0), (9, 9, 9))
+        )
+        self.assertIsNot(marked, plain)
+        self.assertEqual(marked.get_at((0, 0))[:3], (9, 9, 9))
+
+    def test_animation_builds_once(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {"idle": [self.registry.placeholder((8, 8), (0, 0, 0))],
+                    "move": [pygame.Surface((8, 8)), pygame.Surface((8, 8))]}
+
+        frames = self.registry.animation("thing", build)
+        self.assertIs(self.registry.animation("thing", build), frames)
+        self.assertEqual(len(calls), 1)
+        self.assertIsInstance(frames, AnimationSet)
+        self.assertIs(frames.frame("move", 3), frames.frames("move")[1])
+        self.assertEqual(self.registry.stats()["surfaces"], 3)
+
+    def test_unused_images_are_not_kept(self):
+        coin = self.registry.image("Hud/hudCoin.png", size=(128, 128))
+        frames = self.registry.animation("thing", lambda: {"idle": [pygame.Surface((8, 8))]})
+        self.assertEqual(self.registry.stats()["surfaces"], 2)
+
+        # Реестр не держит картинки сам: их память — у спрайтов и LRU загрузчика
+        del coin, frames
+        self.assertEqual(self.registry.stats(), {"surfaces": 0, "bytes": 0, "animations": 0})
+        self.registry.image("Hud/hudCoin.png", size=(128, 128))
+        self.assertEqual(self.loader.loads, 2)
+
+
+class TestSharedGameSprites(unittest.TestCase):
+    """Враги, предметы и шипы держат ссылки на общие картинки"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_many_entities_share_images(self):
+        from game.items.items import Item
+        from game.traps.spikes import Spikes
+
+        spikes = [Spikes(i * 128, 0) for i in range(1000)]
+        coins = [Item(i * 128, 0, 128, 128, "coin") for i in range(1000)]
+
+        self.assertEqual(len({id(s.image) for s in spikes}), 1)
+        self.assertEqual(len({id(c.image) for c in coins}), 1)
+
+        # Раньше каждый экземпляр держал свою копию 128x128
+        per_instance = sum(surface_bytes(e.image) for e in spikes + coins)
+        shared = surface_bytes(spikes[0].image) + surface_bytes(coins[0].image)
+        self.assertLessEqual(shared * 100, per_instance)
+
+    def test_enemies_share_animation_sets(self):
+        from game.enemies.fly import Fly
+        from game.enemies.slime import Slime
+        from game.enemies.snail import Snail
+
+        slimes = [Slime(i * 50, 0) for i in range(3)]
+        snails = [Snail(i * 50, 0) for i in range(3)]
+        flies = [Fly(i * 50, 0) for i in range(3)]
+
+        for group in (slimes, snails, flies):
+            self.assertEqual(len({id(e.sprites) for e in group}), 1)
+        self.assertIs(slimes[0].move_sprite, slimes[1].move_sprite)
+        self.assertIs(flies[0].fly_frames, flies[2].fly_frames)
+
+        # Смерть и сброс меняют только ссылку на кадр общего набора
+        snails[0].die()
+        self.assertIs(snails[0].image, snails[1].sprites.frame("shell"))
+        snails[0].reset(0, 0)
+        self.assertIs(snails[0].image, snails[1].image)
+        self.assertGreaterEqual(sprite_sets.stats()["animations"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from collections import Counter, defaultdict
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.levels.level1 import Level
+from game.levels.synthetic import (
+    SLOPE_GID,
+    SyntheticLevelSpec,
+    generate_tmx,
+    write_synthetic_level,
+)
+from game.player import Player
+from game.tmx_loader import load_tmx
+
+
+class TestSyntheticLevel(unittest.TestCase):
+    """Генератор синтетических уровней"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def load(self, **params):
+        path = write_synthetic_level(os.path.join(self.tmp, "synthetic.tmx"), **params)
+        return path, load_tmx(path)
+
+    def test_same_seed_same_level(self):
+        self.assertEqual(generate_tmx(width=60, seed=5), generate_tmx(width=60, seed=5))
+        self.assertNotEqual(generate_tmx(width=60, seed=5), generate_tmx(width=60, seed=6))
+
+    def test_entity_counts_follow_spec(self):
+        spec = SyntheticLevelSpec(width=120, height=30, slimes=7, snails=5, flies=4,
+                                  saws=2, spikes=6, coins=11, rubies=2, boxes=3, seed=1)
+        _, tile_map = self.load(spec=spec)
+
+        self.assertEqual((tile_map.width, tile_map.height), (120, 30))
+        types = Counter(o.type for g in tile_map.object_groups for o in g.objects)
+        self.assertEqual(types["slime"], 7)
+        self.assertEqual(types["snail"], 5)
+        self.assertEqual(types["fly"], 4)
+        self.assertEqual(types["saw"], 2)
+        self.assertEqual(types["goldcoin"], 11)
+        self.assertEqual(types["box"], 3)
+        self.assertEqual(types["player"], 1)
+        self.assertEqual(tile_map.get_layer("traps").tile_count, 6)
+        self.assertEqual(tile_map.properties["synthetic.seed"], "1")
+
+    def test_slopes_stand_before_rises(self):
+        _, tile_map = self.load(width=200, height=30, slope_density=0.5, seed=2)
+        ground = tile_map.get_layer("ground")
+        slopes = list(tile_map.get_layer("triangleleft").tiles())
+
+        self.assertTrue(slopes)
+        for col, row, gid in slopes:
+            self.assertEqual(gid, SLOPE_GID)
+            # Справа от склона — земля на той же высоте, под склоном — земля
+            self.assertTrue(ground.gid_at(col + 1, row))
+            self.assertTrue(ground.gid_at(col, row + 1))
+
+    def test_no_slopes_when_density_is_zero(self):
+        _, tile_map = self.load(width=80, slope_density=0.0)
+        self.assertEqual(tile_map.get_layer("triangleleft").tile_count, 0)
+
+    def test_player_lands_on_large_streamed_level(self):
+        path, _ = self.load(width=1000, height=200, slimes=0, snails=0, flies=0, saws=0, seed=3)
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        try:
+            level = Level("synthetic", tmx_path=path, cache_dir=None)
+            player = Player(0, 0)
+            level.set_player(player)
+            for _ in range(120):
+                level.tick(defaultdict(bool), 1 / 60)
+        finally:
+            pygame.quit()
+
+        self.assertTrue(level.streaming)
+        # Карта глубже прежнего порога в 3000 px — игрок не должен «падать в пропасть»
+        self.assertGreater(player.fall_death_y, level.height)
+        self.assertTrue(player.is_alive)
+        self.assertTrue(player.on_ground)
+
+
+if __name__ == "__main__":
+    unittest.main()
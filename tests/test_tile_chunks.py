@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.tile_chunks import StaticLayerCache
+
+
+class MockCamera:
+    def __init__(self, x=0, y=0):
+        self.offset = pygame.math.Vector2(x, y)
+
+
+def make_tile(x, y, color, size=128):
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface((size, size), pygame.SRCALPHA)
+    sprite.image.fill(color)
+    sprite.rect = sprite.image.get_rect(topleft=(x, y))
+    return sprite
+
+
+class TestStaticLayerCache(unittest.TestCase):
+    """Тесты запекания статических слоёв в чанки"""
+
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_tiles_are_baked_per_chunk(self):
+        """Тайлы в одном чанке дают одну поверхность"""
+        cache = StaticLayerCache(chunk_tiles=8, tile_size=128)
+        for x in range(8):
+            cache.add(make_tile(x * 128, 0, (0, 255, 0)))
+        cache.add(make_tile(8 * 128, 0, (0, 0, 255)))
+        cache.build()
+
+        self.assertEqual(cache.chunk_count, 2)
+
+    def test_draw_blits_chunk_at_camera_offset(self):
+        """Чанк рисуется со смещением камеры"""
+        cache = StaticLayerCache(chunk_tiles=2, tile_size=128)
+        cache.add(make_tile(128, 128, (255, 0, 0)))
+        cache.build()
+
+        screen = pygame.Surface((400, 300))
+        cache.draw(screen, MockCamera(100, 100))
+
+        self.assertEqual(screen.get_at((30, 30))[:3], (255, 0, 0))
+        self.assertEqual(screen.get_at((5, 5))[:3], (0, 0, 0))
+
+    def test_remove_rebuilds_only_affected_chunk(self):
+        """Удаление тайла перестраивает чанк и стирает тайл с картинки"""
+        cache = StaticLayerCache(chunk_tiles=2, tile_size=128)
+        box = make_tile(0, 0, (200, 120, 0))
+        ground = make_tile(128, 0, (0, 200, 0))
+        far = make_tile(512, 0, (0, 0, 200))
+        for sprite in (box, ground, far):
+            cache.add(sprite)
+        cache.build()
+        far_surface = cache._surfaces[(2, 0)]
+
+        cache.remove(box)
+        screen = pygame.Surface((800, 256))
+        cache.draw(screen, MockCamera())
+
+        self.assertEqual(screen.get_at((10, 10))[:3], (0, 0, 0))
+        self.assertEqual(screen.get_at((140, 10))[:3], (0, 200, 0))
+        self.assertIs(cache._surfaces[(2, 0)], far_surface)
+
+    def test_higher_layer_drawn_on_top(self):
+        """Декорации (слой 1) рисуются поверх платформ (слой 0)"""
+        cache = StaticLayerCache(chunk_tiles=2, tile_size=128)
+        decoration = make_tile(0, 0, (255, 255, 255))
+        platform = make_tile(0, 0, (10, 10, 10))
+        cache.add(decoration, layer=1)
+        cache.add(platform, layer=0)
+        cache.build()
+
+        screen = pygame.Surface((256, 256))
+        cache.draw(screen, MockCamera())
+        self.assertEqual(screen.get_at((64, 64))[:3], (255, 255, 255))
+
+
+if __name__ == "__main__":
+    unittest.main()
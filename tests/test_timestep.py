@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+from collections import defaultdict
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.timestep import FixedTimestep, lerp_position
+from game.player import Player
+from game.platform import Platform
+from game.camera import Camera
+
+
+class TestFixedTimestep(unittest.TestCase):
+    """Аккумулятор фиксированного шага"""
+
+    def test_steps_do_not_depend_on_render_rate(self):
+        for fps in (30, 60, 144):
+            timestep = FixedTimestep(tick_rate=60)
+            for _ in range(fps):
+                timestep.advance(1.0 / fps)
+            self.assertEqual(timestep.ticks, 60, fps)
+
+    def test_alpha_is_leftover_fraction(self):
+        timestep = FixedTimestep(tick_rate=50)
+        self.assertEqual(timestep.advance(0.03), 1)
+        self.assertAlmostEqual(timestep.alpha, 0.5)
+
+    def test_long_frame_is_clamped(self):
+        timestep = FixedTimestep(tick_rate=60, max_frame_time=0.25)
+        self.assertEqual(timestep.advance(5.0), 15)
+
+    def test_lerp_position(self):
+        self.assertEqual(lerp_position((0, 0), (10, 20), 0.5), (5, 10))
+        self.assertEqual(lerp_position(None, (10, 20), 0.5), (10, 20))
+        self.assertEqual(lerp_position((0, 0), (10, 20), 1.0), (10, 20))
+
+
+class TestFixedStepSimulation(unittest.TestCase):
+    """Физика игрока одинакова при любой частоте отрисовки"""
+
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def simulate(self, fps, seconds=1.5):
+        player = Player(100, 100)
+        platforms = [Platform(0, 400, 2000, 50)]
+        camera = Camera(player, (800, 600))
+        keys = defaultdict(bool)
+        keys[pygame.K_RIGHT] = True
+        timestep = FixedTimestep(tick_rate=60)
+
+        for _ in range(int(fps * seconds)):
+            for _ in range(timestep.advance(1.0 / fps)):
+                player.store_previous_position()
+                player.handle_keys(keys, platforms, timestep.dt)
+                player.update(platforms, [], timestep.ticks * timestep.dt, dt=timestep.dt)
+                camera.update(timestep.dt)
+            camera.interpolate(timestep.alpha)
+        return timestep.ticks, player.rect.topleft, player.on_ground
+
+    def test_same_result_at_30_and_144_hz(self):
+        ticks_30, pos_30, ground_30 = self.simulate(30)
+        ticks_144, pos_144, ground_144 = self.simulate(144)
+
+        self.assertEqual(ticks_30, ticks_144)
+        self.assertEqual(pos_30, pos_144)
+        self.assertTrue(ground_30 and ground_144)
+
+    def test_motion_does_not_depend_on_tick_rate(self):
+        """Дробный шаг при 144 тиках в секунду не теряется при округлении rect"""
+        results = set()
+        for tick_rate in (60, 120, 144):
+            player = Player(100, 300)
+            platforms = [Platform(0, 400, 2000, 50)]
+            keys = defaultdict(bool)
+            keys[pygame.K_RIGHT] = True
+            for _ in range(tick_rate):  # одна секунда
+                player.handle_keys(keys, platforms, 1 / tick_rate)
+                player.update(platforms, [], 0, dt=1 / tick_rate)
+            self.assertTrue(player.on_ground, tick_rate)
+            results.add(player.rect.topleft)
+        self.assertEqual(results, {(400, 300)})
+
+    def test_timers_count_seconds(self):
+        player = Player(100, 100)
+        player.is_invincible = True
+        player.invincibility_timer = 0.5
+
+        for _ in range(16):  # чуть больше 0.5 с при 30 тиках в секунду
+            player.update([], [], 0, dt=1 / 30)
+        self.assertFalse(player.is_invincible)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+import unittest
+import sys
+import os
+import base64
+import gzip
+import struct
+import tempfile
+import zlib
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.tmx_loader import (
+    FLIPPED_HORIZONTALLY,
+    SparseTileLayer,
+    TileLayer,
+    TmxError,
+    decode_tile_data,
+    load_tmx,
+)
+from game.levels.level1 import Level
+
+LEVEL1_TMX = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "game", "assets", "levels", "level1.tmx"
+)
+
+SMALL_MAP = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" width="3" height="2" tilewidth="64" tileheight="64" infinite="0">
+ <properties>
+  <property name="music" value="level2"/>
+ </properties>
+ <tileset firstgid="1" name="ground" tilewidth="64" tileheight="64" tilecount="4" columns="2">
+  <image source="Spritesheets/ground.png" width="128" height="128"/>
+ </tileset>
+ <layer id="1" name="ground" width="3" height="2">
+  <properties>
+   <property name="kind" value="platform"/>
+  </properties>
+  <data encoding="csv">
+0,0,3,
+1,2,0
+</data>
+ </layer>
+ <layer id="2" name="empty" width="3" height="2">
+  <data>
+   <tile/><tile gid="4"/><tile/>
+   <tile/><tile/><tile/>
+  </data>
+ </layer>
+ <objectgroup id="3" name="spawn">
+  <object id="1" type="player" gid="1" x="10.5" y="128" width="64" height="64">
+   <properties>
+    <property name="lives" type="int" value="3"/>
+   </properties>
+  </object>
+  <object id="2" type="trigger" x="0" y="0" width="32" height="32"/>
+ </objectgroup>
+</map>
+"""
+
+INFINITE_MAP = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" width="30" height="20" tilewidth="128" tileheight="128" infinite="1">
+ <tileset firstgid="1" name="spritesheet_ground" tilewidth="128" tileheight="128" tilecount="128" columns="8">
+  <image source="Spritesheets/spritesheet_ground.png" width="1024" height="2048"/>
+ </tileset>
+ <layer id="1" name="ground" width="30" height="20">
+  <data encoding="csv">
+   <chunk x="-16" y="0" width="16" height="2">
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0
+</chunk>
+   <chunk x="0" y="0" width="16" height="2">
+1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,9
+</chunk>
+  </data>
+ </layer>
+ <objectgroup id="2" name="spawn">
+  <object id="1" type="player" gid="1" x="-128" y="0" width="128" height="128"/>
+  <object id="2" type="goldcoin" gid="158" x="128" y="-128" width="128" height="128"/>
+ </objectgroup>
+</map>
+"""
+
+
+def pack_gids(gids):
+    return struct.pack(f"<{len(gids)}I", *gids)
+
+
+class TestDecodeTileData(unittest.TestCase):
+    """Декодирование <data> во всех поддерживаемых кодировках"""
+
+    GIDS = [0, 1, 25, 410, 0, 128]
+
+    def test_csv(self):
+        text = "0,1,25,\n410,0,128\n"
+        self.assertEqual(list(decode_tile_data(text, "csv")), self.GIDS)
+
+    def test_base64_uncompressed(self):
+        text = base64.b64encode(pack_gids(self.GIDS)).decode()
+        self.assertEqual(list(decode_tile_data(text, "base64")), self.GIDS)
+
+    def test_base64_zlib(self):
+        text = base64.b64encode(zlib.compress(pack_gids(self.GIDS))).decode()
+        self.assertEqual(list(decode_tile_data(f"\n   {text}\n  ", "base64", "zlib")), self.GIDS)
+
+    def test_base64_gzip(self):
+        text = base64.b64encode(gzip.compress(pack_gids(self.GIDS))).decode()
+        self.assertEqual(list(decode_tile_data(text, "base64", "gzip")), self.GIDS)
+
+    def test_flip_flags_are_stripped(self):
+        text = base64.b64encode(pack_gids([25 | FLIPPED_HORIZONTALLY, 1])).decode()
+        self.assertEqual(list(decode_tile_data(text, "base64")), [25, 1])
+
+    def test_unsupported_compression(self):
+        with self.assertRaises(TmxError):
+            decode_tile_data("AAAA", "base64", "zstd")
+
+
+class TestLoadTmx(unittest.TestCase):
+    """Потоковый разбор .tmx"""
+
+    def test_level1_layers_and_objects(self):
+        tile_map = load_tmx(LEVEL1_TMX)
+
+        self.assertEqual((tile_map.width, tile_map.height), (30, 20))
+        self.assertEqual(tile_map.tilewidth, 128)
+        self.assertEqual([t.firstgid for t in tile_map.tilesets], [1, 129, 161, 289, 417, 522])
+        self.assertEqual(tile_map.tilesets[4].margin, 2)
+
+        ground = tile_map.get_layer("ground")
+        self.assertEqual(len(ground.gids), 30 * 20)
+        self.assertEqual(sum(1 for _ in ground.tiles()), 51)
+        self.assertEqual(tile_map.get_layer("triangleleft").gid_at(9, 9), 25)
+
+        enemies = tile_map.get_object_group("enemy").objects
+        self.assertEqual([o.type for o in enemies], ["slime", "snail", "saw", "fly"])
+        slime = enemies[0]
+        # У тайловых объектов y — нижний край
+        self.assertEqual((slime.x, slime.top), (898, 1268 - 128))
+
+    def test_small_map_csv_xml_and_properties(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "small.tmx")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(SMALL_MAP)
+            tile_map = load_tmx(path)
+
+        self.assertEqual(tile_map.properties, {"music": "level2"})
+        ground, empty = tile_map.layers
+        self.assertEqual(list(ground.tiles()), [(2, 0, 3), (0, 1, 1), (1, 1, 2)])
+        self.assertEqual(ground.properties, {"kind": "platform"})
+        self.assertEqual(list(empty.tiles()), [(1, 0, 4)])
+
+        player, trigger = tile_map.get_object_group("spawn").objects
+        self.assertEqual(player.properties, {"lives": 3})
+        self.assertEqual((player.x, player.top), (10.5, 64))
+        # У прямоугольных объектов (без gid) y — верхний край
+        self.assertEqual(trigger.top, 0)
+
+    def test_infinite_map_chunks_are_sparse(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "infinite.tmx")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(INFINITE_MAP)
+            tile_map = load_tmx(path)
+
+        self.assertTrue(tile_map.infinite)
+        ground = tile_map.get_layer("ground")
+        self.assertIsInstance(ground, SparseTileLayer)
+        self.assertEqual(list(ground.tiles()), [(-1, 0, 1), (0, 0, 1), (1, 0, 1), (15, 1, 9)])
+        self.assertEqual((tile_map.origin_col, tile_map.origin_row), (-1, 0))
+        self.assertEqual((tile_map.width, tile_map.height), (17, 2))
+        self.assertEqual(sorted(ground.tiles_in_rect(-1, 0, 1, 1)), [(-1, 0, 1), (0, 0, 1)])
+
+    def test_nearly_empty_layer_is_sparse(self):
+        tile_map = load_tmx(LEVEL1_TMX)
+        # 51 тайл из 600 — плотный массив, 1 тайл из 600 — разреженный словарь
+        self.assertIsInstance(tile_map.get_layer("ground"), TileLayer)
+        triangle = tile_map.get_layer("triangleleft")
+        self.assertIsInstance(triangle, SparseTileLayer)
+        self.assertEqual(triangle.tile_count, 1)
+        self.assertEqual(triangle.gid_at(9, 9), 25)
+
+    def test_wrong_tile_count_raises(self):
+        broken = SMALL_MAP.replace("0,0,3,\n1,2,0", "0,0,3")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "broken.tmx")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(broken)
+            with self.assertRaises(TmxError):
+                load_tmx(path)
+
+
+class TestLevelFromTmx(unittest.TestCase):
+    """Уровень строит слои и объекты из файла, а не из зашитых данных"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_level1_contents(self):
+        level = Level("level1", cache_dir=None)
+
+        self.assertEqual((level.width, level.height), (30 * 128, 20 * 128))
+        # 51 ground + 1 triangleleft + 22 semiground + 2 ящика
+        self.assertEqual(len(level.platforms), 76)
+        self.assertEqual(len(level.decorations), 8)
+        self.assertEqual(len(level.traps), 8)  # 7 шипов + пила
+        self.assertEqual(len(level.enemies), 3)
+        self.assertEqual(len(level.items), 9)
+        self.assertEqual(level.player_spawn_point, (0, 1280 - 128))
+        self.assertEqual(
+            [data[:2] for data in level.initial_enemy_data],
+            [(898, 1140), (1790, 1136), (2684, 1660), (2308, 1520)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,20 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 from game.config import load_config
+from game.profiling import profiler
+
+# Фазы кадра в отладочном оверлее (имена секций профайлера)
+DEBUG_PHASES = (
+    "handle_events",
+    "player.update",
+    "level.update",
+    "level.draw",
+    "player.draw",
+    "hud.draw",
+    "display.flip",
+)
+DEBUG_GRAPH_HEIGHT = 60
+DEBUG_FRAME_BUDGET = 1 / 60
 
 
 class HUD:
@@ -30,6 +44,8 @@ class HUD:
 
         # Шрифт для счетчика монет
         self.coin_font = pygame.font.Font(None, 32)
+        # Шрифт отладочного оверлея
+        self.debug_font = pygame.font.Font(None, 24)
 
         print("🎯 HUD с сердцами, ключами и монетами инициализирован")
 
@@ -249,13 +265,28 @@ class HUD:
         screen.blit(text_surface, (text_x, text_y))
 
     def _draw_debug_overlay(self, screen):
-        """Отрисовка простой отладочной информации (координаты игрока)."""
+        """
+        Отладочный оверлей: координаты игрока, график времени кадра,
+        разбивка по фазам и счётчики сущностей/blit-ов из профайлера.
+        """
         try:
-            small_font = pygame.font.Font(None, 24)
+            small_font = self.debug_font
+
             x, y = self.player.rect.center
-            lines = [
-                f"Player: ({x}, {y})",
-            ]
+            lines = [f"Player: ({x}, {y})"]
+
+            if profiler.enabled and profiler.frame_times:
+                frame_ms = profiler.average_frame() * 1000
+                lines.append(f"Frame: {frame_ms:.2f} ms")
+                for phase in DEBUG_PHASES:
+                    lines.append(f"  {phase}: {profiler.average(phase) * 1000:.2f} ms")
+                lines.append(
+                    f"Entities: {profiler.last_count('entities')}  "
+                    f"Blits: {profiler.last_count('blits')}"
+                )
+                lines.append(f"Enemy checks: {profiler.last_count('enemy_checks')}")
+                self._draw_frame_graph(screen)
+
             y_pos = screen.get_height() - 10 - 20 * len(lines)
             for line in lines:
                 text = small_font.render(line, True, (0, 255, 0))
@@ -263,3 +294,27 @@ class HUD:
                 y_pos += 20
         except Exception as e:
             print(f"HUD debug overlay error: {e}")
+
+    def _draw_frame_graph(self, screen):
+        """График времени кадра за историю профайлера (линия 16.7 мс = 60 FPS)."""
+        samples = profiler.frame_times
+        width, height = profiler.history, DEBUG_GRAPH_HEIGHT
+        left = screen.get_width() - width - 10
+        top = screen.get_height() - height - 10
+
+        background = pygame.Surface((width, height), pygame.SRCALPHA)
+        background.fill((0, 0, 0, 160))
+        screen.blit(background, (left, top))
+
+        # Шкала: 2 кадра по 60 FPS на всю высоту графика
+        scale = height / (2 * DEBUG_FRAME_BUDGET)
+        budget_y = top + height - int(DEBUG_FRAME_BUDGET * scale)
+        pygame.draw.line(screen, (255, 255, 0), (left, budget_y), (left + width - 1, budget_y))
+
+        points = []
+        start = left + width - len(samples)
+        for i, frame_time in enumerate(samples):
+            bar = min(height - 1, int(frame_time * scale))
+            points.append((start + i, top + height - 1 - bar))
+        if len(points) > 1:
+            pygame.draw.lines(screen, (0, 255, 0), False, points)